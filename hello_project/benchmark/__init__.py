@@ -0,0 +1,6 @@
+"""Local upstream stand-in and plugin throughput benchmark"""
+
+from .runner import format_report, run_benchmark
+from .server import StandinServer
+
+__all__ = ["StandinServer", "format_report", "run_benchmark"]
@@ -0,0 +1,7 @@
+"""Entry point for python -m hello_project.benchmark"""
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
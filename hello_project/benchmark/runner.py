@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+HTTP throughput benchmark of the network-backed plugins
+"""
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ..plugins import PluginManager
+from ..plugins.http_client import HTTPConfig
+from .server import StandinServer
+
+BENCHMARK_PLUGINS = ("weather", "quote")
+
+
+def plugin_config(
+    plugin: str, server: StandinServer, cache: bool = False
+) -> Dict[str, Any]:
+    """Build a plugin config that sends real-mode requests to the stand-in
+
+    Args:
+        plugin: Plugin name (weather, quote)
+        server: Running stand-in server
+        cache: Keep PluginManager result caching enabled
+
+    Returns:
+        Plugin configuration
+    """
+    if plugin == "weather":
+        config: Dict[str, Any] = {
+            "use_mock": False,
+            "api_key": "benchmark",
+            "base_url": server.weather_base_url,
+            "disk_cache": False,
+        }
+    elif plugin == "quote":
+        config = {"use_api": True, "base_url": server.quote_base_url}
+    else:
+        raise ValueError(f"Unknown benchmark plugin: {plugin}")
+
+    if not cache:
+        config["cache"] = False
+    return config
+
+
+def run_benchmark(
+    server: StandinServer,
+    plugin: str = "weather",
+    requests: int = 1000,
+    concurrency: int = 16,
+    cities: int = 100,
+    cache: bool = False,
+) -> Dict[str, Any]:
+    """Drive plugin calls through PluginManager against a stand-in server
+
+    Args:
+        server: Running stand-in server
+        plugin: Plugin to benchmark (weather, quote)
+        requests: Number of plugin calls
+        concurrency: Concurrent callers, also the HTTP pool size
+        cities: Distinct cities cycled through by weather calls
+        cache: Keep PluginManager result caching enabled
+
+    Returns:
+        Throughput, error count, upstream request count and latency
+        percentiles in milliseconds
+    """
+    from ..plugins.quote import QuotePlugin
+    from ..plugins.weather import WeatherPlugin
+
+    plugin_class = WeatherPlugin if plugin == "weather" else QuotePlugin
+    contexts = [{"city": f"city-{i % cities}"} for i in range(requests)]
+
+    with PluginManager(
+        collect_stats=True, http_config=HTTPConfig(pool_size=concurrency)
+    ) as manager:
+        manager.register_plugin(plugin_class(plugin_config(plugin, server, cache)))
+
+        upstream_before = server.requests
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(
+                executor.map(lambda c: manager.execute_plugin(plugin, c), contexts)
+            )
+        elapsed = time.perf_counter() - started
+        stats = manager.get_stats()[plugin]
+
+    return {
+        "plugin": plugin,
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(requests / elapsed, 1) if elapsed else 0.0,
+        "errors": sum(not result.success for result in results),
+        "upstream_requests": server.requests - upstream_before,
+        "latency_ms": stats["latency_ms"],
+    }
+
+
+def format_report(report: Dict[str, Any], output_format: str = "text") -> str:
+    """Format a benchmark report for display
+
+    Args:
+        report: Result of run_benchmark
+        output_format: Output format (text, json)
+
+    Returns:
+        Formatted report
+    """
+    if output_format == "json":
+        return json.dumps(report, indent=2)
+
+    latency = report["latency_ms"]
+    return "\n".join(
+        [
+            f"Benchmark: {report['plugin']} ({report['requests']} calls, "
+            f"concurrency {report['concurrency']})",
+            f"  throughput: {report['requests_per_second']:.1f} calls/s "
+            f"in {report['seconds']:.2f}s",
+            f"  errors: {report['errors']}, "
+            f"upstream requests: {report['upstream_requests']}",
+            f"  latency ms: p50 {latency['p50']:.2f}  p90 {latency['p90']:.2f}  "
+            f"p99 {latency['p99']:.2f}  max {latency['max']:.2f}",
+        ]
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark, or only the stand-in server, from the command line
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m hello_project.benchmark",
+        description=(
+            "Measure plugin throughput and latency against a local stand-in "
+            "for the weather and quote APIs"
+        ),
+    )
+    parser.add_argument("--plugin", choices=BENCHMARK_PLUGINS, default="weather")
+    parser.add_argument("--requests", type=int, default=1000, help="Plugin calls")
+    parser.add_argument("--concurrency", type=int, default=16, help="Callers")
+    parser.add_argument(
+        "--cities", type=int, default=100, help="Distinct weather cities"
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="Keep plugin result caching enabled"
+    )
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Only run the stand-in server until interrupted",
+    )
+    parser.add_argument("--port", type=int, default=0, help="Server port")
+    args = parser.parse_args(argv)
+
+    server = StandinServer(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+
+    if args.serve:
+        print(f"Weather base_url: {server.weather_base_url}")
+        print(f"Quote base_url: {server.quote_base_url}", flush=True)
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+        return 0
+
+    with server:
+        report = run_benchmark(
+            server,
+            plugin=args.plugin,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            cities=args.cities,
+            cache=args.cache,
+        )
+    print(format_report(report, args.format))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
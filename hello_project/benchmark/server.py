@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the weather and quote APIs
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from ..plugins.synthetic import SyntheticWeather
+
+QUOTES = [
+    ("The way to get started is to quit talking and begin doing.", "Walt Disney"),
+    ("Simplicity is prerequisite for reliability.", "Edsger W. Dijkstra"),
+    ("Make it work, make it right, make it fast.", "Kent Beck"),
+    ("Premature optimization is the root of all evil.", "Donald Knuth"),
+    ("It always seems impossible until it's done.", "Nelson Mandela"),
+]
+
+
+class StandinServer:
+    """HTTP server answering like OpenWeatherMap and quotable.io
+
+    Serves /data/2.5/weather, /data/2.5/group, /random and /quotes/random
+    with the response shapes of the real APIs. Every request is delayed by
+    latency_ms plus uniform jitter of up to jitter_ms either way, and fails
+    with HTTP 503 at failure_rate. Weather values come from SyntheticWeather,
+    so they are deterministic per city.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """Initialize stand-in server
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            latency_ms: Mean added response latency
+            jitter_ms: Maximum deviation from latency_ms
+            failure_rate: Probability of answering HTTP 503
+            seed: Seed for jitter, failures and generated data
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.weather = SyntheticWeather(seed=seed)
+        self.requests = 0  # Requests served, failures included
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self.httpd = _Server((host, port), _Handler)
+        self.httpd.standin = self  # type: ignore[attr-defined]
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def weather_base_url(self) -> str:
+        """Value for the weather plugin's base_url"""
+        return f"{self.url}/data/2.5"
+
+    @property
+    def quote_base_url(self) -> str:
+        """Value for the quote plugin's base_url"""
+        return self.url
+
+    def start(self) -> "StandinServer":
+        """Serve requests on a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.httpd.serve_forever, name="standin-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop serving and release the port"""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def plan_response(self) -> Tuple[float, bool]:
+        """Draw the delay and outcome of the next request
+
+        Returns:
+            Delay in seconds and whether the request fails
+        """
+        with self._lock:
+            self.requests += 1
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            failed = self._random.random() < self.failure_rate
+        return max(self.latency_ms + jitter, 0.0) / 1000, failed
+
+    def weather_record(self, city_id: Optional[int], name: Optional[str]) -> Dict:
+        """Build an OpenWeatherMap current weather record"""
+        name = name or f"City {city_id}"
+        reading = self.weather.reading(str(city_id) if city_id else name)
+        return {
+            "id": city_id or 0,
+            "name": name,
+            "main": {"temp": reading["temperature"], "humidity": reading["humidity"]},
+            "weather": [{"description": self.weather.describe(reading["humidity"])}],
+            "wind": {"speed": reading["wind"]},
+        }
+
+    def quote_records(self, limit: int) -> List[Dict[str, Any]]:
+        """Build quotable.io quote records"""
+        with self._lock:
+            picks = [self._random.randrange(len(QUOTES)) for _ in range(limit)]
+        return [
+            {
+                "_id": f"q{index}",
+                "content": QUOTES[index][0],
+                "author": QUOTES[index][1],
+                "tags": ["inspirational"],
+            }
+            for index in picks
+        ]
+
+
+class _Server(ThreadingHTTPServer):
+    """Threaded HTTP server sized for benchmark bursts"""
+
+    daemon_threads = True
+    # The default backlog of 5 drops connection bursts, costing a 1 s retry
+    request_queue_size = 128
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler of StandinServer"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real APIs
+    disable_nagle_algorithm = True  # Headers and body go out separately
+
+    def do_GET(self) -> None:
+        standin: StandinServer = self.server.standin  # type: ignore[attr-defined]
+        delay, failed = standin.plan_response()
+        time.sleep(delay)
+        if failed:
+            self._send(503, {"message": "Service unavailable (injected)"})
+            return
+
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/data/2.5/weather":
+            city_id = int(params["id"]) if "id" in params else None
+            self._send(200, standin.weather_record(city_id, params.get("q")))
+        elif url.path == "/data/2.5/group":
+            ids = [int(i) for i in params.get("id", "").split(",") if i]
+            records = [standin.weather_record(i, None) for i in ids]
+            self._send(200, {"cnt": len(records), "list": records})
+        elif url.path == "/random":
+            self._send(200, standin.quote_records(1)[0])
+        elif url.path == "/quotes/random":
+            self._send(200, standin.quote_records(int(params.get("limit", 1))))
+        else:
+            self._send(404, {"message": f"Unknown endpoint: {url.path}"})
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep request logs off stderr during benchmarks"""
@@ -2,10 +2,16 @@
 """
 Configuration management using Pydantic
 """
+import ctypes
+import ctypes.util
 import json
+import logging
 import os
+import select
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError
@@ -40,6 +46,15 @@ class Settings(BaseModel):
 
     # API settings (for plugins)
     api_timeout: int = Field(default=10, description="API request timeout in seconds")
+    http_pool_size: int = Field(
+        default=10, description="Pooled HTTP connections kept per host"
+    )
+    http_max_retries: int = Field(
+        default=2, description="Retries for failed idempotent HTTP requests"
+    )
+    http_keep_alive: bool = Field(
+        default=True, description="Reuse HTTP connections between requests"
+    )
 
     class Config:
         """Pydantic configuration"""
@@ -48,8 +63,81 @@ class Settings(BaseModel):
         validate_assignment = True
 
 
+class _Inotify:
+    """Change notifications for directories from Linux inotify"""
+
+    # IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+    # | IN_DELETE: watching directories also catches editors that save by
+    # renaming a new file over the old one
+    MASK = 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+
+    def __init__(self, fd: int):
+        self._fd = fd
+
+    @classmethod
+    def create(cls, directories: Iterable[Path]) -> Optional["_Inotify"]:
+        """Watch directories
+
+        Args:
+            directories: Directories to watch (missing ones are skipped)
+
+        Returns:
+            Watcher, or None if inotify is not available
+        """
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except Exception:  # No libc found, no inotify in it, or no O_CLOEXEC
+            return None
+        if fd < 0:
+            return None
+
+        watched = 0
+        for directory in directories:
+            if libc.inotify_add_watch(fd, os.fsencode(directory), cls.MASK) >= 0:
+                watched += 1
+        if not watched:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for changes
+
+        Args:
+            timeout: Maximum wait in seconds
+
+        Returns:
+            True if something changed, False on timeout
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        """Stop watching"""
+        os.close(self._fd)
+
+
 class ConfigManager:
-    """Manages application configuration with multiple sources"""
+    """Manages application configuration with multiple sources
+
+    Validated settings are cached process-wide, keyed by the config file
+    (resolved path, mtime, size and inode) and the HELLO_* environment
+    variables, so managers created per request only parse and validate
+    the configuration again after it changes.
+
+    Long-running processes can watch() the configuration: changed files are
+    validated and the new settings replace the current ones in a single
+    assignment. Work that already took ``settings`` keeps using the old
+    object; listeners are told about the swap to reconfigure themselves.
+    """
 
     DEFAULT_CONFIG_PATHS = [
         Path.home() / ".config" / "hello_project" / "config.yaml",
@@ -57,14 +145,40 @@ class ConfigManager:
         Path.cwd() / "hello_config.yaml",
     ]
 
-    def __init__(self, config_path: Optional[str] = None):
+    # Environment variables overriding config fields
+    ENV_MAPPINGS = {
+        "HELLO_DEFAULT_NAME": "default_name",
+        "HELLO_VERBOSE": "verbose",
+        "HELLO_OUTPUT_FORMAT": "output_format",
+        "HELLO_SHOW_TIMESTAMP": "show_timestamp",
+        "HELLO_API_TIMEOUT": "api_timeout",
+    }
+
+    CACHE_SIZE = 32
+    _cache: "OrderedDict[Tuple, Settings]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+    ):
         """Initialize configuration manager
 
         Args:
             config_path: Optional path to configuration file
+            overrides: Settings fields taking precedence over every source,
+                kept across reloads (e.g. command line arguments)
         """
         self.config_path = Path(config_path) if config_path else None
+        self.overrides = dict(overrides or {})
         self._settings: Optional[Settings] = None
+        self._key: Optional[Tuple] = None  # Cache key of the last load
+        self._listeners: List[Callable[[Settings, Settings], None]] = []
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        self.logger = logging.getLogger("config_manager")
 
     def load_config(self) -> Settings:
         """Load configuration from various sources
@@ -75,21 +189,168 @@ class ConfigManager:
         Raises:
             ValidationError: If configuration validation fails
         """
+        config_file = self._find_config_file()
+        key = self._cache_key(config_file)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            self._settings = self._customize(cached)
+            self._key = key
+            return self._settings
+
         config_data = {}
 
         # Load from file
-        if config_file := self._find_config_file():
+        if config_file:
             config_data.update(self._load_config_file(config_file))
 
         # Override with environment variables
         config_data.update(self._load_from_env())
 
         try:
-            self._settings = Settings(**config_data)
-            return self._settings
+            settings = Settings(**config_data)
         except ValidationError as e:
             raise ValidationError(f"Configuration validation failed: {e}")
 
+        with self._cache_lock:
+            self._cache[key] = settings
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        self._settings = self._customize(settings)
+        self._key = key
+        return self._settings
+
+    def _customize(self, settings: Settings) -> Settings:
+        """Copy cached settings and apply the overrides
+
+        Copying keeps callers changing their settings from affecting others.
+        """
+        settings = settings.model_copy(deep=True)
+        for field, value in self.overrides.items():
+            setattr(settings, field, value)
+        return settings
+
+    def add_listener(self, listener: Callable[[Settings, Settings], None]) -> None:
+        """Call a function whenever reloading replaces the settings
+
+        Args:
+            listener: Called with the old and the new settings, on the
+                thread that reloaded them
+        """
+        self._listeners.append(listener)
+
+    def reload(self) -> bool:
+        """Load the configuration again if a source changed
+
+        Invalid configuration is logged and the current settings kept, so
+        a half-saved file does not take down a running process.
+
+        Returns:
+            True if new settings replaced the current ones
+        """
+        with self._reload_lock:
+            key = self._cache_key(self._find_config_file())
+            if self._settings is not None and key == self._key:
+                return False
+
+            old = self._settings
+            self._key = key  # Report a broken file once, not on every check
+            try:
+                new = self.load_config()
+            except Exception as e:
+                self.logger.error(f"Keeping previous configuration: {e}")
+                return False
+            if old is None or new == old:
+                return False
+
+            self.logger.info("Configuration reloaded")
+            for listener in list(self._listeners):
+                try:
+                    listener(old, new)
+                except Exception as e:
+                    self.logger.warning(f"Configuration listener failed: {e}")
+            return True
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Reload the configuration in a background thread when it changes
+
+        Config file directories are watched with inotify where available;
+        the sources are also checked every interval seconds, which is all
+        that happens on other platforms.
+
+        Args:
+            interval: Seconds between checks
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self.settings  # Changes are detected against loaded settings
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="config-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def _watch(self, interval: float) -> None:
+        directories = {
+            path.parent
+            for path in [self.config_path, *self.DEFAULT_CONFIG_PATHS]
+            if path is not None
+        }
+        notifier = _Inotify.create(directories)
+        try:
+            while not self._stop_watching.is_set():
+                if notifier is not None:
+                    notifier.wait(interval)
+                elif self._stop_watching.wait(interval):
+                    break
+                if not self._stop_watching.is_set():
+                    self.reload()
+        finally:
+            if notifier is not None:
+                notifier.close()
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher and wait for it to exit"""
+        self._stop_watching.set()
+        watcher = self._watcher
+        if watcher is not None:
+            watcher.join()
+            self._watcher = None
+
+    def _cache_key(self, config_file: Optional[Path]) -> Tuple:
+        """Build the settings cache key of a config file and the environment
+
+        Args:
+            config_file: Config file in use, or None
+
+        Returns:
+            Hashable key that changes whenever the loaded settings could
+        """
+        file_key: Tuple = ()
+        if config_file is not None:
+            try:
+                stat = config_file.stat()
+            except OSError:
+                # Vanished since it was found: never matches a cached entry,
+                # and loading reports the error
+                file_key = (str(config_file),)
+            else:
+                file_key = (
+                    str(config_file.resolve()),
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    stat.st_ino,
+                )
+        return file_key, tuple(os.getenv(var) for var in self.ENV_MAPPINGS)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all cached settings"""
+        with cls._cache_lock:
+            cls._cache.clear()
+
     def _find_config_file(self) -> Optional[Path]:
         """Find configuration file
 
@@ -140,16 +401,7 @@ class ConfigManager:
         """
         env_config = {}
 
-        # Map environment variables to config fields
-        env_mappings = {
-            "HELLO_DEFAULT_NAME": "default_name",
-            "HELLO_VERBOSE": "verbose",
-            "HELLO_OUTPUT_FORMAT": "output_format",
-            "HELLO_SHOW_TIMESTAMP": "show_timestamp",
-            "HELLO_API_TIMEOUT": "api_timeout",
-        }
-
-        for env_var, config_key in env_mappings.items():
+        for env_var, config_key in self.ENV_MAPPINGS.items():
             if env_value := os.getenv(env_var):
                 # Convert string values to appropriate types
                 if config_key in ["verbose", "show_timestamp"]:
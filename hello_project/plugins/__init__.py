@@ -1,13 +1,44 @@
 """Plugin system for Hello Project"""
 
-from .base import BasePlugin, PluginManager, PluginResult
-from .quote import QuotePlugin
-from .weather import WeatherPlugin
+import importlib
+from typing import Any
+
+from .base import (
+    BasePlugin,
+    PluginDescriptor,
+    PluginManager,
+    PluginRegistry,
+    PluginResult,
+)
+from .cache import CachePolicy, CacheStats
+from .circuit import CircuitBreaker, CircuitOpenError
+
+# Built-in plugin classes are imported on first access so that importing the
+# plugin system does not pull in their dependencies (e.g. requests)
+_LAZY_EXPORTS = {
+    "WeatherPlugin": ".weather",
+    "QuotePlugin": ".quote",
+}
 
 __all__ = [
     "BasePlugin",
+    "CachePolicy",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "PluginDescriptor",
     "PluginManager",
+    "PluginRegistry",
     "PluginResult",
     "WeatherPlugin",
     "QuotePlugin",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
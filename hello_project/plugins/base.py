@@ -4,11 +4,81 @@ Base plugin system
 """
 import importlib
 import importlib.util
+import inspect
+import json
 import logging
+import os
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Mapping
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import wait
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from .cache import CachePolicy, CacheStats, ResultCache
+from .http_client import HTTPClient, HTTPConfig
+from .manifest import PluginClassInfo, PluginManifest
+from .singleflight import SingleFlight
+from .stats import StatsCollector
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    import requests
+
+    from ..config import Settings
+
+# Modules imported from external plugin files, keyed by resolved path
+_file_modules: Dict[str, ModuleType] = {}
+_file_modules_lock = threading.Lock()
+
+# Context key holding the time.monotonic() deadline of the current call
+DEADLINE_KEY = "deadline"
+
+# Supported values for BasePlugin.execution_mode
+EXECUTION_MODES = ("thread", "process")
+
+# Plugin instances living in a process pool worker, keyed by import path and
+# serialized config so that repeated calls reuse an already warm instance
+_worker_plugins: Dict[Tuple[str, str], "BasePlugin"] = {}
+
+
+def remaining_time(context: Dict[str, Any]) -> Optional[float]:
+    """Get the seconds left until the context deadline
+
+    Args:
+        context: Execution context
+
+    Returns:
+        Remaining seconds (negative once expired), or None without a deadline
+    """
+    deadline = context.get(DEADLINE_KEY)
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
 
 
 @dataclass
@@ -28,14 +98,58 @@ class BasePlugin(ABC):
     description: str = "Base plugin"
     version: str = "1.0.0"
 
+    # Upper bound for blocking calls (e.g. HTTP requests) made by the plugin
+    DEFAULT_REQUEST_TIMEOUT = 10.0
+
+    # Time kept back from a context deadline after a blocking call, so the
+    # plugin can still return a fallback before the manager gives up on it
+    # (a tenth of the remaining time, at most this many seconds)
+    DEADLINE_RESERVE = 0.25
+
+    # Where PluginManager runs execute(): "thread" runs it in the calling
+    # process, "process" in a persistent worker process pool (for CPU-bound
+    # plugins). Overridable per plugin with the "execution_mode" config key.
+    execution_mode: str = "thread"
+
+    # Opt-in memoization of successful results by PluginManager. Overridable
+    # per plugin with the "cache" config key (a mapping of CachePolicy fields,
+    # or false to disable caching).
+    cache_policy: Optional[CachePolicy] = None
+
+    # Let PluginManager coalesce identical concurrent calls (same normalized
+    # context) into one execution whose result all callers share. Only for
+    # plugins whose result depends on nothing but the context. Overridable
+    # per plugin with the "single_flight" config key.
+    single_flight: bool = False
+
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize plugin with configuration
 
         Args:
             config: Plugin configuration dictionary
+
+        Raises:
+            ValueError: If the configured execution mode or cache policy is
+                invalid
         """
         self.config = config or {}
         self.logger = logging.getLogger(f"plugin.{self.name}")
+        # Pooled HTTP client, attached by PluginManager on registration
+        self.http_client: Optional[HTTPClient] = None
+        self.execution_mode = self.config.get("execution_mode", self.execution_mode)
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {self.execution_mode}")
+
+        if "cache" in self.config:
+            cache_config = self.config["cache"]
+            if cache_config is True:
+                cache_config = {}
+            self.cache_policy = (
+                CachePolicy.from_config(cache_config, self.cache_policy)
+                if cache_config is not False
+                else None
+            )
+        self.single_flight = bool(self.config.get("single_flight", self.single_flight))
 
     @abstractmethod
     def execute(self, context: Dict[str, Any]) -> PluginResult:
@@ -49,6 +163,102 @@ class BasePlugin(ABC):
         """
         pass
 
+    async def execute_async(self, context: Dict[str, Any]) -> PluginResult:
+        """Execute plugin functionality from an event loop
+
+        Plugins with a native asyncio implementation should override this.
+        The default runs execute() on a daemon thread so synchronous plugins
+        never block the event loop, and a call abandoned past its deadline
+        neither holds up asyncio.run() nor keeps the interpreter alive.
+
+        Args:
+            context: Execution context with user input and settings
+
+        Returns:
+            PluginResult with execution result
+        """
+        import asyncio
+
+        future = _run_in_daemon_thread(
+            partial(self.execute, context), f"plugin-{self.name}"
+        )
+        return await asyncio.wrap_future(future)
+
+    def execute_batch(self, contexts: List[Dict[str, Any]]) -> List[PluginResult]:
+        """Execute plugin functionality for many contexts at once
+
+        The default executes each context in turn, isolating failures per
+        context. Plugins override this to amortize work across the batch
+        (deduplicate inputs, group upstream requests, ...).
+
+        Args:
+            contexts: Execution contexts
+
+        Returns:
+            One PluginResult per context, in the same order
+        """
+        results = []
+        for context in contexts:
+            try:
+                results.append(self.execute(context))
+            except Exception as e:
+                results.append(
+                    PluginResult(success=False, error=str(e), plugin_name=self.name)
+                )
+        return results
+
+    def request_timeout(self, context: Dict[str, Any]) -> float:
+        """Get the timeout for a blocking call made while handling context
+
+        The plugin's ``timeout`` config (default: the HTTP client timeout,
+        or DEFAULT_REQUEST_TIMEOUT without a client) is capped by the time
+        remaining until the context deadline, if any, less DEADLINE_RESERVE.
+
+        Args:
+            context: Execution context
+
+        Returns:
+            Timeout in seconds
+
+        Raises:
+            TimeoutError: If the context deadline has already passed
+        """
+        if "timeout" in self.config:
+            timeout = float(self.config["timeout"])
+        elif self.http_client is not None:
+            timeout = self.http_client.config.timeout
+        else:
+            timeout = self.DEFAULT_REQUEST_TIMEOUT
+
+        remaining = remaining_time(context)
+        if remaining is None:
+            return timeout
+        remaining -= min(remaining / 10, self.DEADLINE_RESERVE)
+        if remaining <= 0:
+            raise TimeoutError("Plugin deadline exceeded")
+        return min(timeout, remaining)
+
+    def http_get(self, url: str, timeout: float, **kwargs: Any) -> "requests.Response":
+        """Send a GET request for the plugin
+
+        Uses the manager's pooled keep-alive session when the plugin is
+        registered with a PluginManager, a one-off request otherwise.
+
+        Args:
+            url: Request URL
+            timeout: Request timeout in seconds
+            **kwargs: Further arguments for requests (params, headers, ...)
+
+        Returns:
+            HTTP response
+        """
+        if self.http_client is not None:
+            return self.http_client.get(url, timeout=timeout, **kwargs)
+
+        import requests
+
+        return requests.get(url, timeout=timeout, **kwargs)
+
     def validate_config(self) -> bool:
         """Validate plugin configuration
 
@@ -57,42 +267,528 @@ class BasePlugin(ABC):
         """
         return True
 
-    def get_help(self) -> str:
+    def normalize_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a context to a canonical form for identifying equivalent calls
+
+        Calls whose normalized contexts are equal must produce the same
+        result; PluginManager builds result cache keys from this form.
+
+        Args:
+            context: Execution context
+
+        Returns:
+            Normalized context (the context itself by default)
+        """
+        return context
+
+    def on_cache_hit(self, context: Dict[str, Any]) -> None:
+        """Observe a call that PluginManager answered from its result cache
+
+        execute() does not run for such calls; plugins tracking demand
+        (e.g. for prefetching) count them here. Does nothing by default.
+
+        Args:
+            context: Execution context
+        """
+
+    def close(self) -> None:
+        """Release resources held by the plugin (background work, files)
+
+        Called by PluginManager.close for every loaded plugin.
+        """
+
+    @classmethod
+    def get_help(cls) -> str:
         """Get help text for the plugin
 
+        Overrides should stay classmethods so that help can be shown
+        without constructing the plugin.
+
         Returns:
             Help text describing plugin usage
         """
-        return f"{self.name}: {self.description}"
+        return f"{cls.name}: {cls.description}"
+
+
+@dataclass(frozen=True)
+class PluginDescriptor:
+    """Lightweight description of a plugin that has not been imported yet"""
+
+    name: str
+    description: str
+    import_path: str  # "package.module:ClassName" or "/path/to/file.py:ClassName"
+
+    def load(self) -> Type[BasePlugin]:
+        """Import and return the plugin class
+
+        Returns:
+            Plugin class referenced by import_path
+
+        Raises:
+            ImportError: If the module or class cannot be imported
+        """
+        module_name, _, class_name = self.import_path.rpartition(":")
+        if module_name.endswith(".py"):
+            module = load_module_from_file(Path(module_name))
+        else:
+            module = importlib.import_module(module_name)
+        try:
+            plugin_class = getattr(module, class_name)
+        except AttributeError:
+            raise ImportError(f"{module_name} has no plugin class {class_name!r}")
+
+        if not (
+            isinstance(plugin_class, type) and issubclass(plugin_class, BasePlugin)
+        ):
+            raise ImportError(f"{self.import_path} is not a BasePlugin subclass")
+        return plugin_class
+
+
+def load_module_from_file(plugin_file: Path, reload: bool = False) -> ModuleType:
+    """Import an external plugin module from a file, once per process
+
+    Args:
+        plugin_file: Path to plugin file
+        reload: Execute the file again even if it was already imported
+
+    Returns:
+        Imported module
+
+    Raises:
+        ImportError: If the file cannot be loaded as a module
+    """
+    key = str(plugin_file.resolve())
+    with _file_modules_lock:
+        module = _file_modules.get(key)
+        if module is not None and not reload:
+            return module
+
+        module_name = f"external_plugin_{plugin_file.stem}"
+        spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load plugin from {plugin_file}")
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _file_modules[key] = module
+        return module
+
+
+def plugin_import_path(plugin_class: Type[BasePlugin]) -> Optional[str]:
+    """Find an import path from which another process can load a plugin class
+
+    Args:
+        plugin_class: Plugin class to locate
+
+    Returns:
+        Import path usable in a PluginDescriptor, or None if the class is not
+        reachable (e.g. defined inside a function)
+    """
+    class_name = plugin_class.__qualname__
+    with _file_modules_lock:
+        for path, module in _file_modules.items():
+            if getattr(module, class_name, None) is plugin_class:
+                return f"{path}:{class_name}"
+
+    module = sys.modules.get(plugin_class.__module__)
+    if module is not None and getattr(module, class_name, None) is plugin_class:
+        return f"{plugin_class.__module__}:{class_name}"
+    return None
+
+
+def _run_in_daemon_thread(func: Callable[[], Any], name: str) -> Future:
+    """Run func on a new daemon thread so that callers can abandon it
+
+    Args:
+        func: Callable to run
+        name: Thread name
+
+    Returns:
+        Future of func's result
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+def _run_on_daemon_threads(
+    funcs: Sequence[Callable[[], Any]], max_workers: int, name: str
+) -> List[Future]:
+    """Run funcs on at most max_workers daemon threads so callers can abandon them
+
+    Like a ThreadPoolExecutor, except that threads still running an
+    abandoned call do not keep the interpreter from exiting. Cancelling a
+    future that has not started yet drops its call.
+
+    Args:
+        funcs: Callables to run, started in order
+        max_workers: Maximum number of threads
+        name: Thread name prefix
+
+    Returns:
+        One future per callable, in the same order
+    """
+    futures: List[Future] = [Future() for _ in funcs]
+    pending = list(zip(funcs, futures))
+    lock = threading.Lock()
+
+    def work() -> None:
+        while True:
+            with lock:
+                if not pending:
+                    return
+                func, future = pending.pop(0)
+            if not future.set_running_or_notify_cancel():
+                continue  # Cancelled while queued
+            try:
+                future.set_result(func())
+            except BaseException as e:
+                future.set_exception(e)
+
+    for i in range(min(max_workers, len(futures))):
+        threading.Thread(target=work, name=f"{name}_{i}", daemon=True).start()
+    return futures
+
+
+def _timed(func: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    """Call func, returning its result and how long it took in seconds"""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def _worker_plugin(import_path: str, config: Dict[str, Any]) -> "BasePlugin":
+    """Get the warm plugin instance of this worker process"""
+    key = (import_path, json.dumps(config, sort_keys=True, default=str))
+    plugin = _worker_plugins.get(key)
+    if plugin is None:
+        plugin_class = PluginDescriptor("", "", import_path).load()
+        plugin = plugin_class(config)
+        _worker_plugins[key] = plugin
+    return plugin
+
+
+def _execute_in_worker(
+    import_path: str, config: Dict[str, Any], context: Dict[str, Any]
+) -> PluginResult:
+    """Run a plugin inside a process pool worker
+
+    Args:
+        import_path: Import path of the plugin class
+        config: Plugin configuration
+        context: Execution context
+
+    Returns:
+        Plugin execution result
+    """
+    return _worker_plugin(import_path, config).execute(context)
+
+
+def _execute_batch_in_worker(
+    import_path: str, config: Dict[str, Any], contexts: List[Dict[str, Any]]
+) -> List[PluginResult]:
+    """Run a plugin batch inside a process pool worker
+
+    Args:
+        import_path: Import path of the plugin class
+        config: Plugin configuration
+        contexts: Execution contexts
+
+    Returns:
+        Plugin execution results
+    """
+    return _worker_plugin(import_path, config).execute_batch(contexts)
+
+
+class PluginRegistry(Mapping):
+    """Plugin name to instance mapping with lazy instantiation
+
+    Plugins registered through a PluginDescriptor are listed like any other
+    plugin, but their module is only imported and the plugin constructed on
+    first item access.
+    """
+
+    def __init__(self, factory: Callable[[PluginDescriptor], BasePlugin]):
+        """Initialize registry
+
+        Args:
+            factory: Callable building a plugin instance from a descriptor
+        """
+        self._factory = factory
+        self._entries: Dict[str, Union[BasePlugin, PluginDescriptor]] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: str) -> BasePlugin:
+        entry = self._entries[name]
+        if isinstance(entry, BasePlugin):
+            return entry
+
+        with self._lock:
+            # Another thread may have instantiated it while we waited
+            entry = self._entries[name]
+            if isinstance(entry, PluginDescriptor):
+                entry = self._factory(entry)
+                self._entries[name] = entry
+            return entry
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def add(self, plugin: BasePlugin) -> None:
+        """Register an already constructed plugin"""
+        with self._lock:
+            self._entries[plugin.name] = plugin
+
+    def add_descriptor(self, descriptor: PluginDescriptor) -> None:
+        """Register a plugin to be instantiated on first access"""
+        with self._lock:
+            self._entries[descriptor.name] = descriptor
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a plugin has been instantiated"""
+        return isinstance(self._entries.get(name), BasePlugin)
+
+    def description(self, name: str) -> str:
+        """Get a plugin description without instantiating it"""
+        return self._entries[name].description
+
+    def plugin_class(self, name: str) -> Type[BasePlugin]:
+        """Get a plugin class, importing but not instantiating it"""
+        entry = self._entries[name]
+        if isinstance(entry, BasePlugin):
+            return type(entry)
+        return entry.load()
 
 
 class PluginManager:
     """Manages plugin loading and execution"""
 
-    def __init__(self, plugin_directory: str = "plugins"):
+    # Built-in plugins, imported only when first used
+    BUILTIN_PLUGINS = [
+        PluginDescriptor(
+            name="weather",
+            description="Get current weather information",
+            import_path=f"{__package__}.weather:WeatherPlugin",
+        ),
+        PluginDescriptor(
+            name="quote",
+            description="Get inspirational quotes",
+            import_path=f"{__package__}.quote:QuotePlugin",
+        ),
+    ]
+
+    # Upper bound on threads used by execute_many when max_workers is not given
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        plugin_directory: str = "plugins",
+        manifest_path: Optional[str] = None,
+        default_timeout: Optional[float] = None,
+        process_workers: Optional[int] = None,
+        collect_stats: bool = False,
+        http_config: Optional[HTTPConfig] = None,
+        plugin_configs: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
         """Initialize plugin manager
 
         Args:
             plugin_directory: Directory containing plugins
+            manifest_path: Where to persist the external plugin discovery
+                manifest (default: PluginManifest.FILENAME in plugin_directory)
+            default_timeout: Time budget in seconds for plugin calls that do
+                not specify one (default: wait indefinitely)
+            process_workers: Size of the worker process pool used by plugins
+                in "process" execution mode (default: number of CPUs)
+            collect_stats: Record per-plugin call counts and latencies
+            http_config: Connection pool settings of the HTTP client shared
+                by the plugins
+            plugin_configs: Configuration per plugin name for lazily
+                registered plugins (default: their built-in defaults)
         """
         self.plugin_directory = Path(plugin_directory)
-        self.plugins: Dict[str, BasePlugin] = {}
+        self.default_timeout = default_timeout
+        self.process_workers = process_workers
+        self._process_pool: Optional["ProcessPoolExecutor"] = None
+        self._process_pool_lock = threading.Lock()
+        self._caches: Dict[str, ResultCache[PluginResult]] = {}
+        self._caches_lock = threading.Lock()
+        self._in_flight: SingleFlight[PluginResult] = SingleFlight()
+        self.stats: Optional[StatsCollector] = (
+            StatsCollector() if collect_stats else None
+        )
+        self.http = HTTPClient(http_config)
+        self.manifest_path = (
+            Path(manifest_path)
+            if manifest_path
+            else self.plugin_directory / PluginManifest.FILENAME
+        )
+        self.plugin_configs = dict(plugin_configs or {})
+        self._settings_fields: Set[str] = set()  # Set by from_settings
+        self.plugins = PluginRegistry(self._instantiate_plugin)
+        # Calls running per plugin instance, and replaced instances waiting
+        # for theirs to finish before they are closed
+        self._active: Dict[int, int] = {}
+        self._retired: Dict[int, BasePlugin] = {}
+        self._active_lock = threading.Lock()
         self.logger = logging.getLogger("plugin_manager")
 
         # Load built-in plugins
         self._load_builtin_plugins()
 
-    def _load_builtin_plugins(self) -> None:
-        """Load built-in plugins"""
+    @classmethod
+    def from_settings(cls, settings: "Settings", **kwargs: Any) -> "PluginManager":
+        """Create a plugin manager configured from application settings
+
+        Args:
+            settings: Application settings
+            **kwargs: Further PluginManager arguments
+
+        Returns:
+            Configured plugin manager
+        """
+        http_config = HTTPConfig(
+            pool_size=settings.http_pool_size,
+            max_retries=settings.http_max_retries,
+            keep_alive=settings.http_keep_alive,
+            timeout=settings.api_timeout,
+        )
+        # Arguments not given explicitly follow the settings when reloaded
+        follow = {"default_timeout", "http_config"} - kwargs.keys()
+        kwargs.setdefault("plugin_directory", settings.plugin_directory)
+        kwargs.setdefault("default_timeout", settings.api_timeout)
+        kwargs.setdefault("http_config", http_config)
+        kwargs.setdefault("plugin_configs", cls._plugin_configs(settings))
+        manager = cls(**kwargs)
+        manager._settings_fields = follow
+        return manager
+
+    @staticmethod
+    def _plugin_configs(settings: "Settings") -> Dict[str, Dict[str, Any]]:
+        """Get the plugin configurations of application settings"""
+        return {plugin.name: plugin.config for plugin in settings.plugins}
+
+    def apply_settings(self, settings: "Settings") -> List[str]:
+        """Reconfigure plugins whose configuration changed, without a restart
+
+        A changed plugin that is already loaded is rebuilt with its new
+        configuration and swapped in; calls already running finish on the
+        old instance, which is closed once they are done. Plugins that are
+        not loaded yet simply pick up the new configuration when first
+        used. Other plugins keep their instances, caches and connections.
+
+        A new api_timeout becomes the default time budget and HTTP timeout
+        if the manager took them from settings (see from_settings). HTTP
+        pool settings only take effect on restart; changing them is logged.
+
+        Args:
+            settings: New application settings
+
+        Returns:
+            Names of the reconfigured plugins
+        """
+        if "default_timeout" in self._settings_fields:
+            self.default_timeout = settings.api_timeout
+        if "http_config" in self._settings_fields:
+            # Read on every request, so the pooled session can stay open
+            config = self.http.config
+            config.timeout = settings.api_timeout
+            if (config.pool_size, config.max_retries, config.keep_alive) != (
+                settings.http_pool_size,
+                settings.http_max_retries,
+                settings.http_keep_alive,
+            ):
+                self.logger.warning("HTTP pool settings take effect after a restart")
+
+        configs = self._plugin_configs(settings)
+        changed = [
+            name
+            for name in self.plugins
+            if configs.get(name, {}) != self.plugin_configs.get(name, {})
+        ]
+        self.plugin_configs = configs
+
+        reconfigured = []
+        for name in changed:
+            if self.plugins.is_loaded(name):
+                old = self.plugins[name]
+                try:
+                    plugin = type(old)(configs.get(name, {}))
+                    if not plugin.validate_config():
+                        raise ValueError("invalid configuration")
+                except Exception as e:
+                    self.logger.error(
+                        f"Keeping previous configuration of plugin {name}: {e}"
+                    )
+                    continue
+                plugin.http_client = self.http
+                with self._active_lock:
+                    self.plugins.add(plugin)
+                    if self._active.get(id(old)):
+                        self._retired[id(old)] = old
+                        old = None
+                if old is not None:
+                    self._close_plugin(old)
+            self._drop_cache(name)
+            reconfigured.append(name)
+            self.logger.info(f"Reconfigured plugin: {name}")
+        return reconfigured
+
+    @contextmanager
+    def _use_plugin(self, name: str) -> Iterator[BasePlugin]:
+        """Get the current instance of a plugin for the duration of a call
+
+        Raises:
+            KeyError: If no plugin has this name
+            Exception: Whatever loading the plugin raised
+        """
+        self.plugins[name]  # Load outside the lock
+        with self._active_lock:
+            plugin = self.plugins[name]
+            self._active[id(plugin)] = self._active.get(id(plugin), 0) + 1
         try:
-            from .quote import QuotePlugin
-            from .weather import WeatherPlugin
+            yield plugin
+        finally:
+            retired = None
+            with self._active_lock:
+                self._active[id(plugin)] -= 1
+                if not self._active[id(plugin)]:
+                    del self._active[id(plugin)]
+                    retired = self._retired.pop(id(plugin), None)
+            if retired is not None:
+                self._close_plugin(retired)
+
+    def _is_retired(self, plugin: BasePlugin) -> bool:
+        """Check whether a plugin instance has been replaced"""
+        with self._active_lock:
+            return id(plugin) in self._retired
 
-            self.register_plugin(WeatherPlugin())
-            self.register_plugin(QuotePlugin())
+    def _close_plugin(self, plugin: BasePlugin) -> None:
+        """Close a plugin instance, logging failures"""
+        try:
+            plugin.close()
+        except Exception as e:
+            self.logger.warning(f"Failed to close plugin {plugin.name}: {e}")
 
-        except ImportError as e:
-            self.logger.warning(f"Failed to load built-in plugins: {e}")
+    def _load_builtin_plugins(self) -> None:
+        """Register built-in plugins without importing them"""
+        for descriptor in self.BUILTIN_PLUGINS:
+            self.register_descriptor(descriptor)
 
     def register_plugin(self, plugin: BasePlugin) -> None:
         """Register a plugin
@@ -106,50 +802,117 @@ class PluginManager:
         if not plugin.validate_config():
             raise ValueError(f"Plugin {plugin.name} has invalid configuration")
 
-        self.plugins[plugin.name] = plugin
+        if plugin.http_client is None:
+            plugin.http_client = self.http
+
+        self.plugins.add(plugin)
+        self._drop_cache(plugin.name)
         self.logger.info(f"Registered plugin: {plugin.name}")
 
+    def register_descriptor(self, descriptor: PluginDescriptor) -> None:
+        """Register a plugin to be imported and instantiated on first use
+
+        Args:
+            descriptor: Plugin descriptor to register
+        """
+        self.plugins.add_descriptor(descriptor)
+        self._drop_cache(descriptor.name)
+        self.logger.info(f"Registered lazy plugin: {descriptor.name}")
+
+    def _instantiate_plugin(self, descriptor: PluginDescriptor) -> BasePlugin:
+        """Import and construct a lazily registered plugin
+
+        Args:
+            descriptor: Descriptor of the plugin to construct
+
+        Returns:
+            Validated plugin instance
+
+        Raises:
+            ImportError: If the plugin class cannot be imported
+            ValueError: If the plugin configuration is invalid
+        """
+        plugin_class = descriptor.load()
+        if descriptor.name in self.plugin_configs:
+            plugin = plugin_class(self.plugin_configs[descriptor.name])
+        else:
+            plugin = plugin_class()
+        if not plugin.validate_config():
+            raise ValueError(f"Plugin {plugin.name} has invalid configuration")
+
+        plugin.http_client = self.http
+        self.logger.info(f"Loaded plugin: {descriptor.name}")
+        return plugin
+
     def load_external_plugins(self) -> None:
-        """Load plugins from external directory"""
+        """Register plugins from external directory
+
+        Files already recorded in the discovery manifest are registered lazily
+        without being imported; new or changed files are imported and scanned,
+        and the manifest is updated for the next run.
+        """
         if not self.plugin_directory.exists():
             self.logger.info(f"Plugin directory {self.plugin_directory} does not exist")
             return
 
-        for plugin_file in self.plugin_directory.glob("*.py"):
+        manifest = PluginManifest(self.manifest_path)
+        manifest.load()
+
+        plugin_files = []
+        for plugin_file in sorted(self.plugin_directory.glob("*.py")):
             if plugin_file.name.startswith("_"):
                 continue
+            plugin_files.append(plugin_file)
 
             try:
-                self._load_plugin_from_file(plugin_file)
+                entry = manifest.lookup(plugin_file)
+                if entry is None:
+                    entry = manifest.record(
+                        plugin_file, self._scan_plugin_file(plugin_file)
+                    )
+
+                for info in entry.classes:
+                    self.register_descriptor(
+                        PluginDescriptor(
+                            name=info.name,
+                            description=info.description,
+                            import_path=f"{plugin_file.resolve()}:{info.attr}",
+                        )
+                    )
             except Exception as e:
                 self.logger.error(f"Failed to load plugin from {plugin_file}: {e}")
 
-    def _load_plugin_from_file(self, plugin_file: Path) -> None:
-        """Load a plugin from a Python file
+        manifest.prune(plugin_files)
+        manifest.save()
+
+    def _scan_plugin_file(self, plugin_file: Path) -> List[PluginClassInfo]:
+        """Import a plugin file and find the plugin classes it defines
 
         Args:
             plugin_file: Path to plugin file
-        """
-        module_name = f"external_plugin_{plugin_file.stem}"
-        spec = importlib.util.spec_from_file_location(module_name, plugin_file)
 
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Cannot load plugin from {plugin_file}")
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        Returns:
+            Plugin classes found in the module
+        """
+        module = load_module_from_file(plugin_file, reload=True)
+        self.logger.info(f"Scanned plugin file: {plugin_file}")
 
         # Find plugin classes in the module
+        classes = []
         for attr_name in dir(module):
             attr = getattr(module, attr_name)
             if (
                 isinstance(attr, type)
                 and issubclass(attr, BasePlugin)
                 and attr != BasePlugin
+                and not inspect.isabstract(attr)
             ):
-
-                plugin_instance = attr()
-                self.register_plugin(plugin_instance)
+                classes.append(
+                    PluginClassInfo(
+                        attr=attr_name, name=attr.name, description=attr.description
+                    )
+                )
+        return classes
 
     def get_plugin(self, name: str) -> Optional[BasePlugin]:
         """Get plugin by name
@@ -158,9 +921,13 @@ class PluginManager:
             name: Plugin name
 
         Returns:
-            Plugin instance or None if not found
+            Plugin instance or None if not found or failed to load
         """
-        return self.plugins.get(name)
+        try:
+            return self.plugins.get(name)
+        except Exception as e:
+            self.logger.error(f"Failed to load plugin {name}: {e}")
+            return None
 
     def list_plugins(self) -> List[str]:
         """Get list of available plugin names
@@ -170,31 +937,622 @@ class PluginManager:
         """
         return list(self.plugins.keys())
 
-    def execute_plugin(self, name: str, context: Dict[str, Any]) -> PluginResult:
+    def execute_plugin(
+        self,
+        name: str,
+        context: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> PluginResult:
         """Execute a plugin
 
+        When a deadline applies (timeout, default_timeout or a deadline
+        already present in the context) the plugin runs on a daemon thread
+        and is abandoned if it overruns; the deadline is passed on to the
+        plugin through the context so its own blocking calls can honour it.
+
+        Args:
+            name: Plugin name
+            context: Execution context
+            timeout: Time budget in seconds (default: default_timeout)
+
+        Returns:
+            Plugin execution result
+        """
+        if self.stats is None:
+            return self._execute_plugin(name, context, timeout)
+
+        result, elapsed = _timed(self._execute_plugin, name, context, timeout)
+        self.stats.record(name, elapsed, result.success)
+        return result
+
+    def _execute_plugin(
+        self, name: str, context: Dict[str, Any], timeout: Optional[float]
+    ) -> PluginResult:
+        """Execute a plugin without recording statistics"""
+        if name not in self.plugins:
+            return self._not_found_result(name)
+        if (cached := self._cached_result(name, context)) is not None:
+            return cached
+
+        started = time.monotonic()
+        deadline = self._resolve_deadline(context, timeout)
+        if deadline is None:
+            return self._execute_now(name, context, lookup_cache=False)
+
+        context = {**context, DEADLINE_KEY: deadline}
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return self._timeout_result(name, deadline - started)
+
+        future = _run_in_daemon_thread(
+            lambda: self._execute_now(name, context, lookup_cache=False),
+            f"plugin-{name}",
+        )
+        try:
+            return future.result(timeout=remaining)
+        except FuturesTimeoutError:
+            return self._timeout_result(name, deadline - started)
+
+    def execute_many(
+        self,
+        names: Sequence[str],
+        context: Dict[str, Any],
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[PluginResult]:
+        """Execute several plugins concurrently
+
+        Plugins run on a bounded thread pool, so total wall time tracks the
+        slowest plugin instead of the sum of all of them. Failures are isolated
+        per plugin exactly as in execute_plugin.
+
+        Args:
+            names: Plugin names to execute (duplicates are executed again)
+            context: Execution context, copied for each plugin
+            max_workers: Maximum number of worker threads
+                (default: min(len(names), DEFAULT_MAX_WORKERS))
+            timeout: Overall time budget in seconds shared by all plugins
+                (default: default_timeout)
+
+        Returns:
+            Plugin execution results in the order of names
+        """
+        if not names:
+            return []
+
+        if max_workers is None:
+            max_workers = min(len(names), self.DEFAULT_MAX_WORKERS)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        started = time.monotonic()
+        deadline = self._resolve_deadline(context, timeout)
+        if deadline is not None:
+            context = {**context, DEADLINE_KEY: deadline}
+
+        # Nothing to overlap: skip the pool entirely
+        if max_workers == 1 or len(names) == 1:
+            return [self.execute_plugin(name, dict(context)) for name in names]
+
+        futures = _run_on_daemon_threads(
+            [partial(_timed, self._execute_now, name, dict(context)) for name in names],
+            max_workers,
+            "plugin",
+        )
+        if deadline is not None:
+            wait(futures, timeout=max(deadline - time.monotonic(), 0))
+
+        results = []
+        for name, future in zip(names, futures):
+            if deadline is None or future.done():
+                result, elapsed = future.result()
+            else:
+                # Queued calls are dropped, running ones are abandoned
+                future.cancel()
+                elapsed = time.monotonic() - started
+                result = self._timeout_result(name, deadline - started)
+
+            if self.stats is not None:
+                self.stats.record(name, elapsed, result.success)
+            results.append(result)
+        return results
+
+    def execute_plugin_batch(
+        self,
+        name: str,
+        contexts: Sequence[Dict[str, Any]],
+        timeout: Optional[float] = None,
+    ) -> List[PluginResult]:
+        """Execute a plugin for many contexts at once
+
+        Contexts with a memoized result are answered from the cache; the rest
+        are passed in a single call to the plugin's execute_batch so it can
+        amortize work across them. If that call fails or overruns the time
+        budget, every context it covered gets the failure result.
+
+        Args:
+            name: Plugin name
+            contexts: Execution contexts
+            timeout: Time budget in seconds for the whole batch
+                (default: default_timeout)
+
+        Returns:
+            One result per context, in the same order
+        """
+        if name not in self.plugins:
+            return [self._not_found_result(name) for _ in contexts]
+
+        measure_started = time.perf_counter()
+        results: List[Optional[PluginResult]] = [
+            self._cached_result(name, context) for context in contexts
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            batch = [contexts[i] for i in pending]
+            batch_results = self._run_batch(name, batch, timeout)
+            for i, result in zip(pending, batch_results):
+                results[i] = result
+
+        if self.stats is not None:
+            # Every result of the batch became available when the batch finished
+            elapsed = time.perf_counter() - measure_started
+            for result in results:
+                self.stats.record(name, elapsed, result.success)
+        return cast(List[PluginResult], results)
+
+    def _run_batch(
+        self, name: str, batch: List[Dict[str, Any]], timeout: Optional[float]
+    ) -> List[PluginResult]:
+        """Run the uncached part of a batch within its time budget"""
+        started = time.monotonic()
+        deadline = self._resolve_deadline({}, timeout)
+        if deadline is None:
+            return self._execute_batch_now(name, batch)
+
+        batch = [
+            {**context, DEADLINE_KEY: self._resolve_deadline(context, timeout)}
+            for context in batch
+        ]
+        future = _run_in_daemon_thread(
+            lambda: self._execute_batch_now(name, batch), f"plugin-{name}"
+        )
+        try:
+            return future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FuturesTimeoutError:
+            timed_out = self._timeout_result(name, deadline - started)
+            return [replace(timed_out) for _ in batch]
+
+    async def execute_plugin_async(
+        self,
+        name: str,
+        context: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> PluginResult:
+        """Execute a plugin from an event loop
+
         Args:
             name: Plugin name
             context: Execution context
+            timeout: Time budget in seconds (default: default_timeout)
 
         Returns:
             Plugin execution result
         """
-        plugin = self.get_plugin(name)
-        if not plugin:
-            return PluginResult(
-                success=False,
-                error=f"Plugin '{name}' not found",
-                plugin_name=name,
+        if self.stats is None:
+            return await self._execute_plugin_async(name, context, timeout)
+
+        started = time.perf_counter()
+        result = await self._execute_plugin_async(name, context, timeout)
+        self.stats.record(name, time.perf_counter() - started, result.success)
+        return result
+
+    async def _execute_plugin_async(
+        self, name: str, context: Dict[str, Any], timeout: Optional[float]
+    ) -> PluginResult:
+        """Execute a plugin from an event loop without recording statistics"""
+        import asyncio
+
+        if name not in self.plugins:
+            return self._not_found_result(name)
+        if (cached := self._cached_result(name, context)) is not None:
+            return cached
+
+        started = time.monotonic()
+        deadline = self._resolve_deadline(context, timeout)
+        if deadline is None:
+            return await self._execute_now_async(name, context, lookup_cache=False)
+
+        context = {**context, DEADLINE_KEY: deadline}
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return self._timeout_result(name, deadline - started)
+
+        try:
+            return await asyncio.wait_for(
+                self._execute_now_async(name, context, lookup_cache=False), remaining
             )
+        except asyncio.TimeoutError:
+            return self._timeout_result(name, deadline - started)
+
+    async def execute_many_async(
+        self,
+        names: Sequence[str],
+        context: Dict[str, Any],
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[PluginResult]:
+        """Execute several plugins concurrently on the running event loop
+
+        Args:
+            names: Plugin names to execute (duplicates are executed again)
+            context: Execution context, copied for each plugin
+            concurrency: Maximum number of plugins in flight at once
+                (default: unbounded)
+            timeout: Overall time budget in seconds shared by all plugins
+                (default: default_timeout)
+
+        Returns:
+            Plugin execution results in the order of names
+        """
+        import asyncio
+
+        deadline = self._resolve_deadline(context, timeout)
+        if deadline is not None:
+            context = {**context, DEADLINE_KEY: deadline}
+
+        if concurrency is None:
+            return list(
+                await asyncio.gather(
+                    *(self.execute_plugin_async(name, dict(context)) for name in names)
+                )
+            )
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(name: str) -> PluginResult:
+            async with semaphore:
+                return await self.execute_plugin_async(name, dict(context))
+
+        return list(await asyncio.gather(*(run(name) for name in names)))
 
+    def _execute_now(
+        self, name: str, context: Dict[str, Any], lookup_cache: bool = True
+    ) -> PluginResult:
+        """Run a plugin on the calling thread, isolating failures"""
+        if name not in self.plugins:
+            return self._not_found_result(name)
+        if lookup_cache and (cached := self._cached_result(name, context)):
+            return cached
+
+        try:
+            with self._use_plugin(name) as plugin:
+                if not plugin.single_flight:
+                    return self._run_plugin(name, plugin, context)
+
+                result, shared = self._in_flight.do(
+                    self._call_key(name, plugin, context),
+                    lambda: self._run_plugin(name, plugin, context),
+                )
+                return replace(result) if shared else result
+        except Exception as e:
+            return self._failure_result(name, e)
+
+    def _run_plugin(
+        self, name: str, plugin: BasePlugin, context: Dict[str, Any]
+    ) -> PluginResult:
+        """Run a plugin's execute and memoize the result"""
         try:
-            result = plugin.execute(context)
+            future = self._submit_to_process_pool(plugin, _execute_in_worker, context)
+            if future is not None:
+                result = future.result()
+            else:
+                result = plugin.execute(context)
             result.plugin_name = name
+            if not self._is_retired(plugin):
+                self._store_result(name, context, result)
             return result
         except Exception as e:
-            self.logger.error(f"Plugin {name} execution failed: {e}")
-            return PluginResult(success=False, error=str(e), plugin_name=name)
+            return self._failure_result(name, e)
+
+    async def _execute_now_async(
+        self, name: str, context: Dict[str, Any], lookup_cache: bool = True
+    ) -> PluginResult:
+        """Await a plugin's execute_async, isolating failures"""
+        if name not in self.plugins:
+            return self._not_found_result(name)
+        if lookup_cache and (cached := self._cached_result(name, context)):
+            return cached
+
+        try:
+            with self._use_plugin(name) as plugin:
+                if not plugin.single_flight:
+                    return await self._run_plugin_async(name, plugin, context)
+
+                result, shared = await self._in_flight.do_async(
+                    self._call_key(name, plugin, context),
+                    lambda: self._run_plugin_async(name, plugin, context),
+                )
+                return replace(result) if shared else result
+        except Exception as e:
+            return self._failure_result(name, e)
+
+    async def _run_plugin_async(
+        self, name: str, plugin: BasePlugin, context: Dict[str, Any]
+    ) -> PluginResult:
+        """Await a plugin's execute_async and memoize the result"""
+        import asyncio
+
+        try:
+            future = self._submit_to_process_pool(plugin, _execute_in_worker, context)
+            if future is not None:
+                result = await asyncio.wrap_future(future)
+            else:
+                result = await plugin.execute_async(context)
+            result.plugin_name = name
+            if not self._is_retired(plugin):
+                self._store_result(name, context, result)
+            return result
+        except Exception as e:
+            return self._failure_result(name, e)
+
+    @staticmethod
+    def _call_key(
+        name: str, plugin: BasePlugin, context: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """Identify a call for coalescing: plugin name and normalized context"""
+        context = {k: v for k, v in context.items() if k != DEADLINE_KEY}
+        try:
+            normalized = plugin.normalize_context(context)
+        except Exception:
+            # Only identical raw contexts coalesce; the call reports the error
+            normalized = context
+        return name, json.dumps(normalized, sort_keys=True, default=repr)
+
+    def _execute_batch_now(
+        self, name: str, contexts: List[Dict[str, Any]]
+    ) -> List[PluginResult]:
+        """Run a plugin batch on the calling thread, isolating failures"""
+        try:
+            with self._use_plugin(name) as plugin:
+                future = self._submit_to_process_pool(
+                    plugin, _execute_batch_in_worker, contexts
+                )
+                if future is not None:
+                    results = future.result()
+                else:
+                    results = plugin.execute_batch(contexts)
+                retired = self._is_retired(plugin)
+
+            if len(results) != len(contexts):
+                raise RuntimeError(
+                    f"execute_batch returned {len(results)} results "
+                    f"for {len(contexts)} contexts"
+                )
+        except Exception as e:
+            failure = self._failure_result(name, e)
+            return [replace(failure) for _ in contexts]
+
+        for context, result in zip(contexts, results):
+            result.plugin_name = name
+            if not retired:
+                self._store_result(name, context, result)
+        return results
+
+    def _cache_entry(
+        self, name: str, context: Dict[str, Any]
+    ) -> Tuple[Optional[ResultCache[PluginResult]], str]:
+        """Find the result cache and key for a call, if the plugin caches
+
+        Returns:
+            Cache (None if the plugin does not cache) and key
+        """
+        try:
+            plugin = self.plugins[name]
+        except Exception:
+            # Reported when the call itself fails to load the plugin
+            return None, ""
+
+        policy = plugin.cache_policy
+        if policy is None:
+            return None, ""
+
+        with self._caches_lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                cache = ResultCache(policy.max_entries, policy.ttl)
+                self._caches[name] = cache
+
+        if DEADLINE_KEY in context:
+            context = {k: v for k, v in context.items() if k != DEADLINE_KEY}
+        try:
+            key = policy.make_key(plugin.normalize_context(context))
+        except Exception as e:
+            # Run the call uncached; it reports the problem itself
+            self.logger.warning(f"Plugin {name} cannot cache this call: {e}")
+            return None, ""
+        return cache, key
+
+    def _cached_result(
+        self, name: str, context: Dict[str, Any]
+    ) -> Optional[PluginResult]:
+        """Get a memoized result for a call, if any"""
+        cache, key = self._cache_entry(name, context)
+        if cache is None:
+            return None
+
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        try:
+            self.plugins[name].on_cache_hit(context)
+        except Exception as e:
+            self.logger.warning(f"Plugin {name} cache hit hook failed: {e}")
+        # Callers own their result: edits must not reach the cache
+        return replace(cached, plugin_name=name, data=deepcopy(cached.data))
+
+    def _store_result(
+        self, name: str, context: Dict[str, Any], result: PluginResult
+    ) -> None:
+        """Memoize a successful result if the plugin caches"""
+        if not result.success:
+            return
+
+        cache, key = self._cache_entry(name, context)
+        if cache is not None:
+            cache.put(key, replace(result, data=deepcopy(result.data)))
+
+    def _drop_cache(self, name: str) -> None:
+        """Forget memoized results of a plugin that is being replaced"""
+        with self._caches_lock:
+            self._caches.pop(name, None)
+
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """Get result cache counters per plugin
+
+        Returns:
+            Mapping of plugin name to cache statistics, for plugins that
+            have cached at least once
+        """
+        with self._caches_lock:
+            caches = dict(self._caches)
+        return {name: cache.stats for name, cache in caches.items()}
+
+    def clear_cache(self, name: Optional[str] = None) -> None:
+        """Drop memoized results
+
+        Args:
+            name: Plugin whose results to drop (default: all plugins)
+        """
+        with self._caches_lock:
+            if name is None:
+                caches = list(self._caches.values())
+            else:
+                caches = [self._caches[name]] if name in self._caches else []
+        for cache in caches:
+            cache.clear()
+
+    def _submit_to_process_pool(
+        self, plugin: BasePlugin, worker_func: Callable[..., Any], payload: Any
+    ) -> Optional[Future]:
+        """Submit a plugin call to the worker process pool if it asks for one
+
+        Args:
+            plugin: Plugin to run
+            worker_func: Module-level function running the plugin in a worker
+            payload: Context (or contexts) passed to worker_func
+
+        Returns:
+            Future of the result, or None if the plugin runs in-process
+        """
+        if plugin.execution_mode != "process":
+            return None
+
+        import_path = plugin_import_path(type(plugin))
+        if import_path is None:
+            self.logger.warning(
+                f"Plugin {plugin.name} cannot be imported by worker processes, "
+                "running it in-process"
+            )
+            return None
+
+        return self._get_process_pool().submit(
+            worker_func, import_path, plugin.config, payload
+        )
+
+    def _get_process_pool(self) -> "ProcessPoolExecutor":
+        """Get the persistent worker process pool, starting it on first use"""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # spawn avoids forking a process that may be running threads
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers or os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self.logger.info("Started plugin worker process pool")
+            return self._process_pool
+
+    def close(self) -> None:
+        """Release resources held by the manager
+
+        Closes loaded plugins, shuts down worker processes and closes pooled
+        HTTP connections.
+        """
+        for name in list(self.plugins):
+            if self.plugins.is_loaded(name):
+                self._close_plugin(self.plugins[name])
+        with self._active_lock:
+            retired = list(self._retired.values())
+            self._retired.clear()
+        for plugin in retired:
+            self._close_plugin(plugin)
+
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+        self.http.close()
+
+    def __enter__(self) -> "PluginManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _resolve_deadline(
+        self, context: Dict[str, Any], timeout: Optional[float]
+    ) -> Optional[float]:
+        """Combine an explicit or default timeout with a context deadline
+
+        Returns:
+            Earliest applicable time.monotonic() deadline, or None
+        """
+        candidates = []
+        if (deadline := context.get(DEADLINE_KEY)) is not None:
+            candidates.append(deadline)
+
+        if timeout is None:
+            timeout = self.default_timeout
+        if timeout is not None:
+            candidates.append(time.monotonic() + timeout)
+
+        return min(candidates) if candidates else None
+
+    def _not_found_result(self, name: str) -> PluginResult:
+        """Build the result returned for an unknown plugin name"""
+        return PluginResult(
+            success=False,
+            error=f"Plugin '{name}' not found",
+            plugin_name=name,
+        )
+
+    def _failure_result(self, name: str, error: Exception) -> PluginResult:
+        """Log a plugin failure and build the matching result"""
+        self.logger.error(f"Plugin {name} execution failed: {error}")
+        return PluginResult(success=False, error=str(error), plugin_name=name)
+
+    def _timeout_result(self, name: str, budget: float) -> PluginResult:
+        """Log an abandoned plugin call and build the matching result"""
+        self.logger.warning(f"Plugin {name} timed out after {budget:.2f}s")
+        return PluginResult(
+            success=False,
+            error=f"Plugin '{name}' timed out after {budget:.2f}s",
+            plugin_name=name,
+        )
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-plugin execution statistics
+
+        Returns:
+            Mapping of plugin name to call counts and latency percentiles
+            (empty if statistics collection is disabled)
+        """
+        return self.stats.snapshot() if self.stats is not None else {}
 
     def get_plugin_help(self, name: Optional[str] = None) -> str:
         """Get help for plugins
@@ -206,14 +1564,27 @@ class PluginManager:
             Help text
         """
         if name:
-            plugin = self.get_plugin(name)
-            if plugin:
-                return plugin.get_help()
-            else:
+            if name not in self.plugins:
                 return f"Plugin '{name}' not found"
+            if self.plugins.is_loaded(name):
+                return self.plugins[name].get_help()
+
+            try:
+                plugin_class = self.plugins.plugin_class(name)
+            except Exception as e:
+                self.logger.error(f"Failed to load plugin {name}: {e}")
+                return f"Plugin '{name}' not found"
+            get_help = inspect.getattr_static(plugin_class, "get_help")
+            if isinstance(get_help, classmethod):
+                return plugin_class.get_help()
+
+            # Help written as an instance method needs the plugin itself
+            plugin = self.get_plugin(name)
+            return plugin.get_help() if plugin else f"Plugin '{name}' not found"
         else:
             # Return help for all plugins
             help_text = "Available plugins:\n"
-            for plugin_name, plugin in self.plugins.items():
-                help_text += f"  {plugin_name}: {plugin.description}\n"
+            for plugin_name in self.plugins:
+                description = self.plugins.description(plugin_name)
+                help_text += f"  {plugin_name}: {description}\n"
             return help_text
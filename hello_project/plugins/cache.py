@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+In-process result cache for plugin executions
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Plugin-declared memoization policy enforced by PluginManager"""
+
+    ttl: float = 60.0  # Seconds a successful result stays valid
+    max_entries: int = 128
+    # Context keys that determine the result; None means the whole context
+    key_fields: Optional[Tuple[str, ...]] = None
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0:
+            raise ValueError("Cache ttl must be positive")
+        if self.max_entries < 1:
+            raise ValueError("Cache max_entries must be at least 1")
+
+    @classmethod
+    def from_config(
+        cls, config: Dict[str, Any], default: Optional["CachePolicy"] = None
+    ) -> "CachePolicy":
+        """Build a policy from a plugin "cache" config section
+
+        Args:
+            config: Mapping with optional ttl, max_entries and key_fields
+            default: Policy supplying values missing from config
+
+        Returns:
+            Cache policy
+        """
+        default = default or cls()
+        key_fields = config.get("key_fields", default.key_fields)
+        return cls(
+            ttl=float(config.get("ttl", default.ttl)),
+            max_entries=int(config.get("max_entries", default.max_entries)),
+            key_fields=tuple(key_fields) if key_fields is not None else None,
+        )
+
+    def make_key(self, context: Dict[str, Any]) -> str:
+        """Build the cache key for an execution context
+
+        Args:
+            context: Execution context
+
+        Returns:
+            Canonical key string
+        """
+        if self.key_fields is None:
+            relevant = context
+        else:
+            relevant = {field: context.get(field) for field in self.key_fields}
+        return json.dumps(relevant, sort_keys=True, default=repr)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # Entries dropped to make room (LRU)
+    expirations: int = 0  # Entries dropped because their ttl passed
+    size: int = 0
+
+
+class ResultCache(Generic[V]):
+    """Thread-safe bounded LRU cache with per-entry expiry"""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache
+
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after being stored
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, V]]" = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[V]:
+        """Get a live entry, marking it most recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return value
+
+                del self._entries[key]
+                self._stats.expirations += 1
+
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: str, value: V) -> None:
+        """Store an entry, evicting the least recently used if full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries, keeping the counters"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                size=len(self._entries),
+            )
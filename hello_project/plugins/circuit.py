@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Circuit breaker for plugins that depend on network services
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+def is_upstream_failure(error: Exception) -> bool:
+    """Decide whether an exception means the upstream service is unhealthy
+
+    HTTP client errors (4xx other than 429) show the service answered, e.g.
+    for an unknown city, so they do not count towards opening the circuit.
+
+    Args:
+        error: Exception raised by the upstream call
+
+    Returns:
+        True if the error should count as an upstream failure
+    """
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        return True
+    return not (400 <= status < 500 and status != 429)
+
+
+class CircuitBreaker:
+    """Stops calling an upstream service after repeated failures
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    are rejected immediately with CircuitOpenError. Once reset_timeout has
+    passed, up to half_open_max_calls probe calls are let through: a
+    successful probe closes the circuit again, a failed one re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Optional[Callable[[Exception], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize circuit breaker
+
+        Args:
+            name: Name of the protected upstream, used in logs and errors
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before probing
+            half_open_max_calls: Concurrent probe calls allowed when half open
+            is_failure: Predicate deciding whether an exception counts as an
+                upstream failure (default: every exception does)
+            clock: Monotonic time source
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if reset_timeout < 0:
+            raise ValueError("reset_timeout must not be negative")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._is_failure = is_failure or (lambda e: True)
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(f"circuit.{name}")
+
+    @classmethod
+    def from_config(
+        cls,
+        name: str,
+        config: Dict[str, Any],
+        is_failure: Optional[Callable[[Exception], bool]] = None,
+    ) -> "CircuitBreaker":
+        """Build a circuit breaker from a plugin "circuit_breaker" config section
+
+        Args:
+            name: Name of the protected upstream
+            config: Mapping with optional failure_threshold, reset_timeout and
+                half_open_max_calls
+            is_failure: Predicate deciding whether an exception counts
+
+        Returns:
+            Circuit breaker
+        """
+        return cls(
+            name,
+            failure_threshold=int(config.get("failure_threshold", 5)),
+            reset_timeout=float(config.get("reset_timeout", 30.0)),
+            half_open_max_calls=int(config.get("half_open_max_calls", 1)),
+            is_failure=is_failure,
+        )
+
+    @property
+    def state(self) -> str:
+        """Current state (closed, open or half_open)"""
+        with self._lock:
+            if self._state == self.OPEN and self._reset_elapsed():
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a call may go to the upstream now
+
+        A True result in the half-open state reserves a probe slot, so every
+        allowed call must be followed by record_success or record_failure.
+
+        Returns:
+            True if the call may proceed
+        """
+        with self._lock:
+            if self._state == self.OPEN:
+                if not self._reset_elapsed():
+                    return False
+                self._state = self.HALF_OPEN
+                self._probes = 0
+                self.logger.info(f"Circuit {self.name} half open, probing")
+
+            if self._state == self.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    return False
+                self._probes += 1
+
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful upstream call"""
+        with self._lock:
+            if self._state != self.CLOSED:
+                self.logger.info(f"Circuit {self.name} closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def record_failure(self) -> None:
+        """Record a failed upstream call"""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._failures >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    self.logger.warning(
+                        f"Circuit {self.name} opened after "
+                        f"{self._failures} failure(s)"
+                    )
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probes = 0
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call func through the circuit breaker
+
+        Args:
+            func: Upstream call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(f"Circuit {self.name} is open")
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if self._is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+
+        self.record_success()
+        return result
+
+    def reset(self) -> None:
+        """Force the circuit closed"""
+        self.record_success()
+
+    def _reset_elapsed(self) -> bool:
+        return self._clock() - self._opened_at >= self.reset_timeout
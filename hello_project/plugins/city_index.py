@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Bundled city table resolving free-form city input to canonical city IDs
+"""
+import mmap
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+CITY_TABLE = Path(__file__).parent / "data" / "cities.tsv"
+
+
+def normalize_city(city: str) -> str:
+    """Normalize a city name for lookups and cache keys
+
+    Args:
+        city: City name as entered
+
+    Returns:
+        Case-folded name with surrounding and repeated whitespace removed
+    """
+    return " ".join(city.split()).casefold()
+
+
+def split_country(city: str) -> Tuple[str, Optional[str]]:
+    """Split an optional trailing country code off city input
+
+    Args:
+        city: City input such as "Tokyo" or "Tokyo, JP"
+
+    Returns:
+        Normalized city name and upper-case country code (or None)
+    """
+    name, sep, country = city.rpartition(",")
+    country = country.strip()
+    if sep and len(country) == 2 and country.isalpha():
+        return normalize_city(name), country.upper()
+    return normalize_city(city), None
+
+
+@dataclass(frozen=True)
+class City:
+    """Canonical city entry"""
+
+    id: int  # OpenWeatherMap city ID
+    name: str
+    country: str
+
+
+class CityIndex:
+    """Read-only city table searched in place through a memory map
+
+    The table is UTF-8 text with one tab-separated row per name or alias:
+    normalized name, rank, country code, city ID and display name. Rows are
+    sorted by name bytes, then rank, so a name is found by binary search and
+    the lowest rank (most prominent city) comes first. The file is mapped on
+    the first lookup and never parsed as a whole.
+    """
+
+    def __init__(self, path: Path = CITY_TABLE):
+        """Initialize city index
+
+        Args:
+            path: City table file
+        """
+        self.path = Path(path)
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    def _data(self) -> mmap.mmap:
+        if self._map is None:
+            with self._lock:
+                if self._map is None:
+                    with open(self.path, "rb") as f:
+                        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _rows(self, name: bytes) -> Iterator[bytes]:
+        """Yield the rows of a normalized name in rank order"""
+        data = self._data()
+        lo, hi = 0, len(data)
+        # lo and hi always sit on row starts; find the first row >= name
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b"\n", 0, mid) + 1
+            end = data.find(b"\n", start)
+            end = len(data) if end < 0 else end
+            if data[start:end].split(b"\t", 1)[0] < name:
+                lo = end + 1
+            else:
+                hi = start
+
+        while lo < len(data):
+            end = data.find(b"\n", lo)
+            end = len(data) if end < 0 else end
+            row = data[lo:end]
+            if row.split(b"\t", 1)[0] != name:
+                return
+            yield row
+            lo = end + 1
+
+    def lookup(self, city: str) -> Optional[City]:
+        """Resolve city input to its canonical entry
+
+        Args:
+            city: City name, optionally followed by ", CC" (country code)
+
+        Returns:
+            Canonical city, or None if the table does not know it
+        """
+        name, country = split_country(city)
+        for row in self._rows(name.encode("utf-8")):
+            _, _, row_country, city_id, display = row.decode("utf-8").split("\t")
+            if country is None or row_country == country:
+                return City(id=int(city_id), name=display, country=row_country)
+        return None
+
+    def close(self) -> None:
+        """Unmap the table"""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+
+@lru_cache(maxsize=None)
+def default_city_index() -> CityIndex:
+    """Get the process-wide index over the bundled city table"""
+    return CityIndex()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Shared pooled HTTP client for plugins
+"""
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+
+@dataclass
+class HTTPConfig:
+    """Connection pool settings for the shared HTTP client"""
+
+    pool_size: int = 10  # Connections kept per host
+    max_retries: int = 2  # Retries for connection errors and 502/503/504
+    backoff_factor: float = 0.1
+    keep_alive: bool = True
+    timeout: float = 10.0  # Default request timeout in seconds
+
+
+class HTTPClient:
+    """Pooled keep-alive HTTP session shared by all plugins of a manager
+
+    The underlying requests.Session is only created (and requests imported)
+    on the first request. PluginManager owns the client and closes it.
+    """
+
+    def __init__(self, config: Optional[HTTPConfig] = None):
+        """Initialize HTTP client
+
+        Args:
+            config: Connection pool settings
+        """
+        self.config = config or HTTPConfig()
+        self._session: "Optional[requests.Session]" = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger("http_client")
+
+    @property
+    def session(self) -> "requests.Session":
+        """Pooled session, created on first use"""
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def _create_session(self) -> "requests.Session":
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Read timeouts are not retried: a request that timed out already
+        # used up the caller's time budget
+        retry = Retry(
+            total=self.config.max_retries,
+            read=0,
+            backoff_factor=self.config.backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_size,
+            pool_maxsize=self.config.pool_size,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+
+        self.logger.info(f"Opened HTTP session (pool size {self.config.pool_size})")
+        return session
+
+    def get(
+        self, url: str, timeout: Optional[float] = None, **kwargs: Any
+    ) -> "requests.Response":
+        """Send a GET request through the pooled session
+
+        Args:
+            url: Request URL
+            timeout: Request timeout in seconds (default: config.timeout)
+            **kwargs: Further arguments for requests.Session.get
+
+        Returns:
+            HTTP response
+        """
+        if timeout is None:
+            timeout = self.config.timeout
+        return self.session.get(url, timeout=timeout, **kwargs)
+
+    def close(self) -> None:
+        """Close pooled connections; a later request opens a new session"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+                self.logger.info("Closed HTTP session")
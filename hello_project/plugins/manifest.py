@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Persisted discovery manifest for external plugins
+"""
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("plugin_manifest")
+
+
+@dataclass
+class PluginClassInfo:
+    """Plugin class found in an external plugin file"""
+
+    attr: str  # Attribute name of the class inside the module
+    name: str
+    description: str
+
+
+@dataclass
+class ManifestEntry:
+    """Scan result for a single plugin file"""
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    classes: List[PluginClassInfo] = field(default_factory=list)
+
+
+def file_digest(path: Path) -> str:
+    """Compute the SHA-256 digest of a file
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PluginManifest:
+    """Cache of which plugin classes each external plugin file defines
+
+    Entries are keyed by resolved file path and validated against the file's
+    mtime and size. When those differ the file is hashed, and only files whose
+    content actually changed need to be imported and scanned again.
+    """
+
+    VERSION = 1
+    FILENAME = ".plugin_manifest.json"
+
+    def __init__(self, path: Path):
+        """Initialize manifest
+
+        Args:
+            path: Location of the persisted manifest file
+        """
+        self.path = Path(path)
+        self.entries: Dict[str, ManifestEntry] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load the manifest from disk, starting empty if it is unusable"""
+        self.entries = {}
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable plugin manifest {self.path}: {e}")
+            return
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            logger.info(f"Ignoring outdated plugin manifest {self.path}")
+            return
+
+        try:
+            for file_path, raw in data.get("files", {}).items():
+                self.entries[file_path] = self._entry_from_dict(raw)
+        except (TypeError, KeyError) as e:
+            logger.warning(f"Ignoring malformed plugin manifest {self.path}: {e}")
+            self.entries = {}
+
+    def save(self) -> None:
+        """Persist the manifest if it changed since it was loaded"""
+        if not self._dirty:
+            return
+
+        data = {
+            "version": self.VERSION,
+            "files": {
+                file_path: asdict(entry) for file_path, entry in self.entries.items()
+            },
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write plugin manifest {self.path}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def lookup(self, plugin_file: Path) -> Optional[ManifestEntry]:
+        """Get the cached entry for a file if it is still up to date
+
+        Args:
+            plugin_file: Plugin file to look up
+
+        Returns:
+            Cached entry, or None if the file is new or its content changed
+        """
+        key = self._key(plugin_file)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        stat = plugin_file.stat()
+        if entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+
+        # Touched but possibly unchanged (checkout, copy): compare content
+        if entry.size == stat.st_size and entry.sha256 == file_digest(plugin_file):
+            entry.mtime_ns = stat.st_mtime_ns
+            self._dirty = True
+            return entry
+
+        return None
+
+    def record(
+        self, plugin_file: Path, classes: List[PluginClassInfo]
+    ) -> ManifestEntry:
+        """Store the scan result for a file
+
+        Args:
+            plugin_file: Scanned plugin file
+            classes: Plugin classes the file defines
+
+        Returns:
+            Newly stored entry
+        """
+        stat = plugin_file.stat()
+        entry = ManifestEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            sha256=file_digest(plugin_file),
+            classes=classes,
+        )
+        self.entries[self._key(plugin_file)] = entry
+        self._dirty = True
+        return entry
+
+    def prune(self, plugin_files: Iterable[Path]) -> None:
+        """Drop entries for files that no longer exist
+
+        Args:
+            plugin_files: Files found in the current scan
+        """
+        keep = {self._key(plugin_file) for plugin_file in plugin_files}
+        for key in list(self.entries):
+            if key not in keep:
+                del self.entries[key]
+                self._dirty = True
+
+    @staticmethod
+    def _key(plugin_file: Path) -> str:
+        return str(plugin_file.resolve())
+
+    @staticmethod
+    def _entry_from_dict(raw: Dict[str, Any]) -> ManifestEntry:
+        return ManifestEntry(
+            mtime_ns=int(raw["mtime_ns"]),
+            size=int(raw["size"]),
+            sha256=str(raw["sha256"]),
+            classes=[PluginClassInfo(**info) for info in raw["classes"]],
+        )
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Locations of files shared by the plugins
+"""
+import os
+from pathlib import Path
+
+
+def default_cache_dir() -> Path:
+    """Get the per-user cache directory of Hello Project
+
+    Returns:
+        $XDG_CACHE_HOME/hello_project, or ~/.cache/hello_project
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "hello_project"
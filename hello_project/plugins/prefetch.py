@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Background prefetching of frequently requested cache entries
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+class PrefetchScheduler:
+    """Refreshes hot cache entries shortly before they expire
+
+    Callers record every request for a key and report how long the cached
+    entry stays fresh. A background thread periodically picks the top_k most
+    requested keys that expire within lead_time and refreshes them, with at
+    most max_workers refreshes in flight and at most rate_limit refreshes
+    per second overall. Request counts halve every half_life seconds so the
+    hot set follows changing demand.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[Any], None],
+        top_k: int = 50,
+        lead_time: float = 60.0,
+        max_workers: int = 2,
+        rate_limit: float = 1.0,
+        interval: float = 5.0,
+        half_life: float = 600.0,
+        min_requests: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize prefetch scheduler
+
+        Args:
+            refresh: Called with the recorded argument of a key to refresh it
+            top_k: Number of most requested keys kept warm
+            lead_time: Seconds before expiry at which a key is refreshed
+            max_workers: Maximum concurrent refreshes
+            rate_limit: Maximum refreshes per second
+            interval: Seconds between scheduling rounds
+            half_life: Seconds after which request counts are halved
+            min_requests: Requests needed before a key is prefetched
+            clock: Monotonic time source
+        """
+        if top_k < 1 or max_workers < 1:
+            raise ValueError("top_k and max_workers must be at least 1")
+        if rate_limit <= 0 or interval <= 0 or half_life <= 0:
+            raise ValueError("rate_limit, interval and half_life must be positive")
+
+        self.top_k = top_k
+        self.lead_time = lead_time
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        self.interval = interval
+        self.half_life = half_life
+        self.min_requests = min_requests
+        self._refresh = refresh
+        self._clock = clock
+
+        self._counts: Dict[str, float] = {}
+        self._args: Dict[str, Any] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._in_flight: Set[str] = set()
+        self._tokens = float(max_workers)
+        self._last_tick = clock()
+        self._last_decay = self._last_tick
+        self._lock = threading.Lock()
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.logger = logging.getLogger("prefetch")
+
+    @classmethod
+    def from_config(
+        cls, refresh: Callable[[Any], None], config: Dict[str, Any]
+    ) -> "PrefetchScheduler":
+        """Build a scheduler from a plugin "prefetch" config section
+
+        Args:
+            refresh: Called with the recorded argument of a key to refresh it
+            config: Mapping with optional top_k, lead_time, max_workers,
+                rate_limit, interval, half_life and min_requests
+
+        Returns:
+            Prefetch scheduler
+        """
+        return cls(
+            refresh,
+            top_k=int(config.get("top_k", 50)),
+            lead_time=float(config.get("lead_time", 60.0)),
+            max_workers=int(config.get("max_workers", 2)),
+            rate_limit=float(config.get("rate_limit", 1.0)),
+            interval=float(config.get("interval", 5.0)),
+            half_life=float(config.get("half_life", 600.0)),
+            min_requests=int(config.get("min_requests", 2)),
+        )
+
+    def record(self, key: str, arg: Any) -> None:
+        """Record a request for a key, starting the scheduler on first use
+
+        Args:
+            key: Cache key
+            arg: Argument passed to refresh for this key
+        """
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0.0) + 1.0
+            self._args[key] = arg
+            if self._thread is None and not self._stop.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name="prefetch-scheduler", daemon=True
+                )
+                self._thread.start()
+
+    def mark_fresh(self, key: str, fresh_for: float) -> None:
+        """Report how long the cached entry of a key stays fresh
+
+        Args:
+            key: Cache key
+            fresh_for: Seconds until the entry expires
+        """
+        with self._lock:
+            self._expires_at[key] = self._clock() + fresh_for
+
+    def due(self) -> List[Tuple[str, Any]]:
+        """List hot keys that expire within lead_time, hottest first
+
+        Returns:
+            (key, refresh argument) pairs
+        """
+        now = self._clock()
+        with self._lock:
+            hot = sorted(self._counts.items(), key=lambda item: -item[1])
+            return [
+                (key, self._args[key])
+                for key, count in hot[: self.top_k]
+                if count >= self.min_requests
+                and key not in self._in_flight
+                and key in self._expires_at
+                and self._expires_at[key] - now <= self.lead_time
+            ]
+
+    def run_pending(self) -> int:
+        """Start refreshes for due keys within the worker and rate budgets
+
+        Returns:
+            Number of refreshes started
+        """
+        now = self._clock()
+        with self._lock:
+            elapsed = now - self._last_tick
+            self._last_tick = now
+            self._tokens = min(
+                float(self.max_workers), self._tokens + elapsed * self.rate_limit
+            )
+            if now - self._last_decay >= self.half_life:
+                self._last_decay = now
+                self._counts = {
+                    key: count / 2
+                    for key, count in self._counts.items()
+                    if count / 2 >= 0.5 or key in self._in_flight
+                }
+                for key in list(self._args):
+                    if key not in self._counts:
+                        del self._args[key]
+                        self._expires_at.pop(key, None)
+
+        started = 0
+        for key, arg in self.due():
+            with self._lock:
+                if len(self._in_flight) >= self.max_workers or self._tokens < 1:
+                    break
+                self._tokens -= 1
+                self._in_flight.add(key)
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="prefetch"
+                    )
+                executor = self._executor
+            future = executor.submit(self._refresh, arg)
+            future.add_done_callback(
+                lambda f, key=key: self._refresh_done(key, f)  # type: ignore
+            )
+            started += 1
+        return started
+
+    def _refresh_done(self, key: str, future: "Future[None]") -> None:
+        with self._lock:
+            self._in_flight.discard(key)
+            error = future.exception()
+            if error is not None:
+                # Back off for lead_time instead of retrying every round
+                self._expires_at[key] = self._clock() + 2 * self.lead_time
+        if error is not None:
+            self.logger.warning(f"Prefetch of {key} failed: {error}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_pending()
+            except Exception as e:
+                self.logger.warning(f"Prefetch round failed: {e}")
+
+    def close(self) -> None:
+        """Stop scheduling and wait for running refreshes"""
+        self._stop.set()
+        with self._lock:
+            thread, executor = self._thread, self._executor
+            self._thread = self._executor = None
+        if thread is not None:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -3,11 +3,16 @@
 Quote plugin for Hello Project
 """
 import random
-from typing import Any, Dict
-
-import requests
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from .base import BasePlugin, PluginResult
+from .circuit import CircuitBreaker, CircuitOpenError, is_upstream_failure
+from .quote_buffer import QuoteBuffer
+from .quote_corpus import QuoteCorpus
+from .quote_index import Postings, QuoteIndex, normalize_tag
+from .quote_sampler import NoRepeatSampler
+from .quote_search import SearchIndex
 
 
 class QuotePlugin(BasePlugin):
@@ -17,17 +22,25 @@ class QuotePlugin(BasePlugin):
     description = "Get inspirational quotes"
     version = "1.0.0"
 
+    DEFAULT_BASE_URL = "https://api.quotable.io"
+    MAX_BULK_QUOTES = 50  # Largest limit accepted by /quotes/random
+    SEARCH_LIMIT = 5  # Default number of search results
+
     # Built-in quotes for offline usage
     BUILTIN_QUOTES = [
         {
             "text": ("The way to get started is to quit talking and begin doing."),
             "author": "Walt Disney",
+            "tags": ["inspirational", "motivational", "success"],
+            "language": "en",
         },
         {
             "text": (
                 "Life is what happens to you while you're " "busy making other plans."
             ),
             "author": "John Lennon",
+            "tags": ["wisdom"],
+            "language": "en",
         },
         {
             "text": (
@@ -35,6 +48,8 @@ class QuotePlugin(BasePlugin):
                 "in the beauty of their dreams."
             ),
             "author": "Eleanor Roosevelt",
+            "tags": ["inspirational", "motivational"],
+            "language": "en",
         },
         {
             "text": (
@@ -42,6 +57,8 @@ class QuotePlugin(BasePlugin):
                 "must focus to see the light."
             ),
             "author": "Aristotle",
+            "tags": ["inspirational", "wisdom"],
+            "language": "en",
         },
         {
             "text": (
@@ -49,14 +66,20 @@ class QuotePlugin(BasePlugin):
                 "it is the courage to continue that counts."
             ),
             "author": "Winston Churchill",
+            "tags": ["success", "motivational", "inspirational"],
+            "language": "en",
         },
         {
             "text": "プログラミングとは思考を整理する技術である。",
             "author": "Programming Wisdom",
+            "tags": ["wisdom"],
+            "language": "ja",
         },
         {
             "text": "コードは詩のように美しく、散文のように明確であるべきだ。",
             "author": "Code Philosophy",
+            "tags": ["wisdom", "inspirational"],
+            "language": "ja",
         },
     ]
 
@@ -70,55 +93,263 @@ class QuotePlugin(BasePlugin):
         self.use_api = self.config.get("use_api", False)
         self.category = self.config.get("category", "inspirational")
         self.language = self.config.get("language", "en")
+        self.base_url = self.config.get("base_url", self.DEFAULT_BASE_URL).rstrip("/")
+
+        # Local quotes: an external corpus file if configured, else the
+        # built-in list. Both are indexed by quote ID.
+        corpus = self.config.get("corpus")
+        self.quotes: Union[QuoteCorpus, Sequence[Dict[str, Any]]] = (
+            QuoteCorpus(corpus) if corpus else self.BUILTIN_QUOTES
+        )
+        self.local_source = "corpus" if corpus else "built-in"
+        self._quote_index: Optional[QuoteIndex] = None
+        self._default_ids: Optional[Postings] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._index_lock = threading.Lock()
+
+        # Walk a permutation of the local quotes per session instead of
+        # drawing them independently, so none repeats within a pass
+        no_repeat = self.config.get("no_repeat", False)
+        self.sampler: Optional[NoRepeatSampler] = (
+            NoRepeatSampler.from_config({} if no_repeat is True else no_repeat)
+            if no_repeat
+            else None
+        )
+        self.circuit_breaker = CircuitBreaker.from_config(
+            "quotable",
+            self.config.get("circuit_breaker", {}),
+            is_failure=is_upstream_failure,
+        )
+
+        # Serve API quotes from memory, refilled in bulk in the background.
+        # "buffer: false" requests a single quote per call instead.
+        buffer = self.config.get("buffer", True)
+        self.buffer: Optional[QuoteBuffer] = (
+            QuoteBuffer.from_config(
+                self._fetch_api_quotes,
+                {"capacity": self.MAX_BULK_QUOTES} if buffer is True else buffer,
+            )
+            if buffer and self.use_api
+            else None
+        )
 
     def execute(self, context: Dict[str, Any]) -> PluginResult:
         """Get a quote
 
         Args:
-            context: Execution context
+            context: Execution context. Optional "tags" (list or comma
+                separated) and "language" select a local quote carrying all
+                the tags, instead of one from the configured category;
+                "session" names the user or session whose no-repeat stream
+                to continue. "search" returns the local quotes matching its
+                terms instead, up to "limit" of them.
 
         Returns:
             Quote result
         """
+        if context.get("search"):
+            return self._search(context["search"], context.get("limit"))
+        ids = self._requested_ids(context)
+        if ids is not None:
+            return self._get_builtin_quote(ids, context)
         if self.use_api:
-            return self._get_api_quote()
+            return self._get_api_quote(context)
         else:
-            return self._get_builtin_quote()
+            return self._get_builtin_quote(context=context)
+
+    def execute_batch(self, contexts: List[Dict[str, Any]]) -> List[PluginResult]:
+        """Get one quote per context
+
+        Local quotes for a batch without tag filters or no-repeat streams
+        are drawn in a single pass.
+
+        Args:
+            contexts: Execution contexts
+
+        Returns:
+            Quote results, one per context
+        """
+        if (
+            self.use_api
+            or self.sampler is not None
+            or any(self._filters(c) or c.get("search") for c in contexts)
+        ):
+            return super().execute_batch(contexts)
+
+        ids = random.choices(self.default_ids, k=len(contexts))
+        return [self._builtin_result(self.quotes[quote_id]) for quote_id in ids]
+
+    @property
+    def quote_index(self) -> QuoteIndex:
+        """Tag and language index over the local quotes, built on first use"""
+        with self._index_lock:
+            if self._quote_index is None:
+                if isinstance(self.quotes, QuoteCorpus):
+                    self._quote_index = self.quotes.tag_index()
+                else:
+                    self._quote_index = QuoteIndex.build(enumerate(self.quotes))
+            return self._quote_index
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Full-text index over the local quotes, built on first use"""
+        with self._index_lock:
+            if self._search_index is None:
+                if isinstance(self.quotes, QuoteCorpus):
+                    self._search_index = self.quotes.search_index()
+                else:
+                    self._search_index = SearchIndex()
+                    self._search_index.sync(self.quotes)
+            return self._search_index
+
+    @property
+    def default_ids(self) -> Postings:
+        """IDs of the local quotes matching the configured category and language
+
+        Falls back to all quotes in the language, then to all quotes, if
+        nothing matches.
+        """
+        if self._default_ids is None:
+            index = self.quote_index
+            ids = index.ids([self.category], self.language)
+            if not ids:
+                ids = index.ids(language=self.language) or range(len(self.quotes))
+                self.logger.warning(
+                    f"No {self.language} quotes in category {self.category}, "
+                    "using other local quotes"
+                )
+            self._default_ids = ids
+        return self._default_ids
+
+    def _filters(self, context: Dict[str, Any]) -> Optional[Tuple[List[str], str]]:
+        """Get the normalized tag filters of a context
+
+        Args:
+            context: Execution context
+
+        Returns:
+            Tags and language, or None if the context has no filters
+        """
+        tags = context.get("tags")
+        if not (tags or context.get("language")):
+            return None
+        if isinstance(tags, str):
+            tags = tags.split(",")
+        tags = [normalize_tag(tag) for tag in tags or [self.category] if tag.strip()]
+        return tags, normalize_tag(context.get("language") or self.language)
+
+    def _requested_ids(self, context: Dict[str, Any]) -> Optional[Postings]:
+        """Get the local quote IDs matching the tag filters of a context
+
+        Args:
+            context: Execution context
+
+        Returns:
+            Matching quote IDs, or None if the context has no filters
+        """
+        filters = self._filters(context)
+        return None if filters is None else self.quote_index.ids(*filters)
+
+    def _stream(self, context: Dict[str, Any]) -> str:
+        """Get the no-repeat stream key of a context: session and filters"""
+        tags, language = self._filters(context) or ([self.category], self.language)
+        session = str(context.get("session") or "default")
+        return "\t".join([session, ",".join(tags), language])
+
+    def _get_builtin_quote(
+        self, ids: Optional[Postings] = None, context: Optional[Dict[str, Any]] = None
+    ) -> PluginResult:
+        """Get a random local quote (built-in or from the corpus)
+
+        Args:
+            ids: Quote IDs to choose from (default: default_ids)
+            context: Execution context, naming the no-repeat stream
+
+        Returns:
+            Quote result with local quote, or an error if ids is empty
+        """
+        ids = self.default_ids if ids is None else ids
+        if not ids:
+            return PluginResult(
+                success=False,
+                error="No quotes match the requested tags",
+                plugin_name=self.name,
+            )
+        if self.sampler is not None:
+            position = self.sampler.next(self._stream(context or {}), len(ids))
+        else:
+            position = random.randrange(len(ids))
+        return self._builtin_result(self.quotes[ids[position]])
 
-    def _get_builtin_quote(self) -> PluginResult:
-        """Get a random built-in quote
+    def _search(self, query: str, limit: Optional[int] = None) -> PluginResult:
+        """Search the local quotes
+
+        Args:
+            query: Search terms, matched against quote texts and authors
+            limit: Maximum number of results (default: SEARCH_LIMIT)
 
         Returns:
-            Quote result with built-in quote
+            Matching quotes, most relevant first
         """
-        quote = random.choice(self.BUILTIN_QUOTES)
+        matches = self.search_index.search(query, int(limit or self.SEARCH_LIMIT))
+        quotes = []
+        for quote_id, score in matches:
+            quote = self.quotes[quote_id]
+            quotes.append(
+                {
+                    "id": quote_id,
+                    "text": quote["text"],
+                    "author": quote["author"],
+                    "score": round(score, 3),
+                }
+            )
+        return PluginResult(
+            success=True,
+            data={"query": query, "quotes": quotes, "source": self.local_source},
+            plugin_name=self.name,
+        )
+
+    def _builtin_result(self, quote: Dict[str, Any]) -> PluginResult:
+        """Build the result for a local quote
 
+        Args:
+            quote: Built-in or corpus quote entry
+
+        Returns:
+            Quote result with local quote
+        """
         return PluginResult(
             success=True,
             data={
                 "text": quote["text"],
                 "author": quote["author"],
-                "source": "built-in",
+                "source": self.local_source,
             },
             plugin_name=self.name,
         )
 
-    def _get_api_quote(self) -> PluginResult:
+    def _get_api_quote(self, context: Dict[str, Any]) -> PluginResult:
         """Get quote from external API
 
+        Quotes come from the buffer when enabled, which only blocks on the
+        API while it is empty. Falls back to a built-in quote if no API quote
+        is available, or immediately while the circuit breaker considers the
+        API down.
+
+        Args:
+            context: Execution context, used for its deadline
+
         Returns:
             Quote result from API
         """
         try:
-            # Using a free quote API
-            response = requests.get(
-                "https://api.quotable.io/random",
-                params={"tags": self.category},
-                timeout=10,
-            )
-            response.raise_for_status()
-
-            data = response.json()
+            timeout = self.request_timeout(context)
+            if self.buffer is not None:
+                data = self.buffer.get(timeout)
+                if data is None:
+                    return self._get_builtin_quote()
+            else:
+                data = self.circuit_breaker.call(self._fetch_api_quote, timeout)
 
             return PluginResult(
                 success=True,
@@ -130,12 +361,76 @@ class QuotePlugin(BasePlugin):
                 plugin_name=self.name,
             )
 
+        except CircuitOpenError:
+            self.logger.debug("Quote API circuit open, using built-in quotes")
+            return self._get_builtin_quote()
         except Exception as e:
             self.logger.warning(
                 f"API request failed, falling back to built-in quotes: {e}"
             )
             return self._get_builtin_quote()
 
+    def _fetch_api_quote(self, timeout: float) -> Dict[str, Any]:
+        """Fetch a random quote from the external API
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            Quote payload from the API
+        """
+        # Using a free quote API
+        response = self.http_get(
+            f"{self.base_url}/random",
+            params={"tags": self.category},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+
+        return response.json()
+
+    def _fetch_api_quotes(
+        self, count: int, timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch several random quotes from the external API in one request
+
+        Args:
+            count: Number of quotes (at most MAX_BULK_QUOTES are requested)
+            timeout: Request timeout in seconds (default: configured timeout)
+
+        Returns:
+            Quote payloads from the API
+        """
+        return self.circuit_breaker.call(
+            self._request_api_quotes,
+            min(count, self.MAX_BULK_QUOTES),
+            self.request_timeout({}) if timeout is None else timeout,
+        )
+
+    def _request_api_quotes(self, count: int, timeout: float) -> List[Dict[str, Any]]:
+        """Request random quotes from the multi-result endpoint"""
+        response = self.http_get(
+            f"{self.base_url}/quotes/random",
+            params={"limit": count, "tags": self.category},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+
+        return response.json()
+
+    def close(self) -> None:
+        """Wait for a running background buffer refill and unmap the corpus"""
+        if self.buffer is not None:
+            self.buffer.close()
+        if self.sampler is not None:
+            self.sampler.close()
+        if isinstance(self.quotes, QuoteCorpus):
+            self.quotes.close()
+            self._quote_index = None
+        elif self._search_index is not None:
+            self._search_index.close()
+        self._search_index = None
+
     def validate_config(self) -> bool:
         """Validate plugin configuration
 
@@ -153,27 +448,52 @@ class QuotePlugin(BasePlugin):
 
         return True
 
-    def get_help(self) -> str:
+    @classmethod
+    def get_help(cls) -> str:
         """Get help text for quote plugin
 
         Returns:
             Help text
         """
-        return f"""Quote Plugin ({self.version})
-Description: {self.description}
+        return f"""Quote Plugin ({cls.version})
+Description: {cls.description}
 
 Usage: --plugin quote
 
+Context:
+  - tags: Only quotes carrying all these tags (list or comma separated)
+  - language: Only quotes in this language
+  - session: User or session whose no-repeat stream to continue
+  - search: Find local quotes whose text or author contain all these
+    terms, ranked by relevance (limit: number of results, default: 5)
+
 Configuration:
   - use_api: Use external API for quotes (default: false)
   - category: Quote category (inspirational, motivational, wisdom, success)
   - language: Language preference (default: en)
+  Local quotes are drawn from the configured category and language,
+  falling back to the language alone if no quote matches both.
+  - corpus: JSON Lines quote file used instead of the built-in quotes
+    (one object with text and author per line, indexed on first use)
+  - no_repeat: Never repeat a local quote until all were shown, per
+    session (seed, persist, path; persist keeps positions across runs)
+  - base_url: API base URL (default: https://api.quotable.io)
+  - timeout: API request timeout in seconds (default: 10)
+  - buffer: Serve API quotes from a buffer refilled in bulk in the
+    background (capacity, low_water; default: 50 and 10), or false to
+    request one quote per call
+  - circuit_breaker: Skip the API while it is down (failure_threshold,
+    reset_timeout, half_open_max_calls; default: 5 failures, 30 s)
 
 Features:
   - Built-in quotes (no internet required)
+  - Memory-mapped quote corpora of millions of quotes
+  - Full-text search in English and Japanese
   - External API integration (quotable.io)
   - Multiple categories
+  - Prefetched API quotes served from memory
   - Fallback to built-in quotes if API fails
+  - Circuit breaker for instant fallback during API outages
 
 Example config.yaml:
   plugins:
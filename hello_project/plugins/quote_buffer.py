@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Prefetching ring buffer of API quotes
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+Quote = Dict[str, Any]
+
+
+class QuoteBuffer:
+    """Fixed-capacity buffer of quotes fetched from an API in bulk
+
+    get() serves quotes from memory in O(1). Once the buffer drains below
+    low_water a background thread fetches enough quotes to fill it again;
+    only when it is completely empty does get() fetch synchronously. At most
+    one fetch runs at a time.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int, Optional[float]], List[Quote]],
+        capacity: int = 50,
+        low_water: int = 10,
+    ):
+        """Initialize quote buffer
+
+        Args:
+            fetch: Called with a quote count and a timeout (None for the
+                default) to fetch that many quotes
+            capacity: Maximum number of buffered quotes
+            low_water: Buffer level that triggers a background refill
+        """
+        if capacity < 1:
+            raise ValueError("Buffer capacity must be at least 1")
+        if not 0 <= low_water < capacity:
+            raise ValueError("Buffer low_water must be between 0 and capacity - 1")
+
+        self.capacity = capacity
+        self.low_water = low_water
+        self._fetch = fetch
+        self._quotes: Deque[Quote] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._fill_lock = threading.Lock()  # Serializes fetches
+        self._refill_thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger("quote_buffer")
+
+    @classmethod
+    def from_config(
+        cls,
+        fetch: Callable[[int, Optional[float]], List[Quote]],
+        config: Dict[str, Any],
+    ) -> "QuoteBuffer":
+        """Build a buffer from a quote plugin "buffer" config section
+
+        Args:
+            fetch: Bulk quote fetch function
+            config: Mapping with optional capacity and low_water
+
+        Returns:
+            Quote buffer
+        """
+        capacity = int(config.get("capacity", 50))
+        return cls(
+            fetch,
+            capacity=capacity,
+            low_water=int(config.get("low_water", min(10, capacity - 1))),
+        )
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Quote]:
+        """Take the next quote
+
+        Args:
+            timeout: Time budget for refilling the buffer if it is empty,
+                including waiting for a refill already in progress
+
+        Returns:
+            Quote, or None if the buffer is empty and refilling it failed or
+            did not finish in time
+
+        Raises:
+            Exception: Whatever the synchronous fetch raised
+        """
+        quote = self._pop()
+        if quote is None:
+            self.fill(timeout)
+            quote = self._pop()
+        return quote
+
+    def _pop(self) -> Optional[Quote]:
+        with self._lock:
+            if not self._quotes:
+                return None
+            quote = self._quotes.popleft()
+            refill = len(self._quotes) < self.low_water and (
+                self._refill_thread is None or not self._refill_thread.is_alive()
+            )
+            if refill:
+                self._refill_thread = threading.Thread(
+                    target=self._refill_in_background, name="quote-refill", daemon=True
+                )
+                self._refill_thread.start()
+            return quote
+
+    def fill(self, timeout: Optional[float] = None) -> int:
+        """Fetch quotes until the buffer is full
+
+        Args:
+            timeout: Time budget for waiting on a fill in progress and then
+                fetching (None for the default fetch timeout, waiting as
+                long as it takes)
+
+        Returns:
+            Number of quotes added (0 if the budget ran out first)
+        """
+        if not self._fill_lock.acquire(blocking=False):
+            # Another fill is running: wait for it within the budget
+            started = time.monotonic()
+            if not self._fill_lock.acquire(timeout=-1 if timeout is None else timeout):
+                return 0
+            if timeout is not None:
+                timeout -= time.monotonic() - started
+        try:
+            missing = self.capacity - len(self._quotes)
+            if missing <= 0 or (timeout is not None and timeout <= 0):
+                return 0
+            quotes = self._fetch(missing, timeout)[:missing]
+            with self._lock:
+                self._quotes.extend(quotes)
+            return len(quotes)
+        finally:
+            self._fill_lock.release()
+
+    def _refill_in_background(self) -> None:
+        try:
+            self.fill()
+        except Exception as e:
+            self.logger.warning(f"Quote buffer refill failed: {e}")
+
+    def close(self) -> None:
+        """Wait for a running background refill"""
+        with self._lock:
+            thread = self._refill_thread
+        if thread is not None:
+            thread.join()
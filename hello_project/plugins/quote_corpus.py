@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped quote corpus with a persistent offset index
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .paths import default_cache_dir
+from .quote_index import QuoteIndex
+from .quote_search import SearchIndex
+
+Quote = Dict[str, Any]
+
+
+def write_corpus(path: Path, quotes: Iterable[Quote]) -> int:
+    """Write quotes in the corpus format
+
+    Args:
+        path: Corpus file to create
+        quotes: Quotes with text, author and optional tags and language
+
+    Returns:
+        Number of quotes written
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for quote in quotes:
+            f.write(json.dumps(quote, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    return count
+
+
+class QuoteCorpus:
+    """Read-only quote corpus accessed in place through memory maps
+
+    The corpus is UTF-8 JSON Lines, one quote object per line (text, author
+    and optional tags and language); blank lines are ignored. A quote's ID is
+    its position among the non-blank lines. The offset index stores where
+    every quote starts, as 32-bit offsets (64-bit for corpora over 4 GiB),
+    behind a header recording the corpus size and mtime. It is built on first
+    open, rebuilt when the corpus changes and replaced atomically, so
+    processes sharing a corpus also share its index and page cache. Only
+    the quotes actually read are ever decoded.
+    """
+
+    MAGIC = b"HPQIDX01"
+    # magic, quote count, corpus size, corpus mtime (ns), offset width
+    HEADER = struct.Struct("<8sQQqB7x")
+
+    def __init__(self, path: Path, index_path: Optional[Path] = None):
+        """Initialize quote corpus
+
+        Args:
+            path: Corpus file
+            index_path: Offset index file (default: derived from the
+                corpus path in the per-user cache directory)
+        """
+        self.path = Path(path).expanduser()
+        self.index_path = Path(index_path) if index_path else self._default_index()
+        self._maps: Optional[Tuple[mmap.mmap, mmap.mmap]] = None
+        self._tag_index: Optional[QuoteIndex] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._count = 0
+        self._stamp = (0, 0)  # Corpus (size, mtime ns) the maps belong to
+        self._inode = 0
+        self._offsets = "<II"
+        self._width = 4
+        self._lock = threading.Lock()
+
+    def _default_index(self) -> Path:
+        resolved = str(self.path.resolve()).encode("utf-8")
+        digest = hashlib.blake2b(resolved, digest_size=8).hexdigest()
+        return default_cache_dir() / "quotes" / f"{self.path.stem}-{digest}.idx"
+
+    def _open(self) -> Tuple[mmap.mmap, mmap.mmap]:
+        """Map the corpus and a current index, building the index if needed"""
+        if self._maps is None:
+            with self._lock:
+                if self._maps is None:
+                    stat = self.path.stat()
+                    index = self._map_index(stat)
+                    if index is None:
+                        self.build_index()
+                        index = self._map_index(stat)
+                        if index is None:
+                            raise RuntimeError(
+                                f"Quote corpus changed while indexing: {self.path}"
+                            )
+                    self._maps = (self._map(self.path), index)
+        return self._maps
+
+    @staticmethod
+    def _map(path: Path) -> mmap.mmap:
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _map_index(self, stat: os.stat_result) -> Optional[mmap.mmap]:
+        """Map the index if it exists and matches the corpus"""
+        try:
+            index = self._map(self.index_path)
+        except (OSError, ValueError):  # Missing or empty
+            return None
+
+        if len(index) >= self.HEADER.size:
+            magic, count, size, mtime_ns, width = self.HEADER.unpack_from(index)
+            if (
+                magic == self.MAGIC
+                and (size, mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+                and width in (4, 8)
+                and len(index) == self.HEADER.size + (count + 1) * width
+            ):
+                self._count = count
+                self._stamp = (size, mtime_ns)
+                self._inode = stat.st_ino
+                self._width = width
+                self._offsets = "<II" if width == 4 else "<QQ"
+                return index
+        index.close()
+        return None
+
+    def build_index(self) -> int:
+        """Scan the corpus and write its offset index
+
+        Returns:
+            Number of quotes in the corpus
+        """
+        stat = self.path.stat()
+        offsets = array("Q")
+        if stat.st_size:
+            data = self._map(self.path)
+            try:
+                start, size = 0, len(data)
+                while start < size:
+                    end = data.find(b"\n", start)
+                    end = size if end < 0 else end + 1
+                    if data[start:end].strip():
+                        offsets.append(start)
+                    start = end
+            finally:
+                data.close()
+        count = len(offsets)
+        offsets.append(stat.st_size)  # End of the last quote
+
+        width = 4 if stat.st_size < 2**32 else 8
+        if width == 4:
+            offsets = array("I", offsets)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(
+                self.HEADER.pack(
+                    self.MAGIC, count, stat.st_size, stat.st_mtime_ns, width
+                )
+            )
+            offsets.tofile(f)
+        os.replace(tmp_path, self.index_path)
+        return count
+
+    def __len__(self) -> int:
+        self._open()
+        return self._count
+
+    def __getitem__(self, quote_id: int) -> Quote:
+        """Read one quote by ID
+
+        Args:
+            quote_id: Quote ID (negative IDs count from the end)
+
+        Returns:
+            Quote with its id added
+
+        Raises:
+            IndexError: If the ID is out of range
+        """
+        data, index = self._open()
+        if quote_id < 0:
+            quote_id += self._count
+        if not 0 <= quote_id < self._count:
+            raise IndexError(f"Quote ID out of range: {quote_id}")
+
+        start, end = struct.unpack_from(
+            self._offsets, index, self.HEADER.size + quote_id * self._width
+        )
+        quote = json.loads(data[start:end])
+        quote["id"] = quote_id
+        return quote
+
+    def random(self, rng: Optional[random.Random] = None) -> Quote:
+        """Read a uniformly random quote
+
+        Args:
+            rng: Random generator (default: the random module)
+
+        Returns:
+            Quote with its id added
+        """
+        return self[(rng or random).randrange(len(self))]
+
+    def _scan(self) -> Iterator[Tuple[int, Quote]]:
+        """Decode every quote in ID order, reading the corpus sequentially"""
+        quote_id = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield quote_id, json.loads(line)
+                    quote_id += 1
+
+    def tag_index(self) -> QuoteIndex:
+        """Get the tag and language index of the corpus
+
+        The index is saved next to the offset index the first time it is
+        needed and rebuilt, like the offset index, when the corpus changes.
+
+        Returns:
+            Quote index
+        """
+        self._open()
+        with self._lock:
+            if self._tag_index is None:
+                path = self.index_path.with_suffix(".tags")
+                index = QuoteIndex.load(path, self._stamp)
+                if index is None:
+                    index = QuoteIndex.build(self._scan())
+                    index.save(path, self._stamp)
+                self._tag_index = index
+            return self._tag_index
+
+    def search_index(self) -> SearchIndex:
+        """Get the full-text index of the corpus
+
+        The index is kept next to the offset index. Quotes appended to the
+        corpus since the index was last synced are indexed first; any other
+        change to the corpus rebuilds it.
+
+        Returns:
+            Search index
+        """
+        self._open()
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = SearchIndex(
+                    self.index_path.with_suffix(".search")
+                )
+            search_index = self._search_index
+        indexed = search_index.sync(self, (self._inode, *self._stamp))
+        if indexed:
+            logging.getLogger("quote_corpus").info(
+                f"Indexed {indexed} quotes of {self.path} for search"
+            )
+        return search_index
+
+    def close(self) -> None:
+        """Unmap the corpus and close its indexes"""
+        with self._lock:
+            if self._tag_index is not None:
+                self._tag_index.close()
+                self._tag_index = None
+            if self._search_index is not None:
+                self._search_index.close()
+                self._search_index = None
+            if self._maps is not None:
+                for mapped in self._maps:
+                    mapped.close()
+                self._maps = None
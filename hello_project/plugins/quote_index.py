@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tag and language index over quote IDs
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_LANGUAGE = "en"  # Language of quotes that do not declare one
+
+Postings = Sequence[int]
+
+
+def normalize_tag(tag: str) -> str:
+    """Normalize a tag or language for index keys"""
+    return " ".join(tag.split()).casefold()
+
+
+def _contains(postings: array, quote_id: int) -> bool:
+    position = bisect_left(postings, quote_id)
+    return position < len(postings) and postings[position] == quote_id
+
+
+class QuoteIndex:
+    """Sorted posting lists of quote IDs per tag, language and (tag, language)
+
+    Posting lists are arrays of 32-bit IDs. Every (tag, language) pair is
+    precomputed, so the quotes of a category in a language are a single
+    lookup; other combinations of tags are intersected smallest list first
+    by binary search. An index saved to disk is memory-mapped and each of
+    its lists is copied out the first time it is asked for.
+    """
+
+    MAGIC = b"HPQTAG01"
+    # magic, stamp (corpus size, corpus mtime ns), quote count, directory size
+    HEADER = struct.Struct("<8sQqQQ")
+
+    def __init__(self, count: int, lists: Dict[str, array]):
+        """Initialize quote index
+
+        Args:
+            count: Number of indexed quotes
+            lists: Posting list per key (see _key)
+        """
+        self.count = count
+        self._lists = lists
+        self._map: Optional[mmap.mmap] = None
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        self._decoded: Dict[str, array] = {}  # Lists copied out of the map
+
+    @staticmethod
+    def _key(tag: Optional[str] = None, language: Optional[str] = None) -> str:
+        if tag is None:
+            return f"language:{language}"
+        if language is None:
+            return f"tag:{tag}"
+        return f"pair:{tag}\t{language}"
+
+    @classmethod
+    def build(cls, quotes: Iterable[Tuple[int, Dict[str, Any]]]) -> "QuoteIndex":
+        """Index quotes by their tags and language
+
+        Args:
+            quotes: (quote ID, quote) pairs in ascending ID order
+
+        Returns:
+            Quote index
+        """
+        lists: Dict[str, array] = {}
+        # Quotes sharing a language and tags share their posting lists
+        targets: Dict[Tuple[str, Tuple[str, ...]], List[array]] = {}
+        count = 0
+        for quote_id, quote in quotes:
+            count = quote_id + 1
+            signature = (
+                quote.get("language") or DEFAULT_LANGUAGE,
+                tuple(quote.get("tags", ())),
+            )
+            postings = targets.get(signature)
+            if postings is None:
+                language = normalize_tag(signature[0])
+                keys = {cls._key(language=language)}
+                for tag in map(normalize_tag, signature[1]):
+                    keys.update((cls._key(tag), cls._key(tag, language)))
+                postings = [lists.setdefault(key, array("I")) for key in keys]
+                targets[signature] = postings
+            for ids in postings:
+                ids.append(quote_id)
+        return cls(count, lists)
+
+    def postings(
+        self, tag: Optional[str] = None, language: Optional[str] = None
+    ) -> array:
+        """Get the posting list of a tag, a language or both
+
+        Args:
+            tag: Tag (category)
+            language: Language code
+
+        Returns:
+            Sorted quote IDs (empty if nothing matches)
+        """
+        key = self._key(
+            normalize_tag(tag) if tag is not None else None,
+            normalize_tag(language) if language is not None else None,
+        )
+        if self._map is None:
+            return self._lists.get(key, array("I"))
+        if key in self._decoded:
+            return self._decoded[key]
+
+        postings = array("I")
+        if key in self._spans:
+            start, count = self._spans[key]
+            postings.frombytes(self._map[start : start + count * 4])
+            if sys.byteorder == "big":
+                postings.byteswap()
+            self._decoded[key] = postings
+        return postings
+
+    def ids(self, tags: Iterable[str] = (), language: Optional[str] = None) -> Postings:
+        """Get the quotes carrying all given tags, optionally in one language
+
+        Args:
+            tags: Required tags
+            language: Required language (default: any)
+
+        Returns:
+            Sorted quote IDs
+        """
+        tags = list(dict.fromkeys(normalize_tag(tag) for tag in tags))
+        if not tags:
+            if language is None:
+                return range(self.count)
+            return self.postings(language=language)
+
+        # The first tag is looked up together with the language
+        lists = [self.postings(tags[0], language)]
+        lists.extend(self.postings(tag) for tag in tags[1:])
+        lists.sort(key=len)
+
+        result = lists[0]
+        for other in lists[1:]:
+            if not result:
+                break
+            result = array("I", (i for i in result if _contains(other, i)))
+        return result
+
+    def save(self, path: Path, stamp: Tuple[int, int]) -> None:
+        """Write the index, replacing any previous file atomically
+
+        Args:
+            path: Index file
+            stamp: Corpus (size, mtime in ns) the index was built from
+        """
+        spans: Dict[str, Tuple[int, int]] = {}
+        offset = 0
+        for key, postings in self._lists.items():
+            spans[key] = (offset, len(postings))
+            offset += len(postings) * 4
+        directory = json.dumps(spans, ensure_ascii=False).encode("utf-8")
+        directory += b" " * (-len(directory) % 4)  # Keep lists aligned
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, *stamp, self.count, len(directory)))
+            f.write(directory)
+            for postings in self._lists.values():
+                if sys.byteorder == "big":
+                    postings = array("I", postings)
+                    postings.byteswap()
+                postings.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, stamp: Tuple[int, int]) -> Optional["QuoteIndex"]:
+        """Map a saved index
+
+        Args:
+            path: Index file
+            stamp: Current corpus (size, mtime in ns)
+
+        Returns:
+            Quote index, or None if the file is missing or out of date
+        """
+        try:
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # Missing or empty
+            return None
+
+        if len(data) >= cls.HEADER.size:
+            magic, size, mtime_ns, count, length = cls.HEADER.unpack_from(data)
+            if magic == cls.MAGIC and (size, mtime_ns) == stamp:
+                start = cls.HEADER.size
+                spans = json.loads(data[start : start + length])
+                index = cls(count, {})
+                index._map = data
+                index._spans = {
+                    key: (start + length + offset, n)
+                    for key, (offset, n) in spans.items()
+                }
+                return index
+        data.close()
+        return None
+
+    def close(self) -> None:
+        """Unmap a loaded index"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
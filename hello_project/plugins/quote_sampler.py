@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+No-repeat quote sampling with persistent per-session cursors
+"""
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from .paths import default_cache_dir
+
+_MASK64 = (1 << 64) - 1
+
+Cursor = Tuple[int, int, int]  # (epoch, position, population size)
+T = TypeVar("T")
+
+
+class Permutation:
+    """Pseudo-random permutation of range(size) computed on demand
+
+    A four-round Feistel network permutes the smallest even-bit domain
+    covering size; indexes that land outside range(size) are encrypted
+    again until they fall inside (cycle walking). The result is a bijection
+    of range(size) that needs O(1) memory and at most a few rounds per
+    lookup on average, whatever the size.
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, size: int, seed: str):
+        """Initialize permutation
+
+        Args:
+            size: Number of elements
+            seed: Seed selecting the permutation
+        """
+        if size < 0:
+            raise ValueError("Permutation size must not be negative")
+        self.size = size
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._mask = (1 << self._half_bits) - 1
+        digest = hashlib.blake2b(
+            seed.encode("utf-8"), digest_size=8 * self.ROUNDS
+        ).digest()
+        self._keys = [
+            int.from_bytes(digest[8 * i : 8 * i + 8], "big") for i in range(self.ROUNDS)
+        ]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _round(self, key: int, value: int) -> int:
+        # splitmix64 finalizer keyed per round
+        h = (value + key) * 0x9E3779B97F4A7C15 & _MASK64
+        h = (h ^ (h >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+        h = (h ^ (h >> 27)) * 0x94D049BB133111EB & _MASK64
+        return (h ^ (h >> 31)) & self._mask
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self._half_bits, value & self._mask
+        for key in self._keys:
+            left, right = right, left ^ self._round(key, right)
+        return (left << self._half_bits) | right
+
+    def __getitem__(self, index: int) -> int:
+        """Get the element at a position of the permutation
+
+        Args:
+            index: Position in range(size)
+
+        Returns:
+            Element of range(size)
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if not 0 <= index < self.size:
+            raise IndexError(f"Permutation index out of range: {index}")
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+
+class CursorStore:
+    """SQLite table of sampling cursors shared between runs and processes"""
+
+    FILENAME = "quote_cursors.sqlite3"
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize cursor store
+
+        Args:
+            path: Database file (default: FILENAME in default_cache_dir())
+        """
+        self.path = Path(path) if path else default_cache_dir() / self.FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection for all threads: plugin calls run on short-lived ones
+        self._conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cursors (key TEXT PRIMARY KEY, "
+                "epoch INTEGER NOT NULL, position INTEGER NOT NULL, "
+                "size INTEGER NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Cursor]:
+        """Read a cursor
+
+        Args:
+            key: Stream key
+
+        Returns:
+            (epoch, position, size), or None if the stream is new
+        """
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> Optional[Cursor]:
+        row = self._conn.execute(
+            "SELECT epoch, position, size FROM cursors WHERE key = ?", (key,)
+        ).fetchone()
+        return tuple(row) if row else None  # type: ignore[return-value]
+
+    def update(
+        self, key: str, advance: Callable[[Optional[Cursor]], Tuple[Cursor, T]]
+    ) -> T:
+        """Replace a cursor atomically, also across processes
+
+        Args:
+            key: Stream key
+            advance: Called with the current cursor (None if the stream is
+                new); returns the new cursor and a value to pass on
+
+        Returns:
+            Value returned by advance
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")  # Take the write lock before reading
+            try:
+                cursor, value = advance(self._get(key))
+                conn.execute(
+                    "INSERT OR REPLACE INTO cursors (key, epoch, position, size) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, *cursor),
+                )
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+            return value
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+
+class NoRepeatSampler:
+    """Samples positions so that no element repeats within a stream
+
+    Each stream (a user or session and the population it draws from) walks
+    its own Permutation of the population position by position. When a
+    pass is complete, or the population size changes, the stream starts
+    over on a fresh permutation. A stream is just its cursor, so any number
+    of streams over any population size cost constant memory each.
+    """
+
+    def __init__(self, seed: int = 0, store: Optional[CursorStore] = None):
+        """Initialize sampler
+
+        Args:
+            seed: Seed selecting the permutations
+            store: Persistent cursor store (default: cursors kept in memory
+                for the lifetime of the sampler)
+        """
+        self.seed = seed
+        self.store = store
+        self._cursors: Dict[str, Cursor] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "NoRepeatSampler":
+        """Build a sampler from a quote plugin "no_repeat" config section
+
+        Args:
+            config: Mapping with optional seed, persist and path
+
+        Returns:
+            Sampler
+        """
+        store = CursorStore(config.get("path")) if config.get("persist", True) else None
+        return cls(seed=int(config.get("seed", 0)), store=store)
+
+    def next(self, stream: str, size: int) -> int:
+        """Take the next position of a stream
+
+        Args:
+            stream: Stream key
+            size: Population size (must be positive)
+
+        Returns:
+            Position in range(size) not returned before in this pass
+        """
+        def advance(cursor: Optional[Cursor]) -> Tuple[Cursor, int]:
+            epoch, position, cursor_size = cursor or (0, 0, size)
+            if position >= size or cursor_size != size:
+                epoch, position = epoch + 1, 0
+            permutation = Permutation(size, f"{self.seed}\t{stream}\t{epoch}")
+            return (epoch, position + 1, size), permutation[position]
+
+        with self._lock:
+            if self.store is not None:
+                return self.store.update(stream, advance)
+            self._cursors[stream], value = advance(self._cursors.get(stream))
+            return value
+
+    def close(self) -> None:
+        """Close the cursor store"""
+        if self.store is not None:
+            self.store.close()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Persistent full-text index over quote texts and authors
+"""
+import hashlib
+import heapq
+import math
+import re
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+_TOKEN = re.compile(f"[{_CJK}]+|[^\\W_{_CJK}]+")
+_CJK_CHAR = re.compile(f"[{_CJK}]")
+
+
+def _runs(text: str) -> Iterator[Tuple[str, bool]]:
+    """Split normalized text into word runs, flagging CJK runs"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    for run in _TOKEN.findall(text):
+        yield run, bool(_CJK_CHAR.match(run))
+
+
+def index_terms(text: str) -> List[str]:
+    """Get the terms indexed for a text
+
+    Words are split on non-word characters. CJK text has no word boundaries,
+    so every character and every pair of adjacent characters is a term.
+
+    Args:
+        text: Quote text or author
+
+    Returns:
+        Terms, with repetitions
+    """
+    terms: List[str] = []
+    for run, cjk in _runs(text):
+        if cjk:
+            terms.extend(run)
+            terms.extend(run[i : i + 2] for i in range(len(run) - 1))
+        else:
+            terms.append(run)
+    return terms
+
+
+def query_terms(query: str) -> List[str]:
+    """Get the distinct terms a query must match
+
+    CJK runs of two or more characters are matched by their character
+    pairs only, single CJK characters by themselves.
+
+    Args:
+        query: Search terms
+
+    Returns:
+        Distinct terms in query order
+    """
+    terms: List[str] = []
+    for run, cjk in _runs(query):
+        if cjk and len(run) > 1:
+            terms.extend(run[i : i + 2] for i in range(len(run) - 1))
+        else:
+            terms.append(run)
+    return list(dict.fromkeys(terms))
+
+
+_STAMP_KEYS = ("inode", "size", "mtime_ns")
+
+
+def _checksum(quote: Dict[str, Any]) -> str:
+    text = f"{quote.get('text', '')}\t{quote.get('author', '')}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class SearchIndex:
+    """Inverted index ranking quotes by BM25 relevance
+
+    Posting lists store sorted 32-bit quote IDs with 8-bit term frequencies
+    and are written in segments of SEGMENT_SIZE quotes to SQLite, so an
+    index grows incrementally as quotes are appended to a corpus and is
+    never rebuilt at startup. A query matches quotes containing all of its
+    terms; they are found by walking the rarest term's list and probing the
+    others by binary search within the same segment. Only the first
+    MAX_CANDIDATES postings of the rarest term are scored, which keeps
+    lookups in the millisecond range on large corpora; queries made only
+    of very common terms rank just those.
+    """
+
+    SEGMENT_SIZE = 100_000
+    MAX_CANDIDATES = 5_000  # Postings of the rarest query term scored at most
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize search index
+
+        Args:
+            path: Database file (default: in memory)
+        """
+        self.path = Path(path) if path else None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path) if self.path else ":memory:",
+            timeout=5.0,
+            check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        self._lengths: Optional[array] = None
+        with self._lock, self._conn as conn:
+            if self.path is not None:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings (term TEXT, segment INTEGER, "
+                "ids BLOB NOT NULL, tfs BLOB NOT NULL, PRIMARY KEY (term, segment)) "
+                "WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lengths "
+                "(segment INTEGER PRIMARY KEY, lengths BLOB NOT NULL)"
+            )
+
+    def _meta(self, key: str, default: Any = None) -> Any:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else default
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._meta("count", 0)
+
+    def sync(
+        self,
+        quotes: Sequence[Dict[str, Any]],
+        stamp: Optional[Tuple[int, int, int]] = None,
+    ) -> int:
+        """Index the quotes appended since the last sync
+
+        Starts over if quotes were removed or the last indexed quote changed.
+        With a stamp of the file the quotes are read from, nothing is read
+        while the stamp matches the indexed one, and the index also starts
+        over unless the same file only grew, so edits in place are picked up.
+
+        Args:
+            quotes: All quotes, indexed by quote ID
+            stamp: Source file (inode, size, mtime in ns)
+
+        Returns:
+            Number of quotes indexed
+        """
+        with self._lock:
+            indexed_stamp = tuple(self._meta(key) for key in _STAMP_KEYS)
+            if stamp is not None and indexed_stamp == tuple(stamp):
+                return 0
+
+            # Same inode and larger size: the file was appended to
+            grown = stamp is None or (
+                indexed_stamp[0] == stamp[0] and (indexed_stamp[1] or 0) < stamp[1]
+            )
+            count = self._meta("count", 0)
+            total = len(quotes)
+            if (
+                not grown
+                or count > total
+                or (count and _checksum(quotes[count - 1]) != self._meta("checksum"))
+            ):
+                with self._conn as conn:
+                    for table in ("meta", "postings", "lengths"):
+                        conn.execute(f"DELETE FROM {table}")
+                count = 0
+
+            indexed = total - count
+            for start in range(count, total, self.SEGMENT_SIZE):
+                end = min(start + self.SEGMENT_SIZE, total)
+                self._add_segment(start, (quotes[i] for i in range(start, end)))
+            if stamp is not None:
+                with self._conn as conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                        zip(_STAMP_KEYS, stamp),
+                    )
+            if indexed:
+                self._lengths = None
+            return indexed
+
+    def _add_segment(self, start: int, quotes: Iterator[Dict[str, Any]]) -> None:
+        """Write the postings of consecutive quotes starting at ID start"""
+        postings: Dict[str, Tuple[array, array]] = {}
+        lengths = array("H")
+        quote: Dict[str, Any] = {}
+        for quote_id, quote in enumerate(quotes, start):
+            terms = index_terms(f"{quote.get('text', '')} {quote.get('author', '')}")
+            lengths.append(min(len(terms), 0xFFFF))
+            frequencies: Dict[str, int] = {}
+            for term in terms:
+                frequencies[term] = frequencies.get(term, 0) + 1
+            for term, frequency in frequencies.items():
+                ids, tfs = postings.setdefault(term, (array("I"), array("B")))
+                ids.append(quote_id)
+                tfs.append(min(frequency, 0xFF))
+
+        with self._conn as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO postings VALUES (?, ?, ?, ?)",
+                (
+                    (term, start, ids.tobytes(), tfs.tobytes())
+                    for term, (ids, tfs) in postings.items()
+                ),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO lengths VALUES (?, ?)",
+                (start, lengths.tobytes()),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [
+                    ("count", start + len(lengths)),
+                    ("total_length", self._meta("total_length", 0) + sum(lengths)),
+                    ("checksum", _checksum(quote)),
+                ],
+            )
+
+    def _segment_sizes(self, term: str) -> Dict[int, int]:
+        """Get the number of postings of a term per segment"""
+        return {
+            segment: size // 4
+            for segment, size in self._conn.execute(
+                "SELECT segment, length(ids) FROM postings WHERE term = ?", (term,)
+            )
+        }
+
+    def _postings(self, term: str, segment: int) -> Tuple[array, array]:
+        """Read the postings of a term in one segment"""
+        ids, tfs = array("I"), array("B")
+        row = self._conn.execute(
+            "SELECT ids, tfs FROM postings WHERE term = ? AND segment = ?",
+            (term, segment),
+        ).fetchone()
+        if row is not None:
+            ids.frombytes(row[0])
+            tfs.frombytes(row[1])
+        return ids, tfs
+
+    def _doc_lengths(self) -> array:
+        if self._lengths is None:
+            lengths = array("H")
+            for (blob,) in self._conn.execute(
+                "SELECT lengths FROM lengths ORDER BY segment"
+            ):
+                lengths.frombytes(blob)
+            self._lengths = lengths
+        return self._lengths
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """Find the quotes matching all query terms, most relevant first
+
+        Args:
+            query: Search terms
+            limit: Maximum number of results
+
+        Returns:
+            (quote ID, score) pairs
+        """
+        terms = query_terms(query)
+        if not terms or limit < 1:
+            return []
+
+        with self._lock:
+            count = self._meta("count", 0)
+            if not count:
+                return []
+            average_length = self._meta("total_length", 0) / count or 1.0
+            lengths = self._doc_lengths()
+
+            sizes = {term: self._segment_sizes(term) for term in terms}
+            terms.sort(key=lambda term: sum(sizes[term].values()))
+            weights = []
+            for term in terms:
+                frequency = sum(sizes[term].values())
+                if not frequency:
+                    return []
+                weights.append(
+                    math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+                )
+
+            def term_score(weight: float, tf: int, length: int) -> float:
+                norm = self.K1 * (1 - self.B + self.B * length / average_length)
+                return weight * tf * (self.K1 + 1) / (tf + norm)
+
+            # Walk the rarest term segment by segment, reading the other
+            # terms' postings only for segments where they all occur
+            scored: List[Tuple[float, int]] = []
+            candidates = self.MAX_CANDIDATES
+            rarest, others = terms[0], terms[1:]
+            for segment in sorted(sizes[rarest]):
+                if candidates <= 0:
+                    break
+                if any(segment not in sizes[term] for term in others):
+                    continue
+                rarest_ids, rarest_tfs = self._postings(rarest, segment)
+                lists = [self._postings(term, segment) for term in others]
+
+                for position in range(min(len(rarest_ids), candidates)):
+                    quote_id = rarest_ids[position]
+                    length = lengths[quote_id]
+                    score = term_score(weights[0], rarest_tfs[position], length)
+                    for weight, (ids, tfs) in zip(weights[1:], lists):
+                        found = bisect_left(ids, quote_id)
+                        if found == len(ids) or ids[found] != quote_id:
+                            break
+                        score += term_score(weight, tfs[found], length)
+                    else:
+                        scored.append((score, -quote_id))
+                candidates -= len(rarest_ids)
+
+        return [
+            (-negated_id, score) for score, negated_id in heapq.nlargest(limit, scored)
+        ]
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
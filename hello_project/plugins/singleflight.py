@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Coalescing of identical concurrent calls
+"""
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one call per key at a time, sharing its outcome
+
+    The first caller of a key runs the call; callers arriving while it is in
+    flight wait for it and receive the same result or exception. Threads and
+    asyncio tasks (on any event loop) may wait on the same call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "Future[T]"] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: Hashable) -> Tuple["Future[T]", bool]:
+        """Get the in-flight call of a key, registering a new one if there is none
+
+        Returns:
+            Future of the call and whether the caller must run it
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            # Running futures cannot be cancelled by a waiter giving up
+            future.set_running_or_notify_cancel()
+            self._calls[key] = future
+            return future, True
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> Tuple[T, bool]:
+        """Run func unless an identical call is in flight
+
+        Args:
+            key: Identity of the call
+            func: The call
+
+        Returns:
+            Result and whether it was shared from another caller's call
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            self._finish(key)
+
+    async def do_async(
+        self, key: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """Await func() unless an identical call is in flight
+
+        Args:
+            key: Identity of the call
+            func: Coroutine function making the call
+
+        Returns:
+            Result and whether it was shared from another caller's call
+        """
+        import asyncio
+
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future), True
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # Waiters must not be cancelled along with the caller that gave up
+            future.set_exception(RuntimeError("Shared call was cancelled"))
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            self._finish(key)
+
+    def __len__(self) -> int:
+        """Number of calls in flight"""
+        return len(self._calls)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Per-plugin execution statistics
+"""
+import json
+import math
+import threading
+from typing import Any, Dict, List
+
+
+class LatencyHistogram:
+    """Latency histogram with logarithmic buckets
+
+    Buckets grow by a factor of 2 ** (1 / BUCKETS_PER_DOUBLING), so reported
+    percentiles are within about 5% of the true value while memory and
+    recording cost stay constant regardless of the number of samples.
+    """
+
+    MIN_LATENCY = 1e-6  # Seconds; faster samples land in the first bucket
+    BUCKETS_PER_DOUBLING = 8
+    NUM_BUCKETS = 8 * 34  # Up to ~4.7 hours
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample
+
+        Args:
+            seconds: Observed latency
+        """
+        if seconds <= self.MIN_LATENCY:
+            index = 0
+        else:
+            index = int(
+                math.log2(seconds / self.MIN_LATENCY) * self.BUCKETS_PER_DOUBLING
+            )
+            index = min(index, self.NUM_BUCKETS - 1)
+
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a latency percentile
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Estimated latency in seconds (0.0 without samples)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                # Geometric middle of the bucket, never above the real maximum
+                estimate = self.MIN_LATENCY * 2 ** (
+                    (index + 0.5) / self.BUCKETS_PER_DOUBLING
+                )
+                return min(estimate, self.max)
+        return self.max
+
+
+class PluginStats:
+    """Call counters and latency histogram of a single plugin"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.successes = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarize the statistics
+
+        Returns:
+            Counters and latency percentiles in milliseconds
+        """
+        latency = self.latency
+        mean = latency.total / latency.count if latency.count else 0.0
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "errors": self.errors,
+            "latency_ms": {
+                "mean": round(mean * 1000, 3),
+                "p50": round(latency.percentile(50) * 1000, 3),
+                "p90": round(latency.percentile(90) * 1000, 3),
+                "p99": round(latency.percentile(99) * 1000, 3),
+                "max": round(latency.max * 1000, 3),
+            },
+        }
+
+
+class StatsCollector:
+    """Thread-safe collection of per-plugin statistics"""
+
+    def __init__(self) -> None:
+        self._plugins: Dict[str, PluginStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, success: bool) -> None:
+        """Record a finished plugin call
+
+        Args:
+            name: Plugin name
+            seconds: Call latency
+            success: Whether the call succeeded
+        """
+        with self._lock:
+            stats = self._plugins.get(name)
+            if stats is None:
+                stats = self._plugins[name] = PluginStats()
+            stats.calls += 1
+            if success:
+                stats.successes += 1
+            else:
+                stats.errors += 1
+            stats.latency.record(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Summarize statistics of every plugin called so far
+
+        Returns:
+            Mapping of plugin name to its statistics summary
+        """
+        with self._lock:
+            return {name: stats.snapshot() for name, stats in self._plugins.items()}
+
+    def reset(self) -> None:
+        """Forget all recorded calls"""
+        with self._lock:
+            self._plugins.clear()
+
+
+def format_stats(stats: Dict[str, Dict[str, Any]], output_format: str = "text") -> str:
+    """Format a statistics snapshot for display
+
+    Args:
+        stats: Snapshot from StatsCollector.snapshot
+        output_format: Output format (text, json)
+
+    Returns:
+        Formatted statistics
+    """
+    if output_format == "json":
+        return json.dumps(stats, indent=2, ensure_ascii=False)
+
+    if not stats:
+        return "Plugin statistics: no plugin calls recorded"
+
+    lines = [
+        "Plugin statistics (latency in ms):",
+        f"  {'plugin':<16}{'calls':>7}{'ok':>7}{'err':>7}"
+        f"{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}",
+    ]
+    for name, plugin_stats in sorted(stats.items()):
+        latency = plugin_stats["latency_ms"]
+        lines.append(
+            f"  {name:<16}{plugin_stats['calls']:>7}"
+            f"{plugin_stats['successes']:>7}{plugin_stats['errors']:>7}"
+            f"{latency['p50']:>10.2f}{latency['p90']:>10.2f}"
+            f"{latency['p99']:>10.2f}{latency['max']:>10.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Synthetic weather source for load and soak testing
+"""
+import hashlib
+import math
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .city_index import normalize_city
+
+LatencySampler = Callable[[random.Random], float]
+
+
+class SyntheticUpstreamError(Exception):
+    """Error injected by the synthetic weather source"""
+
+
+def latency_sampler(config: Dict[str, Any]) -> LatencySampler:
+    """Build a latency sampler from a "latency" config section
+
+    Supported distributions (all values in milliseconds):
+        fixed: ms
+        uniform: min_ms, max_ms
+        exponential: mean_ms
+        lognormal: median_ms, sigma (long-tailed, like real networks)
+
+    Args:
+        config: Mapping with distribution and its parameters
+
+    Returns:
+        Function drawing a latency in seconds from a random generator
+
+    Raises:
+        ValueError: If the distribution is unknown
+    """
+    distribution = config.get("distribution", "fixed")
+    if distribution == "fixed":
+        ms = float(config.get("ms", 0.0))
+        return lambda rng: ms / 1000
+    if distribution == "uniform":
+        low, high = float(config.get("min_ms", 0.0)), float(config.get("max_ms", 0.0))
+        return lambda rng: rng.uniform(low, high) / 1000
+    if distribution == "exponential":
+        mean_ms = float(config.get("mean_ms", 50.0))
+        return lambda rng: rng.expovariate(1 / mean_ms) / 1000 if mean_ms else 0.0
+    if distribution == "lognormal":
+        mu = math.log(float(config.get("median_ms", 50.0)))
+        sigma = float(config.get("sigma", 0.5))
+        return lambda rng: rng.lognormvariate(mu, sigma) / 1000
+    raise ValueError(f"Unknown latency distribution: {distribution}")
+
+
+class SyntheticWeather:
+    """Deterministic, city-dependent weather readings
+
+    Every city gets a stable climate derived from a hash of the seed and its
+    normalized name, so any number of distinct cities can be generated
+    without storing anything. Readings follow season and time of day and
+    vary hour by hour; the same seed, city and hour always give the same
+    reading. Optional latency and error injection imitate a real upstream.
+    """
+
+    DESCRIPTIONS = [
+        # (minimum humidity %, description)
+        (90, "Light rain"),
+        (80, "Overcast clouds"),
+        (65, "Broken clouds"),
+        (50, "Scattered clouds"),
+        (35, "Few clouds"),
+        (0, "Clear sky"),
+    ]
+
+    def __init__(
+        self,
+        seed: int = 0,
+        latency: Optional[LatencySampler] = None,
+        error_rate: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize synthetic weather source
+
+        Args:
+            seed: Seed making readings and injected faults reproducible
+            latency: Sampler of simulated upstream latency (default: none)
+            error_rate: Probability that a fetch fails
+            clock: Wall-clock time source driving seasons and hours
+        """
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.seed = seed
+        self.latency = latency
+        self.error_rate = error_rate
+        self._clock = clock
+        self._faults = random.Random(seed)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SyntheticWeather":
+        """Build a source from a weather plugin "synthetic" config section
+
+        Args:
+            config: Mapping with optional seed, error_rate and latency
+
+        Returns:
+            Synthetic weather source
+        """
+        latency = config.get("latency")
+        return cls(
+            seed=int(config.get("seed", 0)),
+            latency=latency_sampler(latency) if latency else None,
+            error_rate=float(config.get("error_rate", 0.0)),
+        )
+
+    def _random(self, *parts: Any) -> random.Random:
+        """Get a generator seeded from the seed and the given parts"""
+        text = ":".join(str(part) for part in (self.seed, *parts))
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+        return random.Random(int.from_bytes(digest, "big"))
+
+    def reading(self, city: str, now: Optional[float] = None) -> Dict[str, float]:
+        """Generate the reading of a city at a point in time
+
+        Args:
+            city: City name
+            now: Unix time (default: current time)
+
+        Returns:
+            temperature (°C), humidity (%) and wind (m/s)
+        """
+        now = self._clock() if now is None else now
+        key = normalize_city(city)
+
+        climate = self._random(key)
+        latitude = climate.uniform(-60.0, 70.0)
+        longitude = climate.uniform(-180.0, 180.0)
+        mean_temperature = 28.0 - 0.45 * abs(latitude) + climate.gauss(0.0, 2.0)
+        humidity_base = climate.uniform(30.0, 85.0)
+        wind_base = climate.uniform(1.0, 7.0)
+
+        # Summer peaks in July north of the equator and in January south of it
+        day_of_year = now / 86400 % 365.25
+        season = math.cos(2 * math.pi * (day_of_year - 196) / 365.25)
+        if latitude < 0:
+            season = -season
+        local_hour = (now / 3600 + longitude / 15) % 24
+        daytime = math.cos(2 * math.pi * (local_hour - 15) / 24)
+
+        hourly = self._random(key, int(now // 3600))
+        temperature = (
+            mean_temperature
+            + 0.3 * abs(latitude) * season
+            + 4.0 * daytime
+            + hourly.gauss(0.0, 1.5)
+        )
+        humidity = humidity_base - 8.0 * daytime + hourly.gauss(0.0, 8.0)
+        humidity = min(100.0, max(5.0, humidity))
+        wind = max(0.0, hourly.gauss(wind_base, 1.5))
+        return {
+            "temperature": round(temperature, 1),
+            "humidity": round(humidity),
+            "wind": round(wind, 1),
+        }
+
+    def describe(self, humidity: float) -> str:
+        """Get the sky description matching a humidity"""
+        for minimum, description in self.DESCRIPTIONS:
+            if humidity >= minimum:
+                return description
+        return self.DESCRIPTIONS[-1][1]
+
+    def fetch(self, city: str, timeout: Optional[float] = None) -> Dict[str, float]:
+        """Generate a reading the way an upstream call would deliver it
+
+        Sleeps for the sampled latency and fails at error_rate.
+
+        Args:
+            city: City name
+            timeout: Seconds after which the simulated call times out
+
+        Returns:
+            Reading as returned by reading()
+
+        Raises:
+            TimeoutError: If the sampled latency exceeds timeout
+            SyntheticUpstreamError: When an error is injected
+        """
+        if self.latency is not None:
+            delay = self.latency(self._faults)
+            if timeout is not None and delay > timeout:
+                time.sleep(max(timeout, 0.0))
+                raise TimeoutError(f"Synthetic upstream timed out after {timeout}s")
+            time.sleep(delay)
+
+        if self.error_rate and self._faults.random() < self.error_rate:
+            raise SyntheticUpstreamError("Injected synthetic upstream error")
+
+        return self.reading(city)
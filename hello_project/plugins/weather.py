@@ -2,11 +2,18 @@
 """
 Weather plugin for Hello Project
 """
-from typing import Any, Dict
-
-import requests
+import sqlite3
+import threading
+from dataclasses import replace
+from typing import Any, Dict, List, Optional
 
 from .base import BasePlugin, PluginResult
+from .cache import CachePolicy
+from .circuit import CircuitBreaker, is_upstream_failure
+from .city_index import City, CityIndex, default_city_index, normalize_city
+from .prefetch import PrefetchScheduler
+from .synthetic import SyntheticWeather
+from .weather_cache import WeatherCache
 
 
 class WeatherPlugin(BasePlugin):
@@ -16,6 +23,17 @@ class WeatherPlugin(BasePlugin):
     description = "Get current weather information"
     version = "1.0.0"
 
+    # Weather changes slowly; repeated lookups for a city reuse the result
+    cache_policy = CachePolicy(ttl=300.0, max_entries=1024, key_fields=("city",))
+    # Concurrent lookups of one city share a single upstream request
+    single_flight = True
+
+    # Temperature and wind speed suffixes per OpenWeatherMap unit system
+    UNITS = {"metric": ("°C", "m/s"), "imperial": ("°F", "mph")}
+
+    DEFAULT_BASE_URL = "http://api.openweathermap.org/data/2.5"
+    GROUP_LIMIT = 20  # City IDs the group endpoint accepts per request
+
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize weather plugin
 
@@ -26,6 +44,51 @@ class WeatherPlugin(BasePlugin):
         self.api_key = self.config.get("api_key")
         self.default_city = self.config.get("default_city", "Tokyo")
         self.use_mock = self.config.get("use_mock", True)  # For demo purposes
+        self.base_url = self.config.get("base_url", self.DEFAULT_BASE_URL).rstrip("/")
+        self.group_size = min(
+            int(self.config.get("group_size", self.GROUP_LIMIT)), self.GROUP_LIMIT
+        )
+        if self.group_size < 1:
+            raise ValueError("group_size must be at least 1")
+        self.units = self.config.get("units", "metric")
+        if self.units not in self.UNITS:
+            raise ValueError(
+                f"Unknown units '{self.units}' "
+                f"(expected one of: {', '.join(self.UNITS)})"
+            )
+        self.circuit_breaker = CircuitBreaker.from_config(
+            "openweathermap",
+            self.config.get("circuit_breaker", {}),
+            is_failure=is_upstream_failure,
+        )
+        city_table = self.config.get("city_table")
+        self.city_index = CityIndex(city_table) if city_table else default_city_index()
+
+        # Generated stand-in for the API, for load and soak testing
+        synthetic = self.config.get("synthetic", False)
+        self.synthetic: Optional[SyntheticWeather] = (
+            SyntheticWeather.from_config({} if synthetic is True else synthetic)
+            if synthetic
+            else None
+        )
+
+        # Persistent cache shared across runs, opened on first real lookup.
+        # Off by default for synthetic data so it never mixes with real data.
+        disk_cache = self.config.get("disk_cache", self.synthetic is None)
+        self._disk_cache_config: Optional[Dict[str, Any]] = (
+            {} if disk_cache is True else disk_cache or None
+        )
+        self._disk_cache: Optional[WeatherCache] = None
+        self._disk_cache_lock = threading.Lock()
+        self._refreshes: Dict[str, threading.Thread] = {}
+
+        # Keeps the most requested cities fresh; needs the persistent cache
+        prefetch = self.config.get("prefetch", False)
+        self.prefetcher: Optional[PrefetchScheduler] = None
+        if prefetch and self._disk_cache_config is not None:
+            self.prefetcher = PrefetchScheduler.from_config(
+                self._prefetch, {} if prefetch is True else prefetch
+            )
 
     def execute(self, context: Dict[str, Any]) -> PluginResult:
         """Get weather information
@@ -38,20 +101,22 @@ class WeatherPlugin(BasePlugin):
         """
         city = context.get("city", self.default_city)
 
-        if self.use_mock:
-            return self._get_mock_weather(city)
+        if self.synthetic is None:
+            if self.use_mock:
+                return self._get_mock_weather(city)
 
-        if not self.api_key:
-            return PluginResult(
-                success=False,
-                error=(
-                    "Weather API key not configured. " "Set 'api_key' in plugin config."
-                ),
-                plugin_name=self.name,
-            )
+            if not self.api_key:
+                return PluginResult(
+                    success=False,
+                    error=(
+                        "Weather API key not configured. "
+                        "Set 'api_key' in plugin config."
+                    ),
+                    plugin_name=self.name,
+                )
 
         try:
-            weather_data = self._get_real_weather(city)
+            weather_data = self._get_cached_weather(city, context)
             return PluginResult(success=True, data=weather_data, plugin_name=self.name)
         except Exception as e:
             return PluginResult(
@@ -60,6 +125,273 @@ class WeatherPlugin(BasePlugin):
                 plugin_name=self.name,
             )
 
+    def execute_batch(self, contexts: List[Dict[str, Any]]) -> List[PluginResult]:
+        """Get weather information for many contexts
+
+        Each distinct city is looked up only once per batch, counting
+        spellings that resolve to the same canonical city as one. With the
+        real API, known cities missing from the persistent cache are fetched
+        together through the group endpoint, group_size cities per request.
+
+        Args:
+            contexts: Execution contexts
+
+        Returns:
+            Weather information results, one per context
+        """
+        by_city: Dict[str, PluginResult] = {}
+        if self.synthetic is None and not self.use_mock and self.api_key and contexts:
+            by_city.update(self._fetch_grouped(contexts))
+
+        results = []
+        for context in contexts:
+            key = self.city_key(context.get("city", self.default_city))
+            if key not in by_city:
+                by_city[key] = self.execute(context)
+            results.append(replace(by_city[key]))
+        return results
+
+    def resolve_city(self, city: Any) -> Optional[City]:
+        """Resolve city input through the bundled city table
+
+        Args:
+            city: City name, optionally followed by ", CC" (country code);
+                other values are converted to strings
+
+        Returns:
+            Canonical city, or None if the table does not know it
+        """
+        return self.city_index.lookup(str(city))
+
+    def city_key(self, city: Any) -> str:
+        """Get the canonical key identifying a city
+
+        Args:
+            city: City input (other values than strings are converted)
+
+        Returns:
+            "id:<city ID>" for known cities, the normalized input otherwise
+        """
+        resolved = self.resolve_city(city)
+        return f"id:{resolved.id}" if resolved else normalize_city(str(city))
+
+    def normalize_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the city with its canonical key so equivalent spellings
+        share cached results
+
+        Args:
+            context: Execution context
+
+        Returns:
+            Normalized context
+        """
+        city = context.get("city", self.default_city)
+        return {**context, "city": self.city_key(city)}
+
+    @property
+    def disk_cache(self) -> Optional[WeatherCache]:
+        """Persistent weather cache, or None if disabled or unavailable"""
+        if self._disk_cache_config is None:
+            return None
+        with self._disk_cache_lock:
+            if self._disk_cache is None and self._disk_cache_config is not None:
+                config = self._disk_cache_config
+                try:
+                    self._disk_cache = WeatherCache(
+                        path=config.get("path"),
+                        ttl=float(config.get("ttl", 600.0)),
+                        stale_ttl=float(config.get("stale_ttl", 3600.0)),
+                    )
+                except (sqlite3.Error, OSError) as e:
+                    # Read-only cache directory, locked database, ...
+                    self.logger.warning(
+                        f"Weather disk cache unavailable, continuing uncached: {e}"
+                    )
+                    self._disk_cache_config = None
+            return self._disk_cache
+
+    def _get_cached_weather(self, city: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Get weather data, preferring the persistent cache
+
+        Fresh entries are returned as is. Stale entries within the grace
+        window are returned immediately while a background refresh runs.
+
+        Args:
+            city: City name
+            context: Execution context
+
+        Returns:
+            Weather data dictionary
+        """
+        self._record_demand(city)
+        cached = self._get_disk_cached_weather(city)
+        if cached is not None:
+            return cached
+        return self._fetch_weather(city, self.request_timeout(context))
+
+    def on_cache_hit(self, context: Dict[str, Any]) -> None:
+        """Count result cache hits as demand for prefetching"""
+        self._record_demand(context.get("city", self.default_city))
+
+    def _record_demand(self, city: str) -> None:
+        """Record a request for a city with the prefetcher, if enabled"""
+        if self.prefetcher is not None:
+            self.prefetcher.record(self.city_key(city), city)
+
+    def _get_disk_cached_weather(self, city: str) -> Optional[Dict[str, Any]]:
+        """Get servable weather data from the persistent cache
+
+        Starts a background refresh when the entry is stale.
+
+        Args:
+            city: City name
+
+        Returns:
+            Weather data dictionary, or None on a miss
+        """
+        cache = self.disk_cache
+        if cache is None:
+            return None
+        key = self.city_key(city)
+        cached = cache.get(key, self.units)
+        if cached is None:
+            return None
+        if not cached.fresh:
+            self._refresh_in_background(city)
+        elif self.prefetcher is not None:
+            self.prefetcher.mark_fresh(key, cache.ttl - cached.age)
+        return cached.data
+
+    def _fetch_grouped(self, contexts: List[Dict[str, Any]]) -> Dict[str, PluginResult]:
+        """Look up the known cities of a batch with as few requests as possible
+
+        Cities the table does not know, or the API leaves out of a group
+        response, are not included and get looked up one by one.
+
+        Args:
+            contexts: Execution contexts
+
+        Returns:
+            Mapping of city key to result
+        """
+        by_city: Dict[str, PluginResult] = {}
+        missing: Dict[int, str] = {}  # City ID -> key, in request order
+        for context in contexts:
+            city = context.get("city", self.default_city)
+            resolved = self.resolve_city(city)
+            if resolved is None:
+                continue
+            key = f"id:{resolved.id}"
+            if key in by_city or resolved.id in missing:
+                continue
+            cached = self._get_disk_cached_weather(city)
+            if cached is not None:
+                by_city[key] = PluginResult(
+                    success=True, data=cached, plugin_name=self.name
+                )
+            else:
+                missing[resolved.id] = key
+
+        city_ids = list(missing)
+        for start in range(0, len(city_ids), self.group_size):
+            chunk = city_ids[start : start + self.group_size]
+            try:
+                fetched = self.circuit_breaker.call(
+                    self._get_group_weather, chunk, self.request_timeout(contexts[0])
+                )
+            except Exception as e:
+                for city_id in chunk:
+                    by_city[missing[city_id]] = PluginResult(
+                        success=False,
+                        error=f"Failed to get weather data: {e}",
+                        plugin_name=self.name,
+                    )
+                continue
+
+            cache = self.disk_cache
+            for city_id, weather_data in fetched.items():
+                if city_id not in missing:
+                    continue
+                if cache is not None:
+                    cache.put(missing[city_id], self.units, weather_data)
+                by_city[missing[city_id]] = PluginResult(
+                    success=True, data=weather_data, plugin_name=self.name
+                )
+        return by_city
+
+    def _fetch_weather(self, city: str, timeout: float) -> Dict[str, Any]:
+        """Fetch weather data from the API and store it in the persistent cache
+
+        Args:
+            city: City name
+            timeout: Request timeout in seconds
+
+        Returns:
+            Weather data dictionary
+        """
+        fetch = (
+            self._get_real_weather
+            if self.synthetic is None
+            else self._get_synthetic_weather
+        )
+        # Fails fast with CircuitOpenError while the API is known to be down
+        weather_data = self.circuit_breaker.call(fetch, city, timeout)
+        cache = self.disk_cache
+        if cache is not None:
+            key = self.city_key(city)
+            cache.put(key, self.units, weather_data)
+            if self.prefetcher is not None:
+                self.prefetcher.mark_fresh(key, cache.ttl)
+        return weather_data
+
+    def _prefetch(self, city: str) -> None:
+        """Refresh a hot city before its cached entry expires"""
+        self._fetch_weather(city, self.request_timeout({}))
+
+    def _refresh_in_background(self, city: str) -> None:
+        """Start refreshing a stale city unless a refresh is already running
+
+        Args:
+            city: City name
+        """
+        key = self.city_key(city)
+        with self._disk_cache_lock:
+            running = self._refreshes.get(key)
+            if running is not None and running.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._refresh,
+                args=(city,),
+                name=f"weather-refresh-{key}",
+                daemon=True,
+            )
+            self._refreshes[key] = thread
+        thread.start()
+
+    def _refresh(self, city: str) -> None:
+        key = self.city_key(city)
+        try:
+            self._fetch_weather(city, self.request_timeout({}))
+        except Exception as e:
+            self.logger.warning(f"Background refresh for {city} failed: {e}")
+        finally:
+            with self._disk_cache_lock:
+                if self._refreshes.get(key) is threading.current_thread():
+                    del self._refreshes[key]
+
+    def close(self) -> None:
+        """Wait for background refreshes so their results reach the cache"""
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        with self._disk_cache_lock:
+            refreshes = list(self._refreshes.values())
+        for thread in refreshes:
+            thread.join(self.request_timeout({}))
+        with self._disk_cache_lock:
+            cache, self._disk_cache = self._disk_cache, None
+        if cache is not None:
+            cache.close()  # Reopened if the plugin is used again
+
     def _get_mock_weather(self, city: str) -> PluginResult:
         """Get mock weather data for demo
 
@@ -69,8 +401,9 @@ class WeatherPlugin(BasePlugin):
         Returns:
             Mock weather result
         """
+        resolved = self.resolve_city(city)
         mock_data = {
-            "city": city,
+            "city": resolved.name if resolved else city,
             "temperature": "22°C",
             "description": "Partly cloudy",
             "humidity": "65%",
@@ -80,30 +413,103 @@ class WeatherPlugin(BasePlugin):
 
         return PluginResult(success=True, data=mock_data, plugin_name=self.name)
 
-    def _get_real_weather(self, city: str) -> Dict[str, Any]:
+    def _get_synthetic_weather(
+        self, city: str, timeout: float = BasePlugin.DEFAULT_REQUEST_TIMEOUT
+    ) -> Dict[str, Any]:
+        """Get generated weather data shaped like real API data
+
+        Args:
+            city: City name
+            timeout: Simulated request timeout in seconds
+
+        Returns:
+            Weather data dictionary
+        """
+        assert self.synthetic is not None
+        reading = self.synthetic.fetch(city, timeout)
+        temperature, wind = reading["temperature"], reading["wind"]
+        if self.units == "imperial":
+            temperature = temperature * 9 / 5 + 32
+            wind = wind * 2.237  # m/s to mph
+        temperature_unit, speed_unit = self.UNITS[self.units]
+        resolved = self.resolve_city(city)
+
+        return {
+            "city": resolved.name if resolved else city,
+            "temperature": f"{temperature:.1f}{temperature_unit}",
+            "description": self.synthetic.describe(reading["humidity"]),
+            "humidity": f"{reading['humidity']}%",
+            "wind": f"{wind:.1f} {speed_unit}",
+        }
+
+    def _get_real_weather(
+        self, city: str, timeout: float = BasePlugin.DEFAULT_REQUEST_TIMEOUT
+    ) -> Dict[str, Any]:
         """Get real weather data from API
 
         Args:
             city: City name
+            timeout: Request timeout in seconds
 
         Returns:
             Weather data dictionary
         """
         # Example using OpenWeatherMap API
-        base_url = "http://api.openweathermap.org/data/2.5/weather"
-        params = {"q": city, "appid": self.api_key, "units": "metric"}
+        params = {"appid": self.api_key, "units": self.units}
+        resolved = self.resolve_city(city)
+        if resolved:
+            params["id"] = resolved.id  # Unambiguous, unlike a name query
+        else:
+            params["q"] = city
+
+        response = self.http_get(
+            f"{self.base_url}/weather", params=params, timeout=timeout
+        )
+        response.raise_for_status()
+        return self._format_weather(response.json())
+
+    def _get_group_weather(
+        self, city_ids: List[int], timeout: float = BasePlugin.DEFAULT_REQUEST_TIMEOUT
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get real weather data for several cities with one request
 
-        response = requests.get(base_url, params=params, timeout=10)
+        Args:
+            city_ids: City IDs, at most GROUP_LIMIT
+            timeout: Request timeout in seconds
+
+        Returns:
+            Mapping of city ID to weather data dictionary
+        """
+        params = {
+            "id": ",".join(str(city_id) for city_id in city_ids),
+            "appid": self.api_key,
+            "units": self.units,
+        }
+        response = self.http_get(
+            f"{self.base_url}/group", params=params, timeout=timeout
+        )
         response.raise_for_status()
+        return {
+            data["id"]: self._format_weather(data) for data in response.json()["list"]
+        }
 
-        data = response.json()
+    def _format_weather(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an API weather record to plugin output
+
+        Args:
+            data: Current weather record from the API
+
+        Returns:
+            Weather data dictionary
+        """
+        temperature_unit, speed_unit = self.UNITS[self.units]
 
         return {
             "city": data["name"],
-            "temperature": f"{data['main']['temp']:.1f}°C",
+            "temperature": f"{data['main']['temp']:.1f}{temperature_unit}",
             "description": data["weather"][0]["description"].title(),
             "humidity": f"{data['main']['humidity']}%",
-            "wind": f"{data['wind']['speed']} m/s",
+            "wind": f"{data['wind']['speed']} {speed_unit}",
         }
 
     def validate_config(self) -> bool:
@@ -112,21 +518,22 @@ class WeatherPlugin(BasePlugin):
         Returns:
             True if configuration is valid
         """
-        # For mock mode, no validation needed
-        if self.use_mock:
+        # For mock and synthetic modes, no validation needed
+        if self.use_mock or self.synthetic is not None:
             return True
 
         # For real API, require API key
         return bool(self.api_key)
 
-    def get_help(self) -> str:
+    @classmethod
+    def get_help(cls) -> str:
         """Get help text for weather plugin
 
         Returns:
             Help text
         """
-        return f"""Weather Plugin ({self.version})
-Description: {self.description}
+        return f"""Weather Plugin ({cls.version})
+Description: {cls.description}
 
 Usage: --plugin weather
 
@@ -134,9 +541,32 @@ Configuration:
   - api_key: OpenWeatherMap API key (required for real data)
   - default_city: Default city name (default: Tokyo)
   - use_mock: Use mock data for demo (default: true)
+  - units: metric or imperial (default: metric)
+  - base_url: API base URL (default: http://api.openweathermap.org/data/2.5)
+  - group_size: Cities per grouped request in batches (default and max: 20)
+  - city_table: City table resolving names to city IDs (default: bundled)
+  - timeout: API request timeout in seconds (default: 10)
+  - circuit_breaker: Fail fast while the API is down (failure_threshold,
+    reset_timeout, half_open_max_calls; default: 5 failures, 30 s)
+  - single_flight: Share one lookup between concurrent identical calls
+    (default: true)
+  - cache: Result cache settings (ttl, max_entries, key_fields) or false
+    (default: 300 s per city)
+  - disk_cache: Persistent cache shared between runs (path, ttl, stale_ttl)
+    or false (default: ~/.cache/hello_project/weather.sqlite3, fresh for
+    600 s, then served stale while refreshing for up to 3600 s)
+  - synthetic: Generate deterministic per-city data in place of the API for
+    load testing (seed, error_rate, latency) or false (default: false);
+    latency takes a distribution (fixed, uniform, exponential, lognormal)
+    and its parameters in ms (ms, min_ms/max_ms, mean_ms, median_ms/sigma)
+  - prefetch: Refresh the most requested cities before they expire (top_k,
+    lead_time, max_workers, rate_limit, interval, half_life, min_requests)
+    or false (default: false; when true: top 50 cities, 60 s ahead, 2
+    workers, 1 refresh/s)
 
 Context parameters:
-  - city: City name to get weather for
+  - city: City name to get weather for, optionally with a country code
+    ("Tokyo", "London, CA")
 
 Example config.yaml:
   plugins:
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Persistent weather cache shared between processes
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .city_index import normalize_city
+from .paths import default_cache_dir
+
+
+@dataclass
+class CachedWeather:
+    """Weather data read from the persistent cache"""
+
+    data: Dict[str, Any]
+    age: float  # Seconds since the data was fetched
+    fresh: bool  # False once the entry is past its ttl (stale but usable)
+
+
+class WeatherCache:
+    """SQLite-backed weather cache with stale-while-revalidate semantics
+
+    Entries younger than ttl are fresh. Entries older than ttl but younger
+    than ttl + stale_ttl are returned as stale so callers can serve them
+    immediately and refresh in the background. The database runs in WAL
+    mode, so several processes can read and write it concurrently; within a
+    process all threads share one connection.
+    """
+
+    FILENAME = "weather.sqlite3"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: float = 600.0,
+        stale_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize weather cache
+
+        Args:
+            path: Database file (default: FILENAME in default_cache_dir())
+            ttl: Seconds an entry stays fresh
+            stale_ttl: Further seconds a stale entry may still be served
+            clock: Wall-clock time source (shared between processes)
+        """
+        self.path = Path(path) if path else default_cache_dir() / self.FILENAME
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self.logger = logging.getLogger("weather_cache")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Plugin calls run on short-lived threads, so a connection per
+        # thread would be opened (and never closed) for every lookup
+        self._conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        self._lock = threading.Lock()
+        try:
+            with self._lock, self._conn as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS weather (key TEXT PRIMARY KEY, "
+                    "data TEXT NOT NULL, fetched_at REAL NOT NULL)"
+                )
+                # Drop entries too old to be served at all
+                conn.execute(
+                    "DELETE FROM weather WHERE fetched_at < ?",
+                    (self._clock() - self.ttl - self.stale_ttl,),
+                )
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    @staticmethod
+    def make_key(city: str, units: str) -> str:
+        """Build the cache key for a city and unit system"""
+        return f"{normalize_city(city)}|{units}"
+
+    def get(self, city: str, units: str) -> Optional[CachedWeather]:
+        """Look up cached weather
+
+        Args:
+            city: City name
+            units: Unit system of the data
+
+        Returns:
+            Cached weather, or None if missing or too old to serve
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data, fetched_at FROM weather WHERE key = ?",
+                    (self.make_key(city, units),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Weather cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        age = self._clock() - row[1]
+        if age >= self.ttl + self.stale_ttl:
+            return None
+        return CachedWeather(data=json.loads(row[0]), age=age, fresh=age < self.ttl)
+
+    def put(self, city: str, units: str, data: Dict[str, Any]) -> None:
+        """Store freshly fetched weather
+
+        Args:
+            city: City name
+            units: Unit system of the data
+            data: Weather data
+        """
+        try:
+            with self._lock, self._conn as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO weather (key, data, fetched_at) "
+                    "VALUES (?, ?, ?)",
+                    (
+                        self.make_key(city, units),
+                        json.dumps(data, ensure_ascii=False),
+                        self._clock(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Weather cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from hello_project.config import ConfigManager, Settings
 from hello_project.plugins import PluginManager
+from hello_project.plugins.stats import format_stats
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -79,17 +80,33 @@ def interactive_mode(
 ) -> None:
     """Run in interactive mode
 
+    Configuration changes are picked up while the session runs: plugins
+    whose configuration changed are reconfigured, the others stay warm.
+
     Args:
         config_manager: Configuration manager
         plugin_manager: Plugin manager
     """
-    settings = config_manager.settings
+    config_manager.add_listener(lambda old, new: plugin_manager.apply_settings(new))
+    config_manager.watch()
+    try:
+        _interactive_loop(config_manager, plugin_manager)
+    finally:
+        config_manager.stop_watching()
+
+
+def _interactive_loop(
+    config_manager: ConfigManager, plugin_manager: PluginManager
+) -> None:
+    """Read and run interactive commands until the user quits"""
     print("🤖 Hello Project Interactive Mode")
     print("Type 'help' for commands, 'quit' to exit")
 
     while True:
         try:
             user_input = input("\n> ").strip()
+            # Each command sees the settings current when it starts
+            settings = config_manager.settings
 
             if user_input.lower() in ["quit", "exit", "q"]:
                 print("Goodbye! 👋")
@@ -101,13 +118,20 @@ Available commands:
   greet <name>     - Greet someone
   weather <city>   - Get weather for city
   quote            - Get an inspirational quote
+  quote search <terms> - Find quotes by text or author
   plugins          - List available plugins
+  stats            - Show plugin statistics (with --stats)
   config           - Show current configuration
   quit             - Exit interactive mode
                 """
                 )
             elif user_input.lower() == "plugins":
                 print(plugin_manager.get_plugin_help())
+            elif user_input.lower() == "stats":
+                if plugin_manager.stats is None:
+                    print("Plugin statistics are disabled. Start with --stats.")
+                else:
+                    print(format_stats(plugin_manager.get_stats()))
             elif user_input.lower() == "config":
                 print(f"Configuration:\n{settings.model_dump_json(indent=2)}")
             elif user_input.startswith("greet "):
@@ -125,6 +149,19 @@ Available commands:
                     print(weather_msg)
                 else:
                     print(f"Weather error: {result.error}")
+            elif user_input.lower().split()[:2] == ["quote", "search"]:
+                terms = user_input.split(maxsplit=2)[2:]
+                if not terms:
+                    print("Usage: quote search <terms>")
+                    continue
+                result = plugin_manager.execute_plugin("quote", {"search": terms[0]})
+                if result.success:
+                    for quote in result.data["quotes"]:
+                        print(f'"{quote["text"]}" - {quote["author"]}')
+                    if not result.data["quotes"]:
+                        print(f"No quotes match: {terms[0]}")
+                else:
+                    print(f"Quote error: {result.error}")
             elif user_input.lower() == "quote":
                 result = plugin_manager.execute_plugin("quote", {})
                 if result.success:
@@ -169,6 +206,18 @@ Examples:
         dest="plugins",
         help="Enable plugin (can be used multiple times)",
     )
+    parser.add_argument(
+        "--plugin-workers",
+        type=int,
+        default=None,
+        help="Maximum number of plugins to run concurrently (1 runs sequentially)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Overall time budget in seconds for plugins (default: api_timeout)",
+    )
     parser.add_argument(
         "--plugins-help", action="store_true", help="Show help for all plugins"
     )
@@ -179,21 +228,29 @@ Examples:
     parser.add_argument(
         "--output-format", choices=["text", "json"], help="Output format"
     )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="text",
+        choices=["text", "json"],
+        help="Print per-plugin call statistics to stderr (default format: text)",
+    )
 
     args = parser.parse_args()
 
     try:
-        # Load configuration
-        config_manager = ConfigManager(args.config)
-        settings = config_manager.load_config()
-
-        # Override settings with command line arguments
+        # Command line arguments override the configuration, also on reload
+        overrides: Dict[str, Any] = {}
         if args.name is not None:
-            settings.default_name = args.name
+            overrides["default_name"] = args.name
         if args.verbose:
-            settings.verbose = True
+            overrides["verbose"] = True
         if args.output_format:
-            settings.output_format = args.output_format
+            overrides["output_format"] = args.output_format
+
+        # Load configuration
+        config_manager = ConfigManager(args.config, overrides=overrides)
+        settings = config_manager.load_config()
 
         # Setup logging
         setup_logging(settings.verbose)
@@ -202,47 +259,60 @@ Examples:
         if settings.verbose:
             logger.info("Starting enhanced hello script")
 
-        # Initialize plugin manager
-        plugin_manager = PluginManager()
-        plugin_manager.load_external_plugins()
-
-        # Show plugins help
-        if args.plugins_help:
-            print(plugin_manager.get_plugin_help())
-            return
-
-        # Run interactive mode
-        if args.interactive:
-            interactive_mode(config_manager, plugin_manager)
-            return
-
-        # Prepare output data
-        output_data = {
-            "greeting": f"Hello, {settings.default_name}!",
-            "message": ("This is an enhanced practice repository with plugin support."),
-        }
-
-        # Execute plugins
-        plugins_to_run = args.plugins or []
-        if plugins_to_run:
-            plugins_data = {}
-            for plugin_name in plugins_to_run:
-                result = plugin_manager.execute_plugin(
-                    plugin_name, {"name": settings.default_name}
+        # Initialize plugin manager; closing it releases pooled connections
+        with PluginManager.from_settings(
+            settings, collect_stats=args.stats is not None
+        ) as plugin_manager:
+            plugin_manager.load_external_plugins()
+
+            # Show plugins help
+            if args.plugins_help:
+                print(plugin_manager.get_plugin_help())
+                return
+
+            # Run interactive mode
+            if args.interactive:
+                interactive_mode(config_manager, plugin_manager)
+                return
+
+            # Prepare output data
+            output_data = {
+                "greeting": f"Hello, {settings.default_name}!",
+                "message": (
+                    "This is an enhanced practice repository with plugin support."
+                ),
+            }
+
+            # Execute plugins
+            plugins_to_run = args.plugins or []
+            if plugins_to_run:
+                plugins_data = {}
+                results = plugin_manager.execute_many(
+                    plugins_to_run,
+                    {"name": settings.default_name},
+                    max_workers=args.plugin_workers,
+                    timeout=args.timeout,
+                )
+                for plugin_name, result in zip(plugins_to_run, results):
+                    plugins_data[plugin_name] = {
+                        "success": result.success,
+                        "data": result.data,
+                        "error": result.error,
+                    }
+
+                output_data["plugins"] = plugins_data
+
+            # Output results
+            formatted_output = format_output(
+                output_data, settings.output_format, settings.show_timestamp
+            )
+            print(formatted_output)
+
+            if args.stats:
+                print(
+                    format_stats(plugin_manager.get_stats(), args.stats),
+                    file=sys.stderr,
                 )
-                plugins_data[plugin_name] = {
-                    "success": result.success,
-                    "data": result.data,
-                    "error": result.error,
-                }
-
-            output_data["plugins"] = plugins_data
-
-        # Output results
-        formatted_output = format_output(
-            output_data, settings.output_format, settings.show_timestamp
-        )
-        print(formatted_output)
 
         if settings.verbose:
             logger.info("Script completed successfully")
@@ -2,14 +2,18 @@
 """
 Tests for configuration management
 """
+import os
 import tempfile
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 from pydantic import ValidationError
 
 from hello_project.config import ConfigManager, PluginConfig, Settings
+from hello_project.config.settings import _Inotify
 
 
 class TestSettings:
@@ -212,6 +216,119 @@ class TestConfigManager:
         finally:
             Path(temp_path).unlink()
 
+    def test_warm_load_uses_cache(self, tmp_path):
+        """Test an unchanged config file is not parsed again"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("default_name: Cached\n", encoding="utf-8")
+        first = ConfigManager(str(config_path)).load_config()
+
+        with patch.object(ConfigManager, "_load_config_file") as load:
+            second = ConfigManager(str(config_path)).load_config()
+
+        load.assert_not_called()
+        assert second == first
+        second.default_name = "Changed"
+        assert ConfigManager(str(config_path)).load_config().default_name == "Cached"
+
+    def test_cache_invalidated_by_file_and_env(self, tmp_path, monkeypatch):
+        """Test edits to the file or HELLO_* variables reload the config"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("default_name: Before\n", encoding="utf-8")
+        assert ConfigManager(str(config_path)).load_config().default_name == "Before"
+
+        config_path.write_text("default_name: After\n", encoding="utf-8")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert ConfigManager(str(config_path)).load_config().default_name == "After"
+
+        monkeypatch.setenv("HELLO_API_TIMEOUT", "42")
+        assert ConfigManager(str(config_path)).load_config().api_timeout == 42
+
+    @staticmethod
+    def _rewrite(config_path, text):
+        """Replace a config file, making sure its mtime changes"""
+        config_path.write_text(text, encoding="utf-8")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_reload_swaps_settings(self, tmp_path):
+        """Test reloading replaces changed settings and notifies listeners"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("default_name: Before\n", encoding="utf-8")
+        manager = ConfigManager(str(config_path), overrides={"verbose": True})
+        old = manager.load_config()
+        swaps = []
+        manager.add_listener(lambda *settings: swaps.append(settings))
+
+        assert manager.reload() is False
+        self._rewrite(config_path, "default_name: After\n")
+        assert manager.reload() is True
+
+        new = manager.settings
+        assert new.default_name == "After"
+        assert new.verbose is True
+        assert old.default_name == "Before"
+        assert swaps == [(old, new)]
+
+    def test_reload_keeps_settings_on_invalid_config(self, tmp_path):
+        """Test an invalid config file leaves the current settings in place"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("api_timeout: 5\n", encoding="utf-8")
+        manager = ConfigManager(str(config_path))
+        settings = manager.load_config()
+        swaps = []
+        manager.add_listener(lambda *settings: swaps.append(settings))
+
+        self._rewrite(config_path, "api_timeout: soon\n")
+
+        assert manager.reload() is False
+        assert manager.settings is settings
+        assert swaps == []
+
+    @pytest.mark.parametrize("inotify", [True, False])
+    def test_watch_reloads_changed_file(self, tmp_path, inotify):
+        """Test the watcher picks up edits, with inotify or by polling"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("default_name: Before\n", encoding="utf-8")
+        manager = ConfigManager(str(config_path))
+        reloaded = threading.Event()
+        manager.add_listener(lambda old, new: reloaded.set())
+
+        with patch.object(_Inotify, "create", wraps=_Inotify.create) as create:
+            if not inotify:
+                create.side_effect = None
+                create.return_value = None
+            manager.watch(interval=0.05)
+            try:
+                self._rewrite(config_path, "default_name: After\n")
+                assert reloaded.wait(5)
+            finally:
+                manager.stop_watching()
+
+        assert manager.settings.default_name == "After"
+
+    def test_watch_polls_without_libc(self, tmp_path):
+        """Test the watcher falls back to polling when libc cannot be found"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("default_name: Before\n", encoding="utf-8")
+        manager = ConfigManager(str(config_path))
+        reloaded = threading.Event()
+        manager.add_listener(lambda old, new: reloaded.set())
+
+        # Where dlopen(NULL) is unavailable, CDLL(None) raises TypeError
+        with patch("ctypes.util.find_library", return_value=None), patch(
+            "ctypes.CDLL", side_effect=TypeError("expected str, got NoneType")
+        ):
+            assert _Inotify.create([tmp_path]) is None
+            manager.watch(interval=0.05)
+            try:
+                self._rewrite(config_path, "default_name: After\n")
+                assert reloaded.wait(5)
+            finally:
+                manager.stop_watching()
+
+        assert manager.settings.default_name == "After"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
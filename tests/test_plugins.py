@@ -2,13 +2,56 @@
 """
 Tests for plugin system
 """
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 
-from hello_project.plugins import BasePlugin, PluginManager, PluginResult
+from hello_project.benchmark import StandinServer, run_benchmark
+from hello_project.config import PluginConfig, Settings
+from hello_project.plugins import (
+    BasePlugin,
+    PluginDescriptor,
+    PluginManager,
+    PluginResult,
+)
+from hello_project.plugins.base import DEADLINE_KEY, remaining_time
+from hello_project.plugins.cache import CachePolicy, ResultCache
+from hello_project.plugins.circuit import CircuitBreaker, CircuitOpenError
+from hello_project.plugins.city_index import CityIndex
+from hello_project.plugins.http_client import HTTPClient, HTTPConfig
+from hello_project.plugins.prefetch import PrefetchScheduler
 from hello_project.plugins.quote import QuotePlugin
+from hello_project.plugins.quote_buffer import QuoteBuffer
+from hello_project.plugins.quote_corpus import QuoteCorpus, write_corpus
+from hello_project.plugins.quote_index import QuoteIndex
+from hello_project.plugins.quote_sampler import (
+    CursorStore,
+    NoRepeatSampler,
+    Permutation,
+)
+from hello_project.plugins.quote_search import (
+    SearchIndex,
+    index_terms,
+    query_terms,
+)
+from hello_project.plugins.singleflight import SingleFlight
+from hello_project.plugins.stats import LatencyHistogram, format_stats
+from hello_project.plugins.synthetic import (
+    SyntheticUpstreamError,
+    SyntheticWeather,
+    latency_sampler,
+)
 from hello_project.plugins.weather import WeatherPlugin
+from hello_project.plugins.weather_cache import WeatherCache
 
 
 class MockPlugin(BasePlugin):
@@ -33,6 +76,154 @@ class MockPlugin(BasePlugin):
         )
 
 
+class BarrierPlugin(BasePlugin):
+    """Plugin that only succeeds when run concurrently with its peers"""
+
+    description = "Barrier plugin for testing"
+
+    def __init__(self, name, barrier):
+        super().__init__()
+        self.name = name
+        self.barrier = barrier
+
+    def execute(self, context):
+        self.barrier.wait()
+        return PluginResult(success=True, data=self.name, plugin_name=self.name)
+
+
+class AsyncMockPlugin(MockPlugin):
+    """Mock plugin with a native asyncio implementation"""
+
+    name = "async_mock"
+
+    def __init__(self, config=None, should_fail=False):
+        super().__init__(config, should_fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def execute_async(self, context):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return self.execute(context)
+        finally:
+            self.in_flight -= 1
+
+
+class BlockingPlugin(BasePlugin):
+    """Plugin that blocks until released, recording its deadline"""
+
+    name = "blocking"
+    description = "Blocking plugin for testing"
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.remaining = None
+
+    def execute(self, context):
+        self.remaining = remaining_time(context)
+        self.release.wait(5)
+        return PluginResult(success=True, plugin_name=self.name)
+
+
+class ProcessPlugin(BasePlugin):
+    """CPU-bound plugin that runs in the worker process pool"""
+
+    name = "process"
+    description = "Process plugin for testing"
+    execution_mode = "process"
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.calls = 0
+
+    def execute(self, context):
+        self.calls += 1
+        return PluginResult(
+            success=True,
+            data={
+                "pid": os.getpid(),
+                "calls": self.calls,
+                "total": sum(range(context["n"])),
+            },
+            plugin_name=self.name,
+        )
+
+
+class CountingPlugin(BasePlugin):
+    """Plugin with a cache policy that counts real executions"""
+
+    name = "counting"
+    description = "Counting plugin for testing"
+    cache_policy = CachePolicy(ttl=60, max_entries=2, key_fields=("city",))
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.calls = 0
+
+    def execute(self, context):
+        self.calls += 1
+        if context.get("city") == "nowhere":
+            return PluginResult(success=False, error="unknown city")
+        return PluginResult(success=True, data={"city": context.get("city")})
+
+
+class SlowPlugin(BasePlugin):
+    """Deterministic slow plugin whose identical calls may be coalesced"""
+
+    name = "slow"
+    description = "Slow plugin for testing"
+    single_flight = True
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.calls = 0
+
+    def execute(self, context):
+        self.calls += 1
+        time.sleep(0.2)
+        return PluginResult(success=True, data={"city": context.get("city")})
+
+
+class ReconfigurablePlugin(BasePlugin):
+    """Plugin answering with its configured label, optionally blocking"""
+
+    name = "reconfigurable"
+    description = "Reconfigurable plugin for testing"
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.closed = False
+
+    def execute(self, context):
+        self.started.set()
+        if self.config.get("block"):
+            self.release.wait(5)
+        return PluginResult(success=True, data=self.config.get("label"))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep persistent plugin caches out of the user's cache directory"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def hanging_server():
+    """URL of a server that accepts connections but never responds"""
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        yield f"http://127.0.0.1:{server.getsockname()[1]}"
+
+
 class TestPluginResult:
     """Test cases for PluginResult"""
 
@@ -103,6 +294,45 @@ class TestPluginManager:
         assert "weather" in manager.plugins
         assert "quote" in manager.plugins
 
+    def test_builtin_plugins_are_lazy(self):
+        """Test built-in plugins are only instantiated on first use"""
+        manager = PluginManager()
+
+        assert manager.list_plugins() == ["weather", "quote"]
+        assert "weather:" in manager.get_plugin_help()
+        assert manager.plugins.is_loaded("weather") is False
+
+        assert isinstance(manager.get_plugin("weather"), WeatherPlugin)
+        assert manager.plugins.is_loaded("weather") is True
+        assert manager.plugins.is_loaded("quote") is False
+
+    def test_import_does_not_load_plugin_dependencies(self):
+        """Test cold start does not import requests, asyncio or multiprocessing"""
+        code = (
+            "import sys\n"
+            "from hello_project.plugins import PluginManager\n"
+            "manager = PluginManager()\n"
+            "manager.get_plugin_help()\n"
+            "assert 'requests' not in sys.modules, 'requests imported'\n"
+            "assert 'asyncio' not in sys.modules, 'asyncio imported'\n"
+            "assert 'multiprocessing' not in sys.modules, 'multiprocessing imported'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_lazy_plugin_load_failure(self):
+        """Test a descriptor that cannot be imported fails in isolation"""
+        manager = PluginManager()
+        manager.register_descriptor(
+            PluginDescriptor("broken", "Broken plugin", "hello_project:Missing")
+        )
+
+        assert "broken" in manager.list_plugins()
+        assert manager.get_plugin("broken") is None
+
+        result = manager.execute_plugin("broken", {})
+        assert result.success is False
+        assert "Missing" in result.error
+
     def test_register_plugin(self):
         """Test plugin registration"""
         manager = PluginManager()
@@ -177,6 +407,85 @@ class TestPluginManager:
         assert "Plugin 'nonexistent' not found" in result.error
         assert result.plugin_name == "nonexistent"
 
+    def test_execute_many_runs_concurrently(self):
+        """Test execute_many overlaps plugin execution"""
+        manager = PluginManager()
+        barrier = threading.Barrier(3, timeout=5)
+        for name in ["first", "second", "third"]:
+            manager.register_plugin(BarrierPlugin(name, barrier))
+
+        results = manager.execute_many(["third", "first", "second"], {})
+
+        assert [r.success for r in results] == [True, True, True]
+        assert [r.data for r in results] == ["third", "first", "second"]
+
+    def test_execute_many_isolates_failures(self):
+        """Test execute_many keeps per-plugin failures isolated"""
+        manager = PluginManager()
+        manager.register_plugin(MockPlugin(should_fail=True))
+
+        results = manager.execute_many(["mock", "quote", "nonexistent"], {})
+
+        assert len(results) == 3
+        assert results[0].success is False
+        assert "Mock plugin failure" in results[0].error
+        assert results[1].success is True
+        assert results[1].plugin_name == "quote"
+        assert results[2].success is False
+        assert "not found" in results[2].error
+
+    def test_execute_many_sequential(self):
+        """Test execute_many with a single worker"""
+        manager = PluginManager()
+        manager.register_plugin(MockPlugin())
+
+        results = manager.execute_many(["mock", "mock"], {"a": 1}, max_workers=1)
+
+        assert [r.data["context"] for r in results] == [{"a": 1}, {"a": 1}]
+        assert manager.execute_many([], {}) == []
+        with pytest.raises(ValueError, match="max_workers"):
+            manager.execute_many(["mock", "mock"], {}, max_workers=0)
+
+    def test_execute_plugin_async_default(self):
+        """Test async execution of a synchronous plugin"""
+        manager = PluginManager()
+        manager.register_plugin(MockPlugin())
+
+        result = asyncio.run(manager.execute_plugin_async("mock", {"a": 1}))
+
+        assert result.success is True
+        assert result.plugin_name == "mock"
+        assert result.data["context"] == {"a": 1}
+
+    def test_execute_plugin_async_failure(self):
+        """Test async execution isolates failures"""
+        manager = PluginManager()
+        manager.register_plugin(AsyncMockPlugin(should_fail=True))
+
+        failed = asyncio.run(manager.execute_plugin_async("async_mock", {}))
+        missing = asyncio.run(manager.execute_plugin_async("nonexistent", {}))
+
+        assert failed.success is False
+        assert "Mock plugin failure" in failed.error
+        assert missing.success is False
+        assert "not found" in missing.error
+
+    def test_execute_many_async(self):
+        """Test gather-style async execution keeps order and bounds"""
+        manager = PluginManager()
+        plugin = AsyncMockPlugin()
+        manager.register_plugin(plugin)
+
+        names = ["async_mock"] * 10 + ["quote"]
+        results = asyncio.run(manager.execute_many_async(names, {}, concurrency=3))
+
+        assert [r.plugin_name for r in results] == names
+        assert all(r.success for r in results)
+        assert plugin.max_in_flight == 3
+
+        results = asyncio.run(manager.execute_many_async(names[:10], {}))
+        assert plugin.max_in_flight == 10
+
     def test_get_plugin_help(self):
         """Test getting plugin help"""
         manager = PluginManager()
@@ -190,12 +499,1791 @@ class TestPluginManager:
         # Test help for specific plugin
         weather_help = manager.get_plugin_help("weather")
         assert "Weather Plugin" in weather_help
+        assert not manager.plugins.is_loaded("weather")
 
         # Test help for non-existent plugin
         no_help = manager.get_plugin_help("nonexistent")
         assert "Plugin 'nonexistent' not found" in no_help
 
 
+EXTERNAL_PLUGIN_SOURCE = """
+from pathlib import Path
+
+from hello_project.plugins.base import BasePlugin, PluginResult
+
+with open(Path(__file__).with_suffix(".imports"), "a") as f:
+    f.write("x")
+
+
+class GreeterPlugin(BasePlugin):
+    name = "greeter"
+    description = "{description}"
+
+    def execute(self, context):
+        return PluginResult(success=True, data="hi " + context["name"])
+"""
+
+
+class TestDeadlines:
+    """Test cases for deadline-aware plugin execution"""
+
+    def test_execute_plugin_timeout(self):
+        """Test an overrunning plugin is abandoned"""
+        manager = PluginManager()
+        plugin = BlockingPlugin()
+        manager.register_plugin(plugin)
+
+        started = time.monotonic()
+        result = manager.execute_plugin("blocking", {}, timeout=0.05)
+        plugin.release.set()
+
+        assert time.monotonic() - started < 1
+        assert result.success is False
+        assert "timed out" in result.error
+        assert result.plugin_name == "blocking"
+        assert 0 < plugin.remaining <= 0.05
+
+    def test_default_timeout_and_context_deadline(self):
+        """Test default_timeout applies and an earlier context deadline wins"""
+        manager = PluginManager(default_timeout=0.05)
+        plugin = BlockingPlugin()
+        manager.register_plugin(plugin)
+
+        assert manager.execute_plugin("blocking", {}).success is False
+
+        deadline = time.monotonic() + 0.01
+        result = manager.execute_plugin(
+            "blocking", {DEADLINE_KEY: deadline}, timeout=10
+        )
+        plugin.release.set()
+        assert result.success is False
+        assert plugin.remaining <= 0.01
+
+    def test_execute_many_shares_budget(self):
+        """Test execute_many returns fast results and times out slow ones"""
+        manager = PluginManager()
+        plugin = BlockingPlugin()
+        manager.register_plugin(plugin)
+        manager.register_plugin(MockPlugin())
+
+        results = manager.execute_many(["blocking", "mock"], {}, timeout=0.1)
+        plugin.release.set()
+
+        assert results[0].success is False
+        assert "timed out" in results[0].error
+        assert results[1].success is True
+
+    def test_abandoned_calls_do_not_delay_exit(self):
+        """Test plugins still running past the deadline do not block exit"""
+        code = (
+            "import time\n"
+            "from hello_project.plugins import BasePlugin, PluginManager\n"
+            "class Hang(BasePlugin):\n"
+            "    name = 'hang'\n"
+            "    def execute(self, context):\n"
+            "        time.sleep(30)\n"
+            "manager = PluginManager()\n"
+            "manager.register_plugin(Hang())\n"
+            "manager.execute_many(['hang', 'hang'], {}, timeout=0.2)\n"
+        )
+        started = time.monotonic()
+
+        subprocess.run([sys.executable, "-c", code], check=True, timeout=20)
+
+        assert time.monotonic() - started < 10
+
+    def test_abandoned_async_calls_do_not_delay_exit(self):
+        """Test sync plugins abandoned by async callers do not block exit"""
+        code = (
+            "import asyncio, time\n"
+            "from hello_project.plugins import BasePlugin, PluginManager\n"
+            "class Hang(BasePlugin):\n"
+            "    name = 'hang'\n"
+            "    def execute(self, context):\n"
+            "        time.sleep(30)\n"
+            "manager = PluginManager()\n"
+            "manager.register_plugin(Hang())\n"
+            "asyncio.run(manager.execute_plugin_async('hang', {}, timeout=0.2))\n"
+        )
+        started = time.monotonic()
+
+        subprocess.run([sys.executable, "-c", code], check=True, timeout=20)
+
+        assert time.monotonic() - started < 10
+
+    def test_execute_plugin_async_timeout(self):
+        """Test async execution honours the time budget"""
+        manager = PluginManager()
+        plugin = BlockingPlugin()
+        manager.register_plugin(plugin)
+
+        async def run():
+            result = await manager.execute_plugin_async("blocking", {}, timeout=0.05)
+            # Let the abandoned thread finish
+            plugin.release.set()
+            return result
+
+        result = asyncio.run(run())
+
+        assert result.success is False
+        assert "timed out" in result.error
+
+    def test_request_timeout(self):
+        """Test plugin request timeouts are capped by the deadline"""
+        plugin = MockPlugin({"timeout": 3})
+
+        assert plugin.request_timeout({}) == 3
+        assert plugin.request_timeout({DEADLINE_KEY: time.monotonic() + 1}) <= 1
+        with pytest.raises(TimeoutError):
+            plugin.request_timeout({DEADLINE_KEY: time.monotonic() - 1})
+
+    @patch("requests.Session.get")
+    def test_deadline_reaches_http_call(self, mock_get):
+        """Test plugin HTTP calls receive the remaining budget"""
+        quotes = [{"content": "Q", "author": "A"}] * 50
+        mock_get.return_value.json.return_value = quotes
+        manager = PluginManager()
+        manager.register_plugin(QuotePlugin({"use_api": True}))
+
+        result = manager.execute_plugin("quote", {}, timeout=2)
+
+        assert result.data["source"] == "api"
+        assert 0 < mock_get.call_args.kwargs["timeout"] <= 2
+
+    def test_fallback_within_default_budget(self, hanging_server):
+        """Test a hanging API still leaves time for the built-in fallback"""
+        settings = Settings(api_timeout=1)
+        with PluginManager.from_settings(settings) as manager:
+            manager.register_plugin(
+                QuotePlugin({"use_api": True, "base_url": hanging_server})
+            )
+
+            result = manager.execute_plugin("quote", {})
+
+        assert result.success is True
+        assert result.data["source"] == "built-in"
+
+
+class TestProcessExecution:
+    """Test cases for the process pool execution mode"""
+
+    def test_process_mode_reuses_warm_workers(self):
+        """Test process plugins run in persistent worker processes"""
+        with PluginManager(process_workers=1) as manager:
+            manager.register_plugin(ProcessPlugin())
+
+            first = manager.execute_plugin("process", {"n": 10})
+            second = manager.execute_plugin("process", {"n": 100})
+
+        assert first.success is True
+        assert first.plugin_name == "process"
+        assert first.data["total"] == 45
+        assert first.data["pid"] != os.getpid()
+        assert second.data["pid"] == first.data["pid"]
+        assert second.data["calls"] == 2
+
+    def test_process_mode_async_and_failures(self):
+        """Test async process execution and failure isolation"""
+        with PluginManager(process_workers=1) as manager:
+            manager.register_plugin(ProcessPlugin())
+
+            result = asyncio.run(manager.execute_plugin_async("process", {"n": 3}))
+            failed = manager.execute_plugin("process", {})
+
+        assert result.success is True
+        assert result.data["total"] == 3
+        assert failed.success is False
+        assert "n" in failed.error
+
+    def test_execution_mode_config_override(self):
+        """Test the execution mode can be overridden through config"""
+        manager = PluginManager()
+        manager.register_plugin(ProcessPlugin({"execution_mode": "thread"}))
+
+        result = manager.execute_plugin("process", {"n": 3})
+
+        assert result.data["pid"] == os.getpid()
+        with pytest.raises(ValueError, match="Unknown execution mode"):
+            ProcessPlugin({"execution_mode": "gpu"})
+
+
+class TestResultCache:
+    """Test cases for plugin result memoization"""
+
+    def test_lru_eviction_and_expiry(self):
+        """Test the cache is bounded and entries expire"""
+        now = [0.0]
+        cache = ResultCache(max_entries=2, ttl=10, clock=lambda: now[0])
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)  # evicts "b", the least recently used
+
+        assert cache.get("b") is None
+        now[0] = 11
+        assert cache.get("a") is None
+
+        stats = cache.stats
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert (stats.evictions, stats.expirations) == (1, 1)
+        assert stats.size == 1
+
+    def test_manager_memoizes_by_key_fields(self):
+        """Test repeated calls are answered from the cache"""
+        manager = PluginManager()
+        plugin = CountingPlugin()
+        manager.register_plugin(plugin)
+
+        first = manager.execute_plugin("counting", {"city": "Tokyo", "name": "a"})
+        second = manager.execute_plugin("counting", {"city": "Tokyo", "name": "b"})
+        manager.execute_plugin("counting", {"city": "Osaka"}, timeout=5)
+        manager.execute_plugin("counting", {"city": "Osaka"})
+
+        assert plugin.calls == 2
+        assert second.data == first.data
+        assert second.plugin_name == "counting"
+        stats = manager.cache_stats()["counting"]
+        assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+        manager.clear_cache("counting")
+        manager.execute_plugin("counting", {"city": "Tokyo"})
+        assert plugin.calls == 3
+
+    def test_cached_data_is_not_shared(self):
+        """Test callers editing a result do not change what the cache returns"""
+        manager = PluginManager()
+        manager.register_plugin(CountingPlugin())
+
+        first = manager.execute_plugin("counting", {"city": "Tokyo"})
+        first.data["city"] = "edited"
+        second = manager.execute_plugin("counting", {"city": "Tokyo"})
+        assert second.data == {"city": "Tokyo"}
+        second.data["city"] = "edited"
+        third = manager.execute_plugin("counting", {"city": "Tokyo"})
+
+        assert third.data == {"city": "Tokyo"}
+
+    def test_failures_are_not_cached(self):
+        """Test only successful results are memoized"""
+        manager = PluginManager()
+        plugin = CountingPlugin()
+        manager.register_plugin(plugin)
+
+        manager.execute_plugin("counting", {"city": "nowhere"})
+        manager.execute_many(["counting", "counting"], {"city": "nowhere"})
+
+        assert plugin.calls == 3
+
+    def test_cache_policy_config_override(self):
+        """Test plugins can tune or disable caching through config"""
+        assert CountingPlugin({"cache": False}).cache_policy is None
+        assert CountingPlugin({"cache": {"ttl": 5}}).cache_policy == CachePolicy(
+            ttl=5, max_entries=2, key_fields=("city",)
+        )
+        assert MockPlugin({"cache": True}).cache_policy == CachePolicy()
+        with pytest.raises(ValueError, match="ttl"):
+            CachePolicy(ttl=0)
+
+    def test_async_execution_uses_cache(self):
+        """Test async execution shares the result cache"""
+        manager = PluginManager()
+        plugin = CountingPlugin()
+        manager.register_plugin(plugin)
+
+        results = asyncio.run(
+            manager.execute_many_async(["counting"] * 3, {"city": "Tokyo"}, 1)
+        )
+
+        assert all(r.success for r in results)
+        assert plugin.calls == 1
+
+
+class TestBatchExecution:
+    """Test cases for batch plugin execution"""
+
+    def test_default_execute_batch_isolates_failures(self):
+        """Test the default execute_batch runs each context"""
+        plugin = CountingPlugin({"cache": False})
+
+        results = plugin.execute_batch([{"city": "a"}, {"city": "nowhere"}])
+        failing = MockPlugin(should_fail=True).execute_batch([{}, {}])
+
+        assert [r.success for r in results] == [True, False]
+        assert plugin.calls == 2
+        assert [r.error for r in failing] == ["Mock plugin failure"] * 2
+
+    def test_execute_plugin_batch_uses_cache(self):
+        """Test only uncached contexts reach the plugin"""
+        manager = PluginManager()
+        plugin = CountingPlugin()
+        manager.register_plugin(plugin)
+        manager.execute_plugin("counting", {"city": "Tokyo"})
+
+        with patch.object(plugin, "execute_batch", wraps=plugin.execute_batch) as spy:
+            results = manager.execute_plugin_batch(
+                "counting", [{"city": "Tokyo"}, {"city": "Osaka"}], timeout=5
+            )
+
+        assert [r.data["city"] for r in results] == ["Tokyo", "Osaka"]
+        assert all(r.plugin_name == "counting" for r in results)
+        assert [c["city"] for c in spy.call_args.args[0]] == ["Osaka"]
+        assert manager.cache_stats()["counting"].size == 2
+
+    def test_execute_plugin_batch_failures(self):
+        """Test batch-level failures fail every covered context"""
+        manager = PluginManager()
+        plugin = MockPlugin()
+        manager.register_plugin(plugin)
+
+        with patch.object(plugin, "execute_batch", return_value=[]):
+            results = manager.execute_plugin_batch("mock", [{}, {}])
+        missing = manager.execute_plugin_batch("nonexistent", [{}])
+
+        assert [r.success for r in results] == [False, False]
+        assert "returned 0 results for 2 contexts" in results[0].error
+        assert "not found" in missing[0].error
+
+    def test_weather_batch_dedupes_cities(self):
+        """Test the weather plugin looks each city up once per batch"""
+        plugin = WeatherPlugin()
+        contexts = [{"city": "Tokyo"}, {"city": "Osaka"}, {"city": "Tokyo"}, {}]
+
+        with patch.object(
+            plugin, "_get_mock_weather", wraps=plugin._get_mock_weather
+        ) as spy:
+            results = plugin.execute_batch(contexts)
+
+        assert [r.data["city"] for r in results] == ["Tokyo", "Osaka"] + ["Tokyo"] * 2
+        assert spy.call_count == 2
+
+    def test_quote_batch(self):
+        """Test the quote plugin draws a batch of built-in quotes"""
+        results = QuotePlugin().execute_batch([{}] * 5)
+
+        assert len(results) == 5
+        assert all(r.data["source"] == "built-in" for r in results)
+
+
+class TestCircuitBreaker:
+    """Test cases for the circuit breaker"""
+
+    def make_breaker(self, now, **kwargs):
+        return CircuitBreaker(
+            "test",
+            failure_threshold=2,
+            reset_timeout=10,
+            clock=lambda: now[0],
+            **kwargs,
+        )
+
+    def fail(self):
+        raise ConnectionError("down")
+
+    def test_opens_after_threshold_and_probes(self):
+        """Test the closed -> open -> half open -> closed cycle"""
+        now = [0.0]
+        breaker = self.make_breaker(now)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call(self.fail)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "never called")
+
+        now[0] = 10
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False  # only one probe at a time
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.call(lambda: "ok") == "ok"
+
+    def test_failed_probe_reopens(self):
+        """Test a failed half-open probe re-opens the circuit"""
+        now = [0.0]
+        breaker = self.make_breaker(now)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        now[0] = 10
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+
+        assert breaker.state == CircuitBreaker.OPEN
+        now[0] = 19
+        assert breaker.allow_request() is False
+
+    def test_ignored_failures(self):
+        """Test errors rejected by is_failure do not open the circuit"""
+        breaker = self.make_breaker([0.0], is_failure=lambda e: False)
+
+        for _ in range(5):
+            with pytest.raises(ConnectionError):
+                breaker.call(self.fail)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @patch("requests.get")
+    def test_quote_plugin_falls_back_fast_when_open(self, mock_get):
+        """Test the quote plugin stops calling a failing API"""
+        mock_get.side_effect = ConnectionError("API down")
+        plugin = QuotePlugin(
+            {"use_api": True, "circuit_breaker": {"failure_threshold": 2}}
+        )
+
+        results = [plugin.execute({}) for _ in range(5)]
+
+        assert all(r.data["source"] == "built-in" for r in results)
+        assert mock_get.call_count == 2
+        assert plugin.circuit_breaker.state == CircuitBreaker.OPEN
+
+    @patch("requests.get")
+    def test_weather_client_errors_do_not_trip(self, mock_get):
+        """Test HTTP 4xx answers keep the weather circuit closed"""
+        import requests
+
+        not_found = requests.HTTPError("404 Not Found")
+        not_found.response = Mock(status_code=404)
+        mock_get.return_value.raise_for_status.side_effect = not_found
+        plugin = WeatherPlugin(
+            {
+                "use_mock": False,
+                "api_key": "k",
+                "circuit_breaker": {"failure_threshold": 1},
+            }
+        )
+
+        results = [plugin.execute({"city": "Atlantis"}) for _ in range(3)]
+
+        assert all("404" in r.error for r in results)
+        assert mock_get.call_count == 3
+        assert plugin.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+class TestWeatherDiskCache:
+    """Test cases for the persistent weather cache"""
+
+    WEATHER = {"city": "Tokyo", "temperature": "20.0°C"}
+
+    def test_fresh_stale_and_expired(self, tmp_path):
+        """Test entries turn stale after ttl and vanish after the grace window"""
+        now = [1000.0]
+        cache = WeatherCache(
+            tmp_path / "w.sqlite3", ttl=10, stale_ttl=20, clock=lambda: now[0]
+        )
+        cache.put("  tokyo ", "metric", self.WEATHER)
+
+        cached = cache.get("Tokyo", "metric")
+        assert cached.fresh is True
+        assert cached.data == self.WEATHER
+        assert cache.get("Tokyo", "imperial") is None
+
+        now[0] += 15
+        assert cache.get("TOKYO", "metric").fresh is False
+
+        now[0] += 20
+        assert cache.get("Tokyo", "metric") is None
+
+    def test_shared_between_connections(self, tmp_path):
+        """Test separate cache instances see each other's writes"""
+        path = tmp_path / "w.sqlite3"
+        writer = WeatherCache(path)
+        reader = WeatherCache(path)
+
+        writer.put("Tokyo", "metric", self.WEATHER)
+
+        assert reader.get("tokyo", "metric").data == self.WEATHER
+        mode = reader._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_threads_share_one_connection(self, tmp_path):
+        """Test lookups from short-lived threads do not open connections"""
+        cache = WeatherCache(tmp_path / "w.sqlite3")
+        cache.put("Tokyo", "metric", self.WEATHER)
+
+        with patch("sqlite3.connect") as connect:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(lambda _: cache.get("Tokyo", "metric"), range(8))
+                )
+
+        connect.assert_not_called()
+        assert all(r.data == self.WEATHER for r in results)
+        cache.close()
+
+    @patch("requests.get")
+    def test_reused_across_plugin_instances(self, mock_get):
+        """Test a later run is served from disk without calling the API"""
+        mock_get.return_value.json.return_value = {
+            "name": "Tokyo",
+            "main": {"temp": 20.0, "humidity": 50},
+            "weather": [{"description": "clear sky"}],
+            "wind": {"speed": 3.0},
+        }
+        config = {"use_mock": False, "api_key": "k"}
+
+        first = WeatherPlugin(config).execute({"city": "Tokyo"})
+        second = WeatherPlugin(config).execute({"city": "tokyo"})
+
+        assert first.success and second.success
+        assert second.data == first.data
+        assert mock_get.call_count == 1
+
+    def test_stale_served_while_refreshing(self, tmp_path):
+        """Test stale data is returned at once and refreshed in the background"""
+        plugin = WeatherPlugin(
+            {
+                "use_mock": False,
+                "api_key": "k",
+                "disk_cache": {"path": str(tmp_path / "w.sqlite3"), "ttl": 1},
+            }
+        )
+        key = plugin.city_key("Tokyo")
+        plugin.disk_cache._clock = lambda: time.time() - 5  # Write stale entries
+        plugin.disk_cache.put(key, "metric", self.WEATHER)
+        plugin.disk_cache._clock = time.time
+
+        release = threading.Event()
+        refreshed = {"city": "Tokyo", "temperature": "25.0°C"}
+
+        def slow_fetch(city, timeout):
+            release.wait(5)
+            return refreshed
+
+        with patch.object(plugin, "_get_real_weather", side_effect=slow_fetch):
+            result = plugin.execute({"city": "Tokyo"})
+            assert result.data == self.WEATHER
+
+            release.set()
+            plugin.close()
+
+        assert plugin.disk_cache.get(key, "metric").data == refreshed
+
+    def test_disabled(self):
+        """Test disk_cache: false turns the persistent cache off"""
+        assert WeatherPlugin({"disk_cache": False}).disk_cache is None
+
+    @pytest.mark.parametrize("unusable", ["file", "directory"])
+    @patch("requests.get")
+    def test_unavailable_runs_uncached(self, mock_get, tmp_path, unusable):
+        """Test weather still works when the cache database cannot be opened"""
+        mock_get.return_value.json.return_value = {
+            "name": "Tokyo",
+            "main": {"temp": 20.0, "humidity": 50},
+            "weather": [{"description": "clear sky"}],
+            "wind": {"speed": 3.0},
+        }
+        blocker = tmp_path / "blocker"
+        if unusable == "file":
+            blocker.write_text("")  # The cache directory cannot be created
+            path = blocker / "w.sqlite3"
+        else:
+            blocker.mkdir()  # SQLite cannot open a directory
+            path = blocker
+        plugin = WeatherPlugin(
+            {"use_mock": False, "api_key": "k", "disk_cache": {"path": str(path)}}
+        )
+
+        result = plugin.execute({"city": "Tokyo"})
+
+        assert result.success is True
+        assert result.data["city"] == "Tokyo"
+        assert plugin.disk_cache is None
+
+
+class TestCityIndex:
+    """Test cases for city normalization and canonical city IDs"""
+
+    def test_lookup_variants(self):
+        """Test spellings of one city resolve to the same ID"""
+        index = CityIndex()
+
+        ids = {index.lookup(c).id for c in ["Tokyo", "tokyo", " Tokyo ", "Tokyo, JP"]}
+
+        assert ids == {1850147}
+        assert index.lookup("東京").name == "Tokyo"
+        assert index.lookup("Tokyo, FR") is None
+        assert index.lookup("Atlantis") is None
+
+    def test_country_disambiguation(self):
+        """Test the most prominent city wins unless a country is given"""
+        index = CityIndex()
+
+        assert index.lookup("London").country == "GB"
+        assert index.lookup("london, ca").country == "CA"
+
+    def test_table_edges(self, tmp_path):
+        """Test binary search finds the first and last rows of a table"""
+        table = tmp_path / "cities.tsv"
+        table.write_text(
+            "alpha\t0000\tAA\t1\tAlpha\nmid\t0000\tMM\t2\tMid\n"
+            "zulu\t0000\tZZ\t3\tZulu\nzulu\t0001\tYY\t4\tZulu\n",
+            encoding="utf-8",
+        )
+        index = CityIndex(table)
+
+        assert [index.lookup(n).id for n in ["alpha", "mid", "zulu", "Zulu, YY"]] == [
+            1,
+            2,
+            3,
+            4,
+        ]
+        assert index.lookup("beta") is None
+        assert index.lookup("zz") is None
+
+    @patch("requests.Session.get")
+    def test_queries_upstream_by_id(self, mock_get):
+        """Test known cities are fetched by ID and share one cache entry"""
+        mock_get.return_value.json.return_value = {
+            "name": "Tokyo",
+            "main": {"temp": 20.0, "humidity": 50},
+            "weather": [{"description": "clear sky"}],
+            "wind": {"speed": 3.0},
+        }
+        plugin = WeatherPlugin({"use_mock": False, "api_key": "k"})
+        manager = PluginManager()
+        manager.register_plugin(plugin)
+
+        for city in ["Tokyo", "tokyo", "Tokyo, JP"]:
+            assert manager.execute_plugin("weather", {"city": city}).success
+
+        assert mock_get.call_count == 1
+        params = mock_get.call_args.kwargs["params"]
+        assert params["id"] == 1850147
+        assert "q" not in params
+
+    def test_batch_dedupes_spellings(self):
+        """Test a batch looks up equivalent spellings once"""
+        plugin = WeatherPlugin()
+        with patch.object(plugin, "execute", wraps=plugin.execute) as spy:
+            results = plugin.execute_batch(
+                [{"city": "Tokyo"}, {"city": " tokyo"}, {"city": "Osaka"}]
+            )
+
+        assert spy.call_count == 2
+        assert [r.data["city"] for r in results] == ["Tokyo", "Tokyo", "Osaka"]
+
+
+class TestGroupedWeather:
+    """Test cases for grouped multi-city weather fetches"""
+
+    @staticmethod
+    def fake_api(url, params=None, timeout=None):
+        """Answer /weather and /group requests like OpenWeatherMap"""
+
+        def record(city_id):
+            return {
+                "id": city_id,
+                "name": f"City {city_id}",
+                "main": {"temp": 20.0, "humidity": 50},
+                "weather": [{"description": "clear sky"}],
+                "wind": {"speed": 3.0},
+            }
+
+        response = Mock()
+        if url.endswith("/group"):
+            ids = [int(i) for i in params["id"].split(",")]
+            # Leave out Osaka to exercise the one-by-one fallback
+            response.json.return_value = {
+                "list": [record(i) for i in ids if i != 1853909]
+            }
+        else:
+            response.json.return_value = record(params.get("id", 0))
+        return response
+
+    @patch("requests.get")
+    def test_batch_packs_city_ids(self, mock_get):
+        """Test known cities are fetched in groups of group_size"""
+        mock_get.side_effect = self.fake_api
+        plugin = WeatherPlugin(
+            {
+                "use_mock": False,
+                "api_key": "k",
+                "group_size": 3,
+                "base_url": "http://localhost:8080/data/2.5/",
+                "disk_cache": False,
+            }
+        )
+        cities = ["Tokyo", "tokyo", "Kyoto", "London", "Paris", "Berlin", "Osaka"]
+
+        results = plugin.execute_batch([{"city": c} for c in cities + ["Atlantis"]])
+
+        assert all(r.success for r in results)
+        assert results[0].data == results[1].data
+        base_url = "http://localhost:8080/data/2.5"
+        urls = [c.args[0] for c in mock_get.call_args_list]
+        assert urls == [f"{base_url}/group"] * 2 + [f"{base_url}/weather"] * 2
+        assert mock_get.call_args.kwargs["params"]["q"] == "Atlantis"
+
+    @patch("requests.get")
+    def test_failed_group_fails_its_cities(self, mock_get):
+        """Test a failed group request reports an error for each of its cities"""
+        mock_get.side_effect = ConnectionError("down")
+        plugin = WeatherPlugin({"use_mock": False, "api_key": "k"})
+
+        results = plugin.execute_batch([{"city": "Tokyo"}, {"city": "Kyoto"}])
+
+        assert mock_get.call_count == 1
+        assert [r.success for r in results] == [False, False]
+        assert "down" in results[0].error
+
+    def test_group_size_capped(self):
+        """Test group_size cannot exceed the provider limit"""
+        assert (
+            WeatherPlugin({"group_size": 500}).group_size == WeatherPlugin.GROUP_LIMIT
+        )
+        with pytest.raises(ValueError):
+            WeatherPlugin({"group_size": 0})
+
+
+class TestPrefetch:
+    """Test cases for background prefetching of hot weather cities"""
+
+    def test_refreshes_hot_keys_within_budget(self):
+        """Test only hot, expiring keys are refreshed, within worker and rate limits"""
+        now = [0.0]
+        refreshed = []
+
+        def refresh(arg):
+            refreshed.append(arg)
+            scheduler.mark_fresh(arg, 100)
+
+        scheduler = PrefetchScheduler(
+            refresh,
+            lead_time=10,
+            max_workers=1,
+            rate_limit=1,
+            interval=3600,
+            clock=lambda: now[0],
+        )
+        for key, requests in [("a", 3), ("b", 2), ("c", 1)]:
+            for _ in range(requests):
+                scheduler.record(key, key)
+            scheduler.mark_fresh(key, 100)
+
+        assert scheduler.run_pending() == 0
+
+        now[0] = 95
+        assert scheduler.run_pending() == 1
+        assert scheduler.run_pending() == 0  # Worker and rate budgets used up
+        while scheduler._in_flight:
+            time.sleep(0.001)
+        now[0] = 96
+        assert scheduler.run_pending() == 1
+        scheduler.close()
+
+        assert refreshed == ["a", "b"]  # c is below min_requests
+        assert scheduler.due() == []
+
+    def test_counts_decay(self):
+        """Test request counts halve every half_life"""
+        now = [0.0]
+        scheduler = PrefetchScheduler(
+            Mock(), half_life=10, interval=3600, clock=lambda: now[0]
+        )
+        for _ in range(2):
+            scheduler.record("a", "a")
+        scheduler.mark_fresh("a", 0)
+        assert [key for key, _ in scheduler.due()] == ["a"]
+
+        now[0] = 10
+        scheduler._tokens = 0  # Only let the decay happen
+        scheduler.run_pending()
+        scheduler.close()
+
+        assert scheduler.due() == []
+
+    def test_weather_plugin_prefetches(self, tmp_path):
+        """Test the weather plugin refreshes hot cities in the background"""
+        plugin = WeatherPlugin(
+            {
+                "use_mock": False,
+                "api_key": "k",
+                "disk_cache": {"path": str(tmp_path / "w.sqlite3")},
+                "prefetch": {"lead_time": 3600, "interval": 3600},
+            }
+        )
+        weather = {"city": "Tokyo", "temperature": "20.0°C"}
+
+        with patch.object(plugin, "_get_real_weather", return_value=weather) as fetch:
+            for _ in range(3):
+                assert plugin.execute({"city": "Tokyo"}).success
+            assert fetch.call_count == 1
+
+            assert plugin.prefetcher.run_pending() == 1
+            plugin.close()
+
+        assert fetch.call_count == 2
+
+    def test_result_cache_hits_count_as_demand(self, tmp_path):
+        """Test calls answered by the manager's result cache make cities hot"""
+        manager = PluginManager()
+        plugin = WeatherPlugin(
+            {
+                "use_mock": False,
+                "api_key": "k",
+                "disk_cache": {"path": str(tmp_path / "w.sqlite3")},
+                "prefetch": {"lead_time": 3600, "interval": 3600},
+            }
+        )
+        manager.register_plugin(plugin)
+        weather = {"city": "Tokyo", "temperature": "20.0°C"}
+
+        with patch.object(plugin, "_get_real_weather", return_value=weather) as fetch:
+            for _ in range(3):
+                assert manager.execute_plugin("weather", {"city": "Tokyo"}).success
+            assert fetch.call_count == 1
+
+            assert plugin.prefetcher.run_pending() == 1
+            manager.close()
+
+        assert fetch.call_count == 2
+
+    def test_prefetch_off_by_default(self):
+        """Test prefetching must be enabled explicitly"""
+        assert WeatherPlugin().prefetcher is None
+        assert WeatherPlugin({"prefetch": True, "disk_cache": False}).prefetcher is None
+
+
+class TestSingleFlight:
+    """Test cases for coalescing identical concurrent plugin calls"""
+
+    def test_threaded_calls_coalesce(self):
+        """Test concurrent identical calls share one execution"""
+        manager = PluginManager()
+        plugin = SlowPlugin()
+        manager.register_plugin(plugin)
+        contexts = [{"city": "Tokyo"}] * 8 + [{"city": "Osaka"}] * 2
+        barrier = threading.Barrier(len(contexts))
+
+        def call(context):
+            barrier.wait()
+            return manager.execute_plugin("slow", context, timeout=5)
+
+        with ThreadPoolExecutor(max_workers=len(contexts)) as executor:
+            results = list(executor.map(call, contexts))
+
+        assert plugin.calls == 2
+        assert [r.data["city"] for r in results] == ["Tokyo"] * 8 + ["Osaka"] * 2
+        assert all(r.plugin_name == "slow" for r in results)
+        assert len({id(r) for r in results}) == len(results)
+        assert len(manager._in_flight) == 0
+
+    def test_async_calls_coalesce(self):
+        """Test concurrent identical calls on an event loop share one execution"""
+        manager = PluginManager()
+        plugin = SlowPlugin()
+        manager.register_plugin(plugin)
+
+        results = asyncio.run(manager.execute_many_async(["slow"] * 5, {"city": "a"}))
+
+        assert plugin.calls == 1
+        assert all(r.success for r in results)
+
+    def test_weather_spellings_coalesce(self):
+        """Test equivalent weather contexts are treated as identical calls"""
+        plugin = WeatherPlugin()
+        manager = PluginManager()
+
+        key = manager._call_key("weather", plugin, {"city": "Tokyo"})
+
+        assert manager._call_key("weather", plugin, {"city": " tokyo, JP"}) == key
+        assert manager._call_key("weather", plugin, {"city": "Osaka"}) != key
+
+    def test_exception_shared(self):
+        """Test waiters receive the exception of the shared call"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(flight.do, "k", fail)
+            started.wait(5)
+            with pytest.raises(ValueError, match="boom"):
+                flight.do("k", lambda: "not called")
+            with pytest.raises(ValueError):
+                leader.result()
+
+
+class TestSyntheticWeather:
+    """Test cases for the synthetic weather source"""
+
+    NOW = 1_750_000_000.0
+
+    def test_readings_are_deterministic(self):
+        """Test readings depend only on seed, city and hour"""
+        source = SyntheticWeather(seed=7)
+
+        reading = source.reading("Tokyo", self.NOW)
+
+        assert SyntheticWeather(seed=7).reading(" tokyo", self.NOW + 60) == reading
+        assert SyntheticWeather(seed=8).reading("Tokyo", self.NOW) != reading
+        assert source.reading("Osaka", self.NOW) != reading
+
+    def test_readings_vary_realistically(self):
+        """Test readings spread across cities within plausible bounds"""
+        source = SyntheticWeather()
+
+        readings = [source.reading(f"city-{i}", self.NOW) for i in range(2000)]
+        temperatures = [r["temperature"] for r in readings]
+
+        assert -40 < min(temperatures) and max(temperatures) < 50
+        assert max(temperatures) - min(temperatures) > 20
+        assert all(5 <= r["humidity"] <= 100 and r["wind"] >= 0 for r in readings)
+
+    def test_injected_errors_and_latency(self):
+        """Test errors are injected at the configured rate, latency is sampled"""
+        source = SyntheticWeather(seed=1, error_rate=0.25)
+        failures = 0
+        for _ in range(2000):
+            try:
+                source.fetch("Tokyo")
+            except SyntheticUpstreamError:
+                failures += 1
+
+        assert 400 < failures < 600
+
+        rng = random.Random(0)
+        lognormal = latency_sampler({"distribution": "lognormal", "median_ms": 40})
+        samples = sorted(lognormal(rng) for _ in range(2001))
+        assert samples[1000] == pytest.approx(0.040, rel=0.1)
+        assert latency_sampler({"distribution": "fixed", "ms": 5})(rng) == 0.005
+        with pytest.raises(ValueError):
+            latency_sampler({"distribution": "bimodal"})
+
+    def test_latency_over_timeout(self):
+        """Test a simulated call slower than the timeout times out"""
+        source = SyntheticWeather(
+            latency=latency_sampler({"distribution": "fixed", "ms": 1000})
+        )
+        with pytest.raises(TimeoutError):
+            source.fetch("Tokyo", timeout=0.01)
+
+    def test_weather_plugin_synthetic_mode(self):
+        """Test synthetic mode runs the real-mode pipeline with generated data"""
+        plugin = WeatherPlugin({"synthetic": {"seed": 3}, "units": "imperial"})
+
+        result = plugin.execute({"city": "tokyo, jp"})
+
+        assert plugin.validate_config() is True
+        assert plugin.disk_cache is None
+        assert result.success is True
+        assert result.data["city"] == "Tokyo"
+        assert result.data["temperature"].endswith("°F")
+        assert result.data["wind"].endswith("mph")
+
+    def test_weather_plugin_synthetic_errors(self):
+        """Test injected errors surface as failures and trip the circuit"""
+        plugin = WeatherPlugin(
+            {
+                "synthetic": {"error_rate": 1},
+                "circuit_breaker": {"failure_threshold": 2},
+            }
+        )
+
+        results = [plugin.execute({"city": "Tokyo"}) for _ in range(3)]
+
+        assert [r.success for r in results] == [False] * 3
+        assert "Injected synthetic upstream error" in results[0].error
+        assert "is open" in results[2].error
+
+
+class TestStandinServer:
+    """Test cases for the local API stand-in and the benchmark harness"""
+
+    def test_plugins_against_standin(self):
+        """Test both plugins' real modes work against the stand-in"""
+        with StandinServer() as server:
+            weather = WeatherPlugin(
+                {
+                    "use_mock": False,
+                    "api_key": "k",
+                    "base_url": server.weather_base_url,
+                    "disk_cache": False,
+                }
+            )
+            quote = QuotePlugin({"use_api": True, "base_url": server.quote_base_url})
+
+            single = weather.execute({"city": "Tokyo"})
+            batch = weather.execute_batch([{"city": "Kyoto"}, {"city": "Osaka"}])
+            quoted = quote.execute({})
+
+            assert server.requests == 3
+
+        assert single.success and single.data["temperature"].endswith("°C")
+        assert [r.success for r in batch] == [True, True]
+        assert quoted.data["source"] == "api"
+
+    def test_injected_failures(self):
+        """Test the stand-in answers HTTP 503 at the configured failure rate"""
+        with StandinServer(failure_rate=1.0) as server:
+            weather = WeatherPlugin(
+                {
+                    "use_mock": False,
+                    "api_key": "k",
+                    "base_url": server.weather_base_url,
+                    "disk_cache": False,
+                }
+            )
+
+            result = weather.execute({"city": "Tokyo"})
+
+        assert result.success is False
+        assert "503" in result.error
+
+    def test_run_benchmark(self):
+        """Test the benchmark reports throughput, upstream calls and latency"""
+        with StandinServer(latency_ms=1) as server:
+            report = run_benchmark(server, requests=40, concurrency=4, cities=40)
+
+        assert report["errors"] == 0
+        assert report["upstream_requests"] == 40
+        assert report["requests_per_second"] > 0
+        assert report["latency_ms"]["p50"] > 0
+
+
+class TestQuoteBuffer:
+    """Test cases for the prefetching quote buffer"""
+
+    @staticmethod
+    def quotes(count, start=0):
+        numbers = range(start, start + count)
+        return [{"content": f"Q{i}", "author": "A"} for i in numbers]
+
+    def test_serves_from_memory_and_refills_at_low_water(self):
+        """Test quotes come from one bulk fetch until the low-water mark"""
+        fetched = []
+
+        def fetch(count, timeout):
+            fetched.append(count)
+            return self.quotes(count, start=sum(fetched) - count)
+
+        buffer = QuoteBuffer(fetch, capacity=5, low_water=2)
+
+        texts = [buffer.get()["content"] for _ in range(3)]
+        assert texts == ["Q0", "Q1", "Q2"]
+        assert fetched == [5]
+
+        buffer.get()  # Drops below low_water
+        buffer.close()
+
+        assert fetched == [5, 4]
+        assert len(buffer) == 5
+        assert buffer.get()["content"] == "Q4"
+
+    def test_empty_buffer_fetches_synchronously(self):
+        """Test an empty buffer fetches and returns None if that yields nothing"""
+        timeouts = []
+
+        def fetch(count, timeout):
+            timeouts.append(timeout)
+            return []
+
+        buffer = QuoteBuffer(fetch, capacity=3, low_water=1)
+
+        assert buffer.get(2.5) is None
+        assert timeouts == [2.5]
+
+    def test_get_does_not_wait_past_timeout_for_fill(self):
+        """Test a caller gives up on a stuck fill when its budget runs out"""
+        release = threading.Event()
+
+        def fetch(count, timeout):
+            release.wait(5)
+            return self.quotes(count)
+
+        buffer = QuoteBuffer(fetch, capacity=3, low_water=1)
+        stuck = threading.Thread(target=buffer.fill)
+        stuck.start()
+        try:
+            started = time.monotonic()
+            assert buffer.get(0.1) is None
+            assert time.monotonic() - started < 1
+        finally:
+            release.set()
+            stuck.join()
+        assert buffer.get(0.1)["content"] == "Q0"
+
+    def test_background_refill_failure_is_contained(self):
+        """Test a failed background refill leaves the buffered quotes"""
+        calls = []
+
+        def fetch(count, timeout):
+            calls.append(count)
+            if len(calls) > 1:
+                raise ConnectionError("API down")
+            return self.quotes(count)
+
+        buffer = QuoteBuffer(fetch, capacity=3, low_water=2)
+        buffer.get()
+        buffer.get()
+        buffer.close()
+
+        assert len(calls) == 2
+        assert buffer.get()["content"] == "Q2"
+
+    def test_invalid_sizes(self):
+        """Test capacity and low_water are validated"""
+        with pytest.raises(ValueError):
+            QuoteBuffer(list, capacity=0)
+        with pytest.raises(ValueError):
+            QuoteBuffer(list, capacity=5, low_water=5)
+
+    @patch("requests.get")
+    def test_quote_plugin_uses_bulk_endpoint(self, mock_get):
+        """Test API mode fetches in bulk and serves later calls from memory"""
+        mock_get.return_value.json.return_value = self.quotes(20)
+        plugin = QuotePlugin({"use_api": True, "buffer": {"capacity": 20}})
+
+        results = [plugin.execute({}) for _ in range(5)]
+        plugin.close()
+
+        assert [r.data["text"] for r in results] == ["Q0", "Q1", "Q2", "Q3", "Q4"]
+        assert all(r.data["source"] == "api" for r in results)
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.args[0] == "https://api.quotable.io/quotes/random"
+        assert mock_get.call_args.kwargs["params"] == {
+            "limit": 20,
+            "tags": "inspirational",
+        }
+
+    @patch("requests.get")
+    def test_quote_plugin_without_buffer(self, mock_get):
+        """Test "buffer: false" requests one quote per call"""
+        mock_get.return_value.json.return_value = {"content": "Q", "author": "A"}
+        plugin = QuotePlugin({"use_api": True, "buffer": False})
+
+        result = plugin.execute({})
+
+        assert plugin.buffer is None
+        assert result.data["source"] == "api"
+        assert mock_get.call_args.args[0] == "https://api.quotable.io/random"
+
+
+class TestQuoteCorpus:
+    """Test cases for the memory-mapped quote corpus"""
+
+    @pytest.fixture
+    def corpus_path(self, tmp_path):
+        path = tmp_path / "quotes.jsonl"
+        write_corpus(
+            path,
+            ({"text": f"Quote {i}", "author": f"Author {i}"} for i in range(100)),
+        )
+        return path
+
+    def test_lookup_by_id(self, corpus_path):
+        """Test quotes are read by ID through the offset index"""
+        corpus = QuoteCorpus(corpus_path)
+
+        assert len(corpus) == 100
+        assert corpus[0] == {"text": "Quote 0", "author": "Author 0", "id": 0}
+        assert corpus[57]["text"] == "Quote 57"
+        assert corpus[-1]["id"] == 99
+        with pytest.raises(IndexError):
+            corpus[100]
+        assert corpus.random(random.Random(1))["text"].startswith("Quote ")
+        corpus.close()
+
+    def test_index_is_built_once_and_shared(self, corpus_path):
+        """Test a second corpus instance reuses the persisted index"""
+        first = QuoteCorpus(corpus_path)
+        len(first)
+        index_mtime = first.index_path.stat().st_mtime_ns
+
+        with patch.object(QuoteCorpus, "build_index") as build:
+            second = QuoteCorpus(corpus_path)
+            assert second[42]["text"] == "Quote 42"
+
+        build.assert_not_called()
+        assert second.index_path == first.index_path
+        assert first.index_path.stat().st_mtime_ns == index_mtime
+
+    def test_index_rebuilt_when_corpus_changes(self, corpus_path, tmp_path):
+        """Test a changed corpus gets a fresh index"""
+        index_path = tmp_path / "quotes.idx"
+        assert len(QuoteCorpus(corpus_path, index_path)) == 100
+
+        with open(corpus_path, "a", encoding="utf-8") as f:
+            f.write('\n{"text": "日本語の名言", "author": "著者"}\n')
+
+        corpus = QuoteCorpus(corpus_path, index_path)
+        assert len(corpus) == 101
+        assert corpus[100]["text"] == "日本語の名言"
+
+    def test_quote_plugin_reads_corpus(self, corpus_path):
+        """Test the quote plugin draws local quotes from a configured corpus"""
+        plugin = QuotePlugin({"corpus": str(corpus_path)})
+
+        result = plugin.execute({})
+        batch = plugin.execute_batch([{}] * 3)
+        plugin.close()
+
+        assert result.data["source"] == "corpus"
+        assert result.data["text"].startswith("Quote ")
+        assert [r.data["source"] for r in batch] == ["corpus"] * 3
+
+
+class TestQuoteIndex:
+    """Test cases for the tag and language quote index"""
+
+    QUOTES = [
+        {"text": "a", "author": "A", "tags": ["wisdom", "life"]},
+        {"text": "b", "author": "B", "tags": ["Wisdom"], "language": "ja"},
+        {"text": "c", "author": "C", "tags": ["success", "life"]},
+        {"text": "d", "author": "D", "tags": ["wisdom", "life", "success"]},
+        {"text": "e", "author": "E"},
+    ]
+
+    def test_pair_and_intersection_lookups(self):
+        """Test lookups by tag, language, pair and several tags"""
+        index = QuoteIndex.build(enumerate(self.QUOTES))
+
+        assert list(index.ids(["wisdom"])) == [0, 1, 3]
+        assert list(index.ids(["wisdom"], "en")) == [0, 3]
+        assert list(index.ids(language="JA")) == [1]
+        assert list(index.ids(["life", "wisdom"])) == [0, 3]
+        assert list(index.ids(["life", "success", "wisdom"], "en")) == [3]
+        assert list(index.ids(["wisdom", "unknown"])) == []
+        assert index.ids() == range(5)
+
+    def test_saved_index_matches_stamp(self, tmp_path):
+        """Test a saved index loads only for the corpus it was built from"""
+        path = tmp_path / "quotes.tags"
+        QuoteIndex.build(enumerate(self.QUOTES)).save(path, (10, 20))
+
+        assert QuoteIndex.load(path, (10, 21)) is None
+        index = QuoteIndex.load(path, (10, 20))
+        assert list(index.ids(["life"], "en")) == [0, 2, 3]
+        assert list(index.ids(["life", "success"])) == [2, 3]
+        # Lists are copied out of the map once, not per lookup
+        assert index.ids(language="en") is index.ids(language="en")
+        index.close()
+
+    def test_corpus_tag_index(self, tmp_path):
+        """Test a corpus persists its tag index next to its offset index"""
+        path = tmp_path / "quotes.jsonl"
+        write_corpus(path, self.QUOTES)
+        corpus = QuoteCorpus(path, tmp_path / "quotes.idx")
+
+        assert list(corpus.tag_index().ids(["wisdom"], "en")) == [0, 3]
+        assert (tmp_path / "quotes.tags").exists()
+        corpus.close()
+
+        with patch.object(QuoteIndex, "build") as build:
+            reopened = QuoteCorpus(path, tmp_path / "quotes.idx")
+            assert list(reopened.tag_index().ids(["success"])) == [2, 3]
+        build.assert_not_called()
+
+    def test_quote_plugin_honors_category_and_language(self):
+        """Test local quotes come from the configured category and language"""
+        plugin = QuotePlugin({"category": "success", "language": "en"})
+        japanese = QuotePlugin({"category": "wisdom", "language": "ja"})
+
+        authors = {plugin.execute({}).data["author"] for _ in range(20)}
+        texts = {r.data["text"] for r in japanese.execute_batch([{}] * 20)}
+
+        assert authors <= {"Walt Disney", "Winston Churchill"}
+        assert texts == {
+            q["text"] for q in QuotePlugin.BUILTIN_QUOTES if q["language"] == "ja"
+        }
+
+    def test_quote_plugin_context_tags(self):
+        """Test the tags and language context parameters"""
+        plugin = QuotePlugin()
+
+        result = plugin.execute({"tags": "motivational, success"})
+        japanese = plugin.execute({"tags": ["inspirational"], "language": "ja"})
+        missing = plugin.execute({"tags": ["wisdom", "success"]})
+
+        assert result.data["author"] in ("Walt Disney", "Winston Churchill")
+        assert japanese.data["author"] == "Code Philosophy"
+        assert missing.success is False
+
+    def test_quote_plugin_unknown_category_falls_back(self):
+        """Test an unmatched category still yields quotes in the language"""
+        plugin = QuotePlugin({"category": "unknown", "language": "ja"})
+
+        assert plugin.execute({}).data["author"] in (
+            "Programming Wisdom",
+            "Code Philosophy",
+        )
+
+
+class TestNoRepeatSampling:
+    """Test cases for no-repeat quote sampling"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 10, 257, 1000])
+    def test_permutation_is_bijection(self, size):
+        """Test a permutation visits every element exactly once"""
+        permutation = Permutation(size, "seed")
+
+        assert sorted(permutation[i] for i in range(size)) == list(range(size))
+
+    def test_permutation_depends_on_seed(self):
+        """Test different seeds give different orders"""
+        first = [Permutation(100, "a")[i] for i in range(100)]
+        second = [Permutation(100, "b")[i] for i in range(100)]
+
+        assert first != second
+        assert first == [Permutation(100, "a")[i] for i in range(100)]
+        with pytest.raises(IndexError):
+            Permutation(100, "a")[100]
+
+    def test_sampler_streams(self):
+        """Test each stream covers the population before repeating"""
+        sampler = NoRepeatSampler(seed=1)
+
+        first = [sampler.next("alice", 50) for _ in range(50)]
+        second = [sampler.next("alice", 50) for _ in range(50)]
+        other = [sampler.next("bob", 50) for _ in range(50)]
+
+        assert sorted(first) == sorted(second) == sorted(other) == list(range(50))
+        assert first != second
+        assert first != other
+
+    def test_sampler_restarts_when_population_changes(self):
+        """Test a resized population starts a new pass"""
+        sampler = NoRepeatSampler()
+        sampler.next("s", 10)
+
+        assert sorted(sampler.next("s", 5) for _ in range(5)) == list(range(5))
+
+    def test_cursors_persist(self, tmp_path):
+        """Test a stream continues across sampler instances"""
+        path = tmp_path / "cursors.sqlite3"
+        first = NoRepeatSampler(store=CursorStore(path))
+        seen = [first.next("alice", 20) for _ in range(12)]
+        first.close()
+
+        second = NoRepeatSampler(store=CursorStore(path))
+        seen += [second.next("alice", 20) for _ in range(8)]
+
+        assert sorted(seen) == list(range(20))
+        assert second.store.get("alice") == (0, 20, 20)
+
+    def test_quote_plugin_no_repeat(self, tmp_path):
+        """Test the quote plugin cycles through matching quotes per session"""
+        plugin = QuotePlugin({"no_repeat": {"path": str(tmp_path / "cursors.sqlite3")}})
+        expected = sorted(
+            q["text"]
+            for q in QuotePlugin.BUILTIN_QUOTES
+            if "inspirational" in q["tags"] and q["language"] == "en"
+        )
+
+        texts = [plugin.execute({"session": "u1"}).data["text"] for _ in range(4)]
+        batch = plugin.execute_batch([{"session": "u2"}] * 4)
+        wisdom = {
+            plugin.execute({"session": "u1", "tags": "wisdom"}).data["text"]
+            for _ in range(2)
+        }
+        plugin.close()
+
+        assert sorted(texts) == expected
+        assert sorted(r.data["text"] for r in batch) == expected
+        assert len(wisdom) == 2
+
+
+class TestQuoteSearch:
+    """Test cases for full-text quote search"""
+
+    QUOTES = [
+        {"text": "Make it work, make it right, make it fast.", "author": "Kent Beck"},
+        {"text": "Simplicity is prerequisite for reliability.", "author": "Dijkstra"},
+        {"text": "Fast is fine, but accuracy is everything.", "author": "Wyatt Earp"},
+        {"text": "速さより正確さが大切だ。", "author": "作者不詳"},
+    ]
+
+    def test_terms(self):
+        """Test words are split and CJK text is indexed by characters and pairs"""
+        assert index_terms("Make it FAST, make it.") == [
+            "make",
+            "it",
+            "fast",
+            "make",
+            "it",
+        ]
+        assert index_terms("正確さ") == ["正", "確", "さ", "正確", "確さ"]
+        assert query_terms("正確さ fast Fast") == ["正確", "確さ", "fast"]
+        assert query_terms("ＦＡＳＴ 速") == ["fast", "速"]
+
+    def test_ranked_search(self):
+        """Test matches need all terms and are ranked by relevance"""
+        index = SearchIndex()
+        index.sync(self.QUOTES)
+
+        # Same term frequency: the shorter quote ranks first
+        assert [i for i, _ in index.search("fast")] == [2, 0]
+        assert [i for i, _ in index.search("fast accuracy")] == [2]
+        assert [i for i, _ in index.search("beck")] == [0]
+        assert [i for i, _ in index.search("正確")] == [3]
+        assert [i for i, _ in index.search("速")] == [3]
+        assert [i for i, _ in index.search("fast", limit=1)] == [2]
+        assert index.search("slow") == []
+        assert index.search("...") == []
+
+    def test_incremental_persistent_index(self, tmp_path):
+        """Test a saved index only indexes appended quotes"""
+        path = tmp_path / "search.sqlite3"
+        index = SearchIndex(path)
+        assert index.sync(self.QUOTES[:2]) == 2
+        index.close()
+
+        index = SearchIndex(path)
+        assert index.sync(self.QUOTES[:2]) == 0
+        assert index.sync(self.QUOTES) == 2
+        assert [i for i, _ in index.search("fast")] == [2, 0]
+
+        changed = [dict(self.QUOTES[0], text="Slow and steady")] + self.QUOTES[1:2]
+        assert index.sync(changed) == 2
+        assert [i for i, _ in index.search("slow")] == [0]
+        assert index.search("fast") == []
+        index.close()
+
+    def test_corpus_index_follows_edits(self, tmp_path):
+        """Test the corpus search index is rebuilt when a quote changes in place"""
+        path = tmp_path / "quotes.jsonl"
+        write_corpus(path, self.QUOTES[:3])
+        corpus = QuoteCorpus(path)
+        assert [i for i, _ in corpus.search_index().search("fast")] == [2, 0]
+        corpus.close()
+
+        # Same size and last quote: only the stamp tells the edit apart
+        mtime_ns = path.stat().st_mtime_ns
+        edited = dict(self.QUOTES[0], text="Make it work, make it right, make it slow.")
+        write_corpus(path, [edited] + self.QUOTES[1:3])
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        corpus = QuoteCorpus(path)
+        assert [i for i, _ in corpus.search_index().search("fast")] == [2]
+        assert [i for i, _ in corpus.search_index().search("slow")] == [0]
+
+        with patch.object(SearchIndex, "_add_segment") as add_segment:
+            corpus.search_index()
+        add_segment.assert_not_called()
+        corpus.close()
+
+    def test_quote_plugin_search(self, tmp_path):
+        """Test the search context parameter on built-in and corpus quotes"""
+        plugin = QuotePlugin()
+        result = plugin.execute({"search": "思考"})
+        churchill = plugin.execute({"search": "courage churchill", "limit": 1})
+
+        assert [q["author"] for q in result.data["quotes"]] == ["Programming Wisdom"]
+        assert churchill.data["quotes"][0]["author"] == "Winston Churchill"
+        assert plugin.execute({"search": "nothing here"}).data["quotes"] == []
+
+        path = tmp_path / "quotes.jsonl"
+        write_corpus(path, self.QUOTES)
+        corpus_plugin = QuotePlugin({"corpus": str(path)})
+        found = corpus_plugin.execute({"search": "make"})
+        corpus_plugin.close()
+
+        assert found.data["source"] == "corpus"
+        assert found.data["quotes"][0]["text"].startswith("Make it work")
+
+
+class TestHotReload:
+    """Test cases for reconfiguring plugins from reloaded settings"""
+
+    @staticmethod
+    def _settings(**configs):
+        return Settings(
+            plugins=[PluginConfig(name=name, config=c) for name, c in configs.items()]
+        )
+
+    def test_from_settings_configures_plugins(self):
+        """Test plugin configs from Settings reach lazily loaded plugins"""
+        settings = self._settings(quote={"category": "wisdom"})
+
+        with PluginManager.from_settings(settings) as manager:
+            assert manager.plugins["quote"].category == "wisdom"
+            assert manager.plugins["weather"].default_city == "Tokyo"
+
+    def test_apply_settings_swaps_changed_plugins(self):
+        """Test only plugins whose config changed get a new instance"""
+        settings = self._settings(weather={"default_city": "Osaka"}, quote={})
+        with PluginManager.from_settings(settings) as manager:
+            weather, quote = manager.plugins["weather"], manager.plugins["quote"]
+
+            with patch.object(quote, "close") as close:
+                changed = manager.apply_settings(
+                    self._settings(
+                        weather={"default_city": "Osaka"},
+                        quote={"category": "wisdom"},
+                    )
+                )
+
+            assert changed == ["quote"]
+            assert manager.plugins["weather"] is weather
+            assert manager.plugins["quote"] is not quote
+            assert manager.plugins["quote"].category == "wisdom"
+            assert manager.plugins["quote"].http_client is manager.http
+            close.assert_called_once()
+
+    def test_apply_settings_updates_timeouts(self):
+        """Test a new api_timeout reaches the manager budget and HTTP timeout"""
+        with PluginManager.from_settings(Settings(api_timeout=3)) as manager:
+            quote = manager.plugins["quote"]
+
+            manager.apply_settings(Settings(api_timeout=7))
+
+            assert manager.default_timeout == 7
+            assert quote.request_timeout({}) == 7
+            assert manager.plugins["quote"] is quote
+
+        settings = Settings(api_timeout=3)
+        with PluginManager.from_settings(settings, default_timeout=1) as manager:
+            manager.apply_settings(Settings(api_timeout=7))
+
+            assert manager.default_timeout == 1
+            assert manager.http.config.timeout == 7
+
+    def test_invalid_config_keeps_plugin(self):
+        """Test a plugin rejecting its new config keeps running the old one"""
+        with PluginManager() as manager:
+            weather = manager.plugins["weather"]
+
+            changed = manager.apply_settings(
+                self._settings(weather={"use_mock": False})
+            )
+
+            assert changed == []
+            assert manager.plugins["weather"] is weather
+
+    def test_in_flight_call_finishes_on_old_instance(self):
+        """Test a swap waits for running calls before closing the old plugin"""
+        manager = PluginManager()
+        old = ReconfigurablePlugin({"label": "old", "block": True})
+        manager.register_plugin(old)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            running = executor.submit(manager.execute_plugin, "reconfigurable", {})
+            assert old.started.wait(5)
+
+            manager.apply_settings(self._settings(reconfigurable={"label": "new"}))
+
+            assert manager.execute_plugin("reconfigurable", {}).data == "new"
+            assert not old.closed
+            old.release.set()
+            assert running.result(5).data == "old"
+
+        assert old.closed
+        assert manager._active == {}
+        assert manager._retired == {}
+
+
+class TestStats:
+    """Test cases for plugin execution statistics"""
+
+    def test_histogram_percentiles(self):
+        """Test histogram percentiles are close to the real values"""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.05)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.05)
+        assert histogram.percentile(100) == histogram.max == 1.0
+        assert LatencyHistogram().percentile(50) == 0.0
+
+    def test_manager_records_calls(self):
+        """Test the manager records counts and latencies per plugin"""
+        manager = PluginManager(collect_stats=True)
+        manager.register_plugin(MockPlugin(should_fail=True))
+
+        manager.execute_plugin("quote", {})
+        manager.execute_plugin("mock", {})
+        manager.execute_many(["quote", "mock"], {})
+        asyncio.run(manager.execute_plugin_async("quote", {}))
+        manager.execute_plugin_batch("quote", [{}, {}])
+
+        stats = manager.get_stats()
+        assert stats["quote"]["calls"] == 5
+        assert stats["quote"]["successes"] == 5
+        assert stats["mock"]["calls"] == 2
+        assert stats["mock"]["errors"] == 2
+        latency = stats["quote"]["latency_ms"]
+        assert 0 <= latency["p50"] <= latency["p99"] <= latency["max"]
+
+    def test_cached_batches_recorded(self):
+        """Test batches answered entirely from the result cache are counted"""
+        manager = PluginManager(collect_stats=True)
+        plugin = CountingPlugin()
+        manager.register_plugin(plugin)
+        contexts = [{"city": "Tokyo"}, {"city": "Osaka"}]
+
+        manager.execute_plugin_batch("counting", contexts)
+        manager.execute_plugin_batch("counting", contexts)
+
+        assert plugin.calls == 2
+        assert manager.get_stats()["counting"]["calls"] == 4
+
+    def test_stats_disabled_by_default(self):
+        """Test statistics are not collected unless enabled"""
+        manager = PluginManager()
+        manager.execute_plugin("quote", {})
+
+        assert manager.stats is None
+        assert manager.get_stats() == {}
+
+    def test_format_stats(self):
+        """Test statistics formatting"""
+        manager = PluginManager(collect_stats=True)
+        manager.execute_plugin("quote", {})
+        stats = manager.get_stats()
+
+        assert "quote" in format_stats(stats)
+        assert '"calls": 1' in format_stats(stats, "json")
+        assert "no plugin calls" in format_stats({})
+
+
+class TestHTTPClient:
+    """Test cases for the shared pooled HTTP client"""
+
+    def test_session_is_pooled_and_reused(self):
+        """Test the client builds one pooled session with retries"""
+        client = HTTPClient(HTTPConfig(pool_size=4, max_retries=3, keep_alive=False))
+
+        session = client.session
+        adapter = session.get_adapter("https://example.com")
+
+        assert client.session is session
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.read == 0
+        assert session.headers["Connection"] == "close"
+
+        client.close()
+        assert client.session is not session
+
+    def test_read_timeout_not_retried(self, hanging_server):
+        """Test a request that timed out is not sent again"""
+        import requests
+
+        client = HTTPClient(HTTPConfig(max_retries=2))
+        started = time.monotonic()
+
+        with pytest.raises(requests.exceptions.RequestException):
+            client.get(hanging_server, timeout=0.3)
+
+        assert time.monotonic() - started < 0.6
+        client.close()
+
+    def test_manager_shares_client_with_plugins(self):
+        """Test managed plugins use the manager's client and timeout"""
+        manager = PluginManager(http_config=HTTPConfig(timeout=4))
+        quote = manager.get_plugin("quote")
+        manager.register_plugin(MockPlugin())
+
+        assert quote.http_client is manager.http
+        assert manager.get_plugin("mock").http_client is manager.http
+        assert quote.request_timeout({}) == 4
+        assert QuotePlugin().request_timeout({}) == 10
+        assert QuotePlugin({"timeout": 2}).request_timeout({}) == 2
+
+    @patch("requests.Session.get")
+    def test_plugins_send_requests_through_session(self, mock_get):
+        """Test API requests go through the pooled session"""
+        quotes = [{"content": "Q", "author": "A"}] * 50
+        mock_get.return_value.json.return_value = quotes
+        manager = PluginManager()
+        manager.register_plugin(QuotePlugin({"use_api": True}))
+
+        result = manager.execute_plugin("quote", {})
+
+        assert result.data["source"] == "api"
+        assert mock_get.call_args.args[0] == "https://api.quotable.io/quotes/random"
+        assert mock_get.call_args.kwargs["timeout"] == 10
+
+    def test_from_settings(self):
+        """Test the manager takes HTTP and timeout settings from Settings"""
+        settings = Settings(api_timeout=3, http_pool_size=2, http_keep_alive=False)
+
+        with PluginManager.from_settings(settings) as manager:
+            assert manager.default_timeout == 3
+            assert manager.http.config.timeout == 3
+            assert manager.http.config.pool_size == 2
+            assert manager.http.config.keep_alive is False
+            manager.http.session
+
+        assert manager.http._session is None
+
+
+class TestExternalPlugins:
+    """Test cases for external plugin discovery"""
+
+    def write_plugin(self, plugin_dir, description="Greets people"):
+        plugin_file = plugin_dir / "greeter.py"
+        plugin_file.write_text(EXTERNAL_PLUGIN_SOURCE.format(description=description))
+        return plugin_file
+
+    def import_count(self, plugin_dir):
+        marker = plugin_dir / "greeter.imports"
+        return len(marker.read_text()) if marker.exists() else 0
+
+    def test_cold_scan_writes_manifest(self, tmp_path):
+        """Test first load imports plugin files and records them"""
+        self.write_plugin(tmp_path)
+        manager = PluginManager(str(tmp_path))
+        manager.load_external_plugins()
+
+        assert self.import_count(tmp_path) == 1
+        assert (tmp_path / ".plugin_manifest.json").exists()
+        assert "greeter: Greets people" in manager.get_plugin_help()
+
+        result = manager.execute_plugin("greeter", {"name": "Bob"})
+        assert result.success is True
+        assert result.data == "hi Bob"
+
+    def test_warm_start_skips_import(self, tmp_path):
+        """Test unchanged files are registered from the manifest"""
+        plugin_file = self.write_plugin(tmp_path)
+        PluginManager(str(tmp_path)).load_external_plugins()
+
+        # Touching a file without changing it must not trigger a rescan
+        os.utime(plugin_file, ns=(0, 0))
+        manager = PluginManager(str(tmp_path))
+        manager.load_external_plugins()
+
+        assert self.import_count(tmp_path) == 1
+        assert "greeter" in manager.list_plugins()
+        assert manager.plugins.is_loaded("greeter") is False
+        assert manager.execute_plugin("greeter", {"name": "Ann"}).data == "hi Ann"
+
+    def test_changed_file_is_rescanned(self, tmp_path):
+        """Test modified and removed files update the manifest"""
+        plugin_file = self.write_plugin(tmp_path)
+        PluginManager(str(tmp_path)).load_external_plugins()
+
+        self.write_plugin(tmp_path, description="Greets people politely")
+        manager = PluginManager(str(tmp_path))
+        manager.load_external_plugins()
+
+        assert self.import_count(tmp_path) == 2
+        assert "Greets people politely" in manager.get_plugin_help()
+
+        plugin_file.unlink()
+        manager = PluginManager(str(tmp_path))
+        manager.load_external_plugins()
+        assert "greeter" not in manager.list_plugins()
+        assert '"files": {}' in (tmp_path / ".plugin_manifest.json").read_text()
+
+    def test_broken_plugin_file(self, tmp_path):
+        """Test a file that fails to import is skipped"""
+        (tmp_path / "broken.py").write_text("raise RuntimeError('boom')\n")
+        manager = PluginManager(str(tmp_path))
+        manager.load_external_plugins()
+
+        assert manager.list_plugins() == ["weather", "quote"]
+
+
 class TestWeatherPlugin:
     """Test cases for WeatherPlugin"""
 
@@ -220,6 +2308,40 @@ class TestWeatherPlugin:
         assert "description" in result.data
         assert result.data["note"] == "This is mock data for demonstration purposes"
 
+    def test_non_string_city(self):
+        """Test city values that are not strings produce results, not errors"""
+        manager = PluginManager()
+        contexts = [{"city": 1850147}, {"city": None}]
+
+        results = [manager.execute_plugin("weather", c) for c in contexts]
+        results += manager.execute_many(["weather", "weather"], contexts[0])
+        results += manager.execute_plugin_batch("weather", contexts)
+        results.append(
+            asyncio.run(manager.execute_plugin_async("weather", contexts[1]))
+        )
+
+        assert all(r.success for r in results)
+        assert results[0].data["city"] == 1850147
+
+    def test_failing_normalize_context(self):
+        """Test a plugin failing to normalize a context still gets a result"""
+
+        class BrokenKeyPlugin(CountingPlugin):
+            name = "broken_key"
+            single_flight = True
+
+            def normalize_context(self, context):
+                raise ValueError("bad context")
+
+        manager = PluginManager()
+        manager.register_plugin(BrokenKeyPlugin())
+
+        result = manager.execute_plugin("broken_key", {"city": "Tokyo"})
+        batch = manager.execute_plugin_batch("broken_key", [{"city": "Tokyo"}])
+
+        assert result.success is True
+        assert batch[0].success is True
+
     def test_weather_plugin_without_api_key(self):
         """Test weather plugin without API key"""
         plugin = WeatherPlugin({"use_mock": False})
@@ -281,10 +2403,9 @@ class TestQuotePlugin:
     def test_quote_plugin_api_execution(self, mock_get):
         """Test quote plugin with API"""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "content": "Test quote",
-            "author": "Test Author",
-        }
+        mock_response.json.return_value = [
+            {"content": "Test quote", "author": "Test Author"}
+        ] * 50
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 